@@ -3,6 +3,8 @@
 import reflex as rx
 
 from rxconfig import config
+from .api import api
+from .middleware import MetricsMiddleware
 from .pages.login import login_page
 from .pages.dashboard import dashboard_page
 from .pages.profile import profile_page
@@ -10,6 +12,9 @@ from .pages.change_password import change_password_page
 from .pages.members_management import members_management_page
 from .pages.games_management import games_management_page
 from .pages.game_buyins import game_buyins_page
+from .pages.leaderboard import leaderboard_page
+from .pages.exports import exports_page
+from .utils.password import calibrate_rounds_async
 
 
 class State(rx.State):
@@ -48,8 +53,11 @@ app = rx.App(
         has_background=True,
         #radius="large",
         #scaling="100%",
-    )
+    ),
+    api_transformer=api,
 )
+app.add_middleware(MetricsMiddleware())
+app.register_lifespan_task(calibrate_rounds_async)
 
 # Add pages
 app.add_page(login_page)
@@ -59,3 +67,5 @@ app.add_page(change_password_page)
 app.add_page(members_management_page)
 app.add_page(games_management_page)
 app.add_page(game_buyins_page)
+app.add_page(leaderboard_page)
+app.add_page(exports_page)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Backend HTTP endpoints (report downloads, CSV exports and metrics) mounted on the Reflex backend.
+
+Links are signed by the page for the logged-in user, see utils.signed_url.
+"""
+
+from datetime import date
+from typing import Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from .services.exports import EXPORTS, stream_csv
+from .services.reports import game_report_file
+from .utils.metrics import render_metrics
+from .utils.signed_url import verify_path
+
+# Metrics are only served to scrapers on the same host
+LOCAL_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+def game_report_path(game_id: int) -> str:
+    """Return the backend path of a game's PDF report."""
+    return f"/reports/games/{game_id}.pdf"
+
+
+def export_path(name: str) -> str:
+    """Return the backend path of a CSV export (filtered with start/end query parameters)."""
+    return f"/exports/{name}.csv"
+
+
+def _is_signed(request: Request) -> bool:
+    """Check the request's signed-link parameters."""
+    params = request.query_params
+    return verify_path(request.url.path, params.get("expires"), params.get("signature"))
+
+
+async def game_report(request: Request) -> Response:
+    """Send the end-of-game PDF report from the report cache."""
+    if not _is_signed(request):
+        return PlainTextResponse("Link inválido ou expirado", status_code=403)
+    
+    game_id = request.path_params["game_id"]
+    path = await game_report_file(game_id)
+    if path is None:
+        return PlainTextResponse("Jogo não encontrado", status_code=404)
+    # FileResponse uses the server's zero-copy path send when it offers one
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"jogo-{game_id}.pdf",
+        content_disposition_type="inline",
+    )
+
+
+def _query_date(request: Request, name: str) -> Optional[date]:
+    """Return an optional ISO date query parameter; raise ValueError if malformed."""
+    value = request.query_params.get(name)
+    return date.fromisoformat(value) if value else None
+
+
+async def export_csv(request: Request) -> Response:
+    """Stream a table export as CSV straight from the database cursor."""
+    if not _is_signed(request):
+        return PlainTextResponse("Link inválido ou expirado", status_code=403)
+    
+    name = request.path_params["name"]
+    if name not in EXPORTS:
+        return PlainTextResponse("Exportação não encontrada", status_code=404)
+    try:
+        start = _query_date(request, "start")
+        end = _query_date(request, "end")
+    except ValueError:
+        return PlainTextResponse("Período inválido", status_code=400)
+    
+    # No Content-Length: the body goes out chunked as rows are fetched
+    return StreamingResponse(
+        stream_csv(name, start, end),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{name}.csv"'},
+    )
+
+
+async def metrics(request: Request) -> Response:
+    """Expose the event handler histograms in the Prometheus text format (local requests only)."""
+    if request.client is None or request.client.host not in LOCAL_HOSTS:
+        return PlainTextResponse("Acesso negado", status_code=403)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+api = Starlette(routes=[
+    Route("/reports/games/{game_id:int}.pdf", game_report),
+    Route("/exports/{name}.csv", export_csv),
+    Route("/metrics", metrics),
+])
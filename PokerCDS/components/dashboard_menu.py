@@ -109,6 +109,32 @@ def DashboardMenu() -> rx.Component:
                         id="dashboard-menu-games-card",
                     ),
                     
+                    # Export Data Card
+                    rx.card(
+                        rx.vstack(
+                            rx.icon("download", size=32, id="dashboard-menu-exports-icon"),
+                            rx.text(
+                                "Exportar Dados", 
+                                font_weight="bold", 
+                                size="4",
+                                id="dashboard-menu-exports-title",
+                            ),
+                            rx.text(
+                                "Planilhas CSV de membros, jogos e cacifes", 
+                                size="2", 
+                                text_align="center",
+                                id="dashboard-menu-exports-description",
+                            ),
+                            spacing="3",
+                            align="center",
+                            id="dashboard-menu-exports-content",
+                        ),
+                        on_click=lambda: rx.redirect("/exports"),
+                        style={"cursor": "pointer", "_hover": {"transform": "scale(1.02)"}},
+                        padding="2rem",
+                        id="dashboard-menu-exports-card",
+                    ),
+                    
                     columns="2",
                     spacing="4",
                     width="100%",
@@ -183,6 +209,32 @@ def DashboardMenu() -> rx.Component:
                 id="dashboard-menu-password-card",
             ),
             
+            # Leaderboard Card
+            rx.card(
+                rx.vstack(
+                    rx.icon("trophy", size=32, id="dashboard-menu-leaderboard-icon"),
+                    rx.text(
+                        "Ranking", 
+                        font_weight="bold", 
+                        size="4",
+                        id="dashboard-menu-leaderboard-title",
+                    ),
+                    rx.text(
+                        "Classificação por resultado no período", 
+                        size="2", 
+                        text_align="center",
+                        id="dashboard-menu-leaderboard-description",
+                    ),
+                    spacing="3",
+                    align="center",
+                    id="dashboard-menu-leaderboard-content",
+                ),
+                on_click=lambda: rx.redirect("/leaderboard"),
+                style={"cursor": "pointer", "_hover": {"transform": "scale(1.02)"}},
+                padding="2rem",
+                id="dashboard-menu-leaderboard-card",
+            ),
+            
             columns="2",
             spacing="4",
             width="100%",
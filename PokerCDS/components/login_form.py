@@ -5,11 +5,16 @@
 Login form component for user authentication.
 """
 
+import math
 import reflex as rx
-import asyncio
 from typing import Optional
 from ..state.auth_state import AuthState
 from ..models.user_data import UserData
+from ..repositories.member_directory import MemberDirectory
+from ..repositories.member_repository import MemberRepository
+from ..services.login_limiter import acquire_attempt, reset_cpf
+from ..utils.cpf import is_valid_cpf, normalize_cpf
+from ..utils.password import hash_password_async, needs_rehash, verify_password_async
 
 
 class LoginState(rx.State):
@@ -37,31 +42,43 @@ class LoginState(rx.State):
     
     def _validate_cpf_format(self) -> tuple[bool, str]:
         """Validate CPF format and return cleaned CPF."""
-        clean_cpf = ''.join(filter(str.isdigit, self.cpf))
+        clean_cpf = normalize_cpf(self.cpf)
         
         if len(clean_cpf) != 11:
             self.error_message = "CPF deve ter 11 dígitos"
             return False, ""
         
+        if not is_valid_cpf(clean_cpf):
+            self.error_message = "CPF inválido"
+            return False, ""
+        
         return True, clean_cpf
     
-    def _validate_credentials(self, clean_cpf: str) -> UserData | None:
-        """Validate user credentials and return user data if valid."""
-        # Temporary validation (replace with actual database check)
-        if clean_cpf == "59469390415" and self.password == "admin123":
-            # Return user session data (temporary - replace with database query)
-            user_data = UserData(
-                id=1,
-                name="Marcelo de Campos",
-                nickname="That's Poker",
-                email="sr.marcelo.campos@gmail.com",
-                is_admin=True,
-            )
-            print("DEBUG: Credentials validated, returning user_data:", user_data)
-            return user_data
-        
+    async def _validate_credentials(self, clean_cpf: str) -> UserData | None:
+        """
+        Validate user credentials and return user data if valid.
+        Unknown CPFs (negative cache), disabled members and members without a
+        password fail without running bcrypt.
+        """
         self.error_message = "CPF ou senha inválidos"
-        return None
+        if await MemberDirectory.is_unknown_cpf(clean_cpf):
+            return None
+        
+        credentials = await MemberRepository.get_login(clean_cpf)
+        if credentials is None:
+            await MemberDirectory.remember_unknown_cpf(clean_cpf)
+            return None
+        
+        user, hashed = credentials
+        if not user.is_enabled or not hashed or not await verify_password_async(self.password, hashed):
+            return None
+        
+        if needs_rehash(hashed):
+            # Stored with a lower cost (older accounts, first-user migration): upgrade it
+            new_hash = await hash_password_async(self.password)
+            await MemberRepository.update_password(user.id, new_hash)
+        self.error_message = ""
+        return user
     
     async def handle_login(self):
         """Handle login form submission."""
@@ -74,21 +91,25 @@ class LoginState(rx.State):
                 return
                 
             # Validate CPF format
-            is_valid_cpf, clean_cpf = self._validate_cpf_format()
-            if not is_valid_cpf:
+            cpf_ok, clean_cpf = self._validate_cpf_format()
+            if not cpf_ok:
                 return
                 
-            # Simulate authentication delay
-            await asyncio.sleep(1)
+            # Throttle per CPF and client IP before any password check
+            retry_after = await acquire_attempt(clean_cpf, self.router.session.client_ip)
+            if retry_after:
+                minutes = math.ceil(retry_after / 60)
+                self.error_message = f"Muitas tentativas de login. Tente novamente em {minutes} minuto(s)."
+                return rx.toast.error(self.error_message)
             
             # Validate credentials
-            user_data = self._validate_credentials(clean_cpf)
+            user_data = await self._validate_credentials(clean_cpf)
             if user_data:
+                await reset_cpf(clean_cpf)
+                
                 # Get auth state and login user
-                print("DEBUG: About to call AuthState.login_user")
                 auth_state = await self.get_state(AuthState)
                 auth_state.login_user(user_data)
-                print("DEBUG: AuthState.login_user called successfully")
                 
                 # Success - redirect to dashboard
                 self.error_message = ""
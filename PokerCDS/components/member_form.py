@@ -7,6 +7,7 @@ Reusable member form component for profile editing and member management.
 
 import reflex as rx
 from typing import Optional, Callable
+from ..utils.cpf import is_valid_cpf, normalize_cpf
 
 
 class MemberFormState(rx.State):
@@ -101,13 +102,17 @@ class MemberFormState(rx.State):
         if not self.is_editing and not self.cpf.strip():
             self.error_message = "CPF é obrigatório"
             return False
+        
+        if not self.is_editing and not is_valid_cpf(normalize_cpf(self.cpf)):
+            self.error_message = "CPF inválido"
+            return False
             
         return True
     
     def get_form_data(self) -> dict:
         """Get form data as dictionary."""
         return {
-            "cpf": self.cpf.strip(),
+            "cpf": normalize_cpf(self.cpf),
             "name": self.name.strip(),
             "nickname": self.nickname.strip(),
             "email": self.email.strip(),
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Client-side formatting of money values sent as integer cents.
+"""
+
+import reflex as rx
+
+
+def format_money(value: rx.Var, prefix: str = "R$ ") -> rx.Var:
+    """Format a cents Var in the browser, e.g. 14000 -> 'R$ 140.00'."""
+    return rx.Var(
+        _js_expr=f"({prefix!r} + (({str(value)}) / 100).toFixed(2))",
+        _var_type=str,
+        _var_data=value._get_all_var_data(),
+    )
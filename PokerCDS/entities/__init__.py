@@ -11,6 +11,9 @@ from .base import Base
 from .member import Member
 from .game import Game
 from .game_member import GameMember
+from .buyin_event import BuyinEvent
+from .member_stats import MemberStats
+from .member_month_result import MemberMonthResult
 
 __version__ = "1.0.0"
-__all__ = ["Base", "Member", "Game", "GameMember"]
+__all__ = ["Base", "Member", "Game", "GameMember", "BuyinEvent", "MemberStats", "MemberMonthResult"]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String
+from .base import Base
+from .game_member import MONEY_PRECISION
+from ..utils.money import Money, ZERO_MONEY
+from ..utils.timezone import now
+
+# Event kinds
+EVENT_BUYIN = "buyin"  # one buy-in bought (credit or cash)
+EVENT_CASH_OUT = "cash_out"  # final chips counted or money received at the end
+EVENT_CORRECTION = "correction"  # any manual fix, including buy-in removals
+
+# Snapshot fields of game_members that events carry as deltas
+EVENT_FIELDS = ("credit_buyin", "cash_buyin", "final_chips", "rango", "pingo", "received_amount")
+
+
+class BuyinEvent(Base, table=True):
+    """Append-only ledger of changes to a player's game data; game_members is folded from it."""
+    
+    __tablename__ = "buyin_events"
+    __table_args__ = (
+        Index("ix_buyin_events_game_id_member_id_id", "game_id", "member_id", "id"),
+    )
+    id: Optional[int] = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    game_id: int = Field(sa_column=Column(Integer, ForeignKey("games.id"), nullable=False))
+    member_id: int = Field(sa_column=Column(Integer, ForeignKey("members.id"), nullable=False))
+    kind: str = Field(sa_column=Column(String(16), nullable=False))
+    
+    # Deltas applied to the game_members snapshot
+    credit_buyin: int = Field(default=0)
+    cash_buyin: int = Field(default=0)
+    final_chips: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    rango: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    pingo: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    received_amount: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    
+    created_by: Optional[int] = Field(default=None, sa_column=Column(Integer, ForeignKey("members.id")))
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), default=now, nullable=False))
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column, Integer, Date, Text
+from sqlalchemy import Column, Integer, Date, DateTime, Index, Text, text
 from .base import Base
 
 
@@ -12,7 +12,11 @@ class Game(Base, table=True):
     """Game entity for poker sessions."""
     
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
     id: Optional[int] = Field(sa_column=Column(Integer, primary_key=True, autoincrement=True))
     created_at: date = Field(sa_column=Column(Date, default=date.today, nullable=False))
     description: Optional[str] = Field(default=None, sa_column=Column(Text))
     description: Optional[str] = Field(default=None, sa_column=Column(Text))
+    closed_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))  # set when the game is closed
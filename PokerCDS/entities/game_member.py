@@ -3,32 +3,61 @@
 
 from typing import Optional
 from sqlmodel import Field
-from sqlalchemy import Column, Integer, ForeignKey, Numeric
-from decimal import Decimal
+from sqlalchemy import BigInteger, Column, Index, Integer, ForeignKey, Numeric
+from sqlalchemy.types import TypeDecorator
 from .base import Base
+from ..utils.money import Money, ZERO_MONEY
+
+
+class MoneyType(TypeDecorator):
+    """Numeric(12,2) column read and written as Money (integer cents)."""
+    
+    impl = Numeric(12, 2)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return None if value is None else Money.coerce(value).to_decimal()
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else Money.from_decimal(value)
+
 
 # Constants
-BUYIN_VALUE = Decimal('50.00')
-MONEY_PRECISION = Numeric(12, 2)
-ZERO_DECIMAL = Decimal('0.00')
+BUYIN_VALUE = Money(5000)  # R$ 50.00
+MONEY_PRECISION = MoneyType()
 
 class GameMember(Base, table=True):
     """Relationship table between Game and Member with poker session data."""
     
     __tablename__ = "game_members"
+    __table_args__ = (
+        Index("ix_game_members_member_id", "member_id"),
+        # Covers leaderboard scans of partial months (no heap access for the result columns)
+        Index(
+            "ix_game_members_game_id_results",
+            "game_id",
+            postgresql_include=["member_id", "credit_buyin", "cash_buyin", "final_chips", "rango", "pingo"],
+        ),
+    )
     game_id: int = Field(sa_column=Column(Integer, ForeignKey("games.id"), primary_key=True))
     member_id: int = Field(sa_column=Column(Integer, ForeignKey("members.id"), primary_key=True))
     
     # Poker session financial data
     credit_buyin: int = Field(default=0)  # Buy-ins on credit (integer count)
     cash_buyin: int = Field(default=0)  # Buy-ins with cash (integer count)
-    final_chips: Decimal = Field(default=ZERO_DECIMAL, sa_column=Column(MONEY_PRECISION))  # Final chips value
-    rango: Decimal = Field(default=ZERO_DECIMAL, sa_column=Column(MONEY_PRECISION))  # 5 reais ao final de cada jogador
-    pingo: Decimal = Field(default=ZERO_DECIMAL, sa_column=Column(MONEY_PRECISION))  # resto menor que 10 reais de cada jogador
-    received_amount: Decimal = Field(default=ZERO_DECIMAL, sa_column=Column(MONEY_PRECISION))  # Amount received
+    final_chips: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION))  # Final chips value
+    rango: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION))  # 5 reais ao final de cada jogador
+    pingo: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION))  # resto menor que 10 reais de cada jogador
+    received_amount: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION))  # Amount received
+    
+    # Snapshot watermark: last buyin_events.id folded into this row
+    last_event_id: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0, server_default="0"))
+    
+    # Optimistic concurrency: bumped on every change, edits compare-and-swap on it
+    version: int = Field(default=0, sa_column=Column(Integer, nullable=False, default=0, server_default="0"))
     
     @property
-    def saldo_final(self) -> Decimal:
+    def saldo_final(self) -> Money:
         """
         Calculated field for final balance.
         Formula: final_chips + received_amount - (credit_buyin + cash_buyin) * 50 - rango - pingo
@@ -4,17 +4,29 @@
 from datetime import datetime
 from typing import Optional
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import Column, Integer, DateTime, Index, text
 from pydantic import field_validator
 from .base import Base
 from ..utils.timezone import now
-from ..utils.password import hash_password
+from ..utils.cpf import normalize_cpf
+
+# Searchable text (name, nickname, CPF and phone), indexed with pg_trgm.
+# Queries must use this exact expression for the GIN index to apply.
+MEMBER_SEARCH_TEXT = "(name || ' ' || coalesce(nickname, '') || ' ' || cpf || ' ' || coalesce(phone, ''))"
 
 
 class Member(Base, table=True):
     """Member entity for poker group registration."""
     
     __tablename__ = "members"
+    __table_args__ = (
+        Index("ix_members_name_id", "name", "id"),
+        Index(
+            "ix_members_search_trgm",
+            text(f"{MEMBER_SEARCH_TEXT} gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
     id: Optional[int] = Field(sa_column=Column(Integer, primary_key=True, autoincrement=True))
     cpf: str = Field(max_length=11, unique=True, index=True)
     name: str = Field(max_length=64)
@@ -22,7 +34,8 @@ class Member(Base, table=True):
     email: Optional[str] = Field(default=None, max_length=255, unique=True)
     pix_key: Optional[str] = Field(default=None, max_length=128)
     phone: Optional[str] = Field(default=None, max_length=20)
-    password: Optional[str] = Field(default=None, max_length=128)  # bcrypt hashes are 60 chars
+    # bcrypt hash (60 chars) made with hash_password_async before writing; never raw user input
+    password: Optional[str] = Field(default=None, max_length=128)
     is_admin: Optional[bool] = Field(default=False)
     is_enabled: Optional[bool] = Field(default=True)
     created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), default=now, nullable=False))
@@ -33,7 +46,7 @@ class Member(Base, table=True):
     def validate_cpf(cls, v: str) -> str:
         """Validate and clean CPF format."""
         # Remove all non-digit characters
-        cpf = ''.join(filter(str.isdigit, v))
+        cpf = normalize_cpf(v)
         
         # Pad with zeros if less than 11 digits
         cpf = cpf.zfill(11)
@@ -43,14 +56,6 @@ class Member(Base, table=True):
             raise ValueError('CPF deve ter no máximo 11 dígitos')
         return cpf
 
-    @field_validator('password')
-    @classmethod
-    def hash_password_field(cls, v: Optional[str]) -> Optional[str]:
-        """Hash password if provided."""
-        if v is None:
-            return v
-        return hash_password(v)
-
     def display_name(self) -> str:
         """Return nickname if available, otherwise return name."""
         return self.nickname if self.nickname else self.name
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from sqlmodel import Field
+from sqlalchemy import Column, Date, ForeignKey, Integer
+from .base import Base
+from .game_member import MONEY_PRECISION
+from ..utils.money import Money, ZERO_MONEY
+
+
+class MemberMonthResult(Base, table=True):
+    """Results of a member over the closed games of one month (leaderboard bucket)."""
+    
+    __tablename__ = "member_month_results"
+    month: date = Field(sa_column=Column(Date, primary_key=True))  # first day of the month
+    member_id: int = Field(sa_column=Column(Integer, ForeignKey("members.id"), primary_key=True))
+    games_played: int = Field(default=0)
+    total_buyins: int = Field(default=0)  # credit + cash buy-ins (count)
+    net_result: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from .base import Base
+from .game_member import MONEY_PRECISION
+from ..utils.money import Money, ZERO_MONEY
+from ..utils.timezone import now
+
+
+class MemberStats(Base, table=True):
+    """Lifetime results of a member over closed games, refreshed when a game is closed."""
+    
+    __tablename__ = "member_stats"
+    member_id: int = Field(sa_column=Column(Integer, ForeignKey("members.id"), primary_key=True))
+    games_played: int = Field(default=0)
+    total_buyins: int = Field(default=0)  # credit + cash buy-ins (count)
+    net_result: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    best_night: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    worst_night: Money = Field(default=ZERO_MONEY, sa_column=Column(MONEY_PRECISION, nullable=False, default=ZERO_MONEY))
+    updated_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=now))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Reflex middleware recording per-handler latency, database time, statement counts and delta size.
+"""
+
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+from reflex.utils import format
+
+from .utils.metrics import EventRecord, current_event
+from .utils.query_recorder import log_query_problems
+
+
+def handler_label(event_name: str) -> str:
+    """Shorten a Reflex event name to 'state.handler' (e.g. 'login_state.handle_login')."""
+    state_name, _, handler = event_name.rpartition(".")
+    return f"{state_name.rpartition('____')[2]}.{handler}"
+
+
+class MetricsMiddleware(Middleware):
+    """Time every event from preprocessing to its final state update."""
+    
+    async def preprocess(self, app, state: BaseState, event: Event) -> StateUpdate | None:
+        """Start the event's record; background tasks started by the event inherit it."""
+        current_event.set(EventRecord(handler_label(event.name)))
+        return None
+    
+    async def postprocess(self, app, state: BaseState, event: Event, update: StateUpdate) -> StateUpdate:
+        """Add the update's delta size; on the final update record the event and check its queries."""
+        record = current_event.get()
+        if record is None:
+            return update
+        if update.delta:
+            record.delta_bytes += len(format.json_dumps(update.delta))
+        if update.final:
+            record.finish()
+            log_query_problems(record)
+            current_event.set(None)
+        return update
@@ -6,6 +6,13 @@ Data models for the PokerCDS application.
 """
 
 from .user_data import UserData
+from .member_data import MemberData
+from .game_data import GameData
+from .player_data import PlayerData
+from .game_totals import GameTotals
+from .member_stats_data import MemberStatsData
+from .leaderboard_entry import LeaderboardEntry
+from .import_row import ImportRow, ImportRowError, ImportReport
 
 __version__ = "1.0.0"
-__all__ = ["UserData"]
+__all__ = ["UserData", "MemberData", "GameData", "PlayerData", "GameTotals", "MemberStatsData", "LeaderboardEntry", "ImportRow", "ImportRowError", "ImportReport"]
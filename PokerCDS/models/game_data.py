@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game row model returned by the games repository.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class GameData:
+    """Compact game row for listings and headers."""
+    
+    id: int
+    created_at: date
+    description: Optional[str] = None
+    closed_at: Optional[datetime] = None
+    
+    @property
+    def is_closed(self) -> bool:
+        """Return True once the game has been closed."""
+        return self.closed_at is not None
+    
+    @property
+    def display_date(self) -> str:
+        """Return game date in Brazilian format (dd/mm/yyyy)."""
+        return self.created_at.strftime("%d/%m/%Y")
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for Reflex state."""
+        return {
+            "id": self.id,
+            "created_at": self.created_at.isoformat(),
+            "description": self.description,
+            "is_closed": self.is_closed,
+        }
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "GameData":
+        """Create GameData from a database row."""
+        created_at = row.created_at
+        if hasattr(created_at, "date"):
+            created_at = created_at.date()
+        return cls(
+            id=row.id,
+            created_at=created_at,
+            description=row.description,
+            closed_at=getattr(row, "closed_at", None),
+        )
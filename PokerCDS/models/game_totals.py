@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game totals model computed by the database alongside the player rows.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from ..utils.money import Money, ZERO_MONEY
+
+
+@dataclass(slots=True)
+class GameTotals:
+    """Aggregated buy-ins and money totals for a game."""
+    
+    credit_buyins: int = 0
+    cash_buyins: int = 0
+    final_chips: Money = ZERO_MONEY  # includes rango and pingo
+    rango: Money = ZERO_MONEY
+    pingo: Money = ZERO_MONEY
+    received: Money = ZERO_MONEY
+    balance: Money = ZERO_MONEY
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "GameTotals":
+        """Create GameTotals from the total_* columns of a database row."""
+        return cls(
+            credit_buyins=int(row.total_credit_buyins),
+            cash_buyins=int(row.total_cash_buyins),
+            final_chips=Money.coerce(row.total_final_chips),
+            rango=Money.coerce(row.total_rango),
+            pingo=Money.coerce(row.total_pingo),
+            received=Money.coerce(row.total_received),
+            balance=Money.coerce(row.total_balance),
+        )
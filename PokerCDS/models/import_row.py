@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rows and report of the historical games importer.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Tuple
+from ..utils.money import Money, ZERO_MONEY
+
+
+@dataclass(slots=True)
+class ImportRow:
+    """One validated spreadsheet line: a member's results in a game."""
+    
+    line: int
+    game_date: date
+    description: Optional[str]
+    member_id: int
+    credit_buyin: int = 0
+    cash_buyin: int = 0
+    final_chips: Money = ZERO_MONEY
+    rango: Money = ZERO_MONEY
+    pingo: Money = ZERO_MONEY
+    received_amount: Money = ZERO_MONEY
+    
+    def staging_values(self) -> Tuple:
+        """Return the values in the column order of the import staging table."""
+        return (
+            self.game_date,
+            self.description,
+            self.member_id,
+            self.credit_buyin,
+            self.cash_buyin,
+            self.final_chips.to_decimal(),
+            self.rango.to_decimal(),
+            self.pingo.to_decimal(),
+            self.received_amount.to_decimal(),
+        )
+
+
+@dataclass(slots=True)
+class ImportRowError:
+    """A spreadsheet line that could not be imported."""
+    
+    line: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Outcome of an import (or of a dry run)."""
+    
+    dry_run: bool
+    rows_read: int = 0
+    rows_valid: int = 0
+    games: int = 0  # distinct games in the file
+    games_created: int = 0
+    players_imported: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    
+    @property
+    def players_skipped(self) -> int:
+        """Valid rows not written because the player was already in that game."""
+        return 0 if self.dry_run else self.rows_valid - self.players_imported
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Leaderboard row model.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from ..utils.money import Money, ZERO_MONEY
+
+
+@dataclass(slots=True)
+class LeaderboardEntry:
+    """A member's position and results over a date range (money in cents)."""
+    
+    position: int
+    member_id: int
+    name: str
+    games_played: int = 0
+    total_buyins: int = 0
+    net_result: Money = ZERO_MONEY
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for Reflex state."""
+        return {
+            "position": self.position,
+            "member_id": self.member_id,
+            "name": self.name,
+            "games_played": self.games_played,
+            "total_buyins": self.total_buyins,
+            "net_result": self.net_result,
+        }
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "LeaderboardEntry":
+        """Create LeaderboardEntry from a database row."""
+        return cls(
+            position=row.position,
+            member_id=row.member_id,
+            name=row.nickname or row.name,
+            games_played=row.games_played,
+            total_buyins=row.total_buyins,
+            net_result=Money.coerce(row.net_result),
+        )
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Member row model returned by the members repository.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class MemberData:
+    """Compact member row for listings and forms."""
+    
+    id: int
+    cpf: str
+    name: str
+    nickname: Optional[str] = None
+    email: Optional[str] = None
+    pix_key: Optional[str] = None
+    phone: Optional[str] = None
+    is_admin: bool = False
+    is_enabled: bool = True
+    
+    @property
+    def display_name(self) -> str:
+        """Return nickname if available, otherwise return name."""
+        return self.nickname if self.nickname else self.name
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for Reflex state."""
+        return {
+            "id": self.id,
+            "cpf": self.cpf,
+            "name": self.name,
+            "nickname": self.nickname,
+            "email": self.email,
+            "pix_key": self.pix_key,
+            "phone": self.phone,
+            "is_admin": self.is_admin,
+            "is_enabled": self.is_enabled,
+        }
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "MemberData":
+        """Create MemberData from a database row."""
+        return cls(
+            id=row.id,
+            cpf=row.cpf,
+            name=row.name,
+            nickname=row.nickname,
+            email=row.email,
+            pix_key=row.pix_key,
+            phone=row.phone,
+            is_admin=bool(row.is_admin),
+            is_enabled=bool(row.is_enabled),
+        )
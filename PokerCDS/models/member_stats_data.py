@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Member lifetime statistics model.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from ..utils.money import Money, ZERO_MONEY
+
+
+@dataclass(slots=True)
+class MemberStatsData:
+    """A member's results over all closed games (money in cents)."""
+    
+    member_id: int
+    games_played: int = 0
+    total_buyins: int = 0
+    net_result: Money = ZERO_MONEY
+    best_night: Money = ZERO_MONEY
+    worst_night: Money = ZERO_MONEY
+    
+    @property
+    def average_result(self) -> Money:
+        """Average result per game played."""
+        return Money(round(self.net_result / self.games_played)) if self.games_played else ZERO_MONEY
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for Reflex state."""
+        return {
+            "member_id": self.member_id,
+            "games_played": self.games_played,
+            "total_buyins": self.total_buyins,
+            "net_result": self.net_result,
+            "best_night": self.best_night,
+            "worst_night": self.worst_night,
+            "average_result": self.average_result,
+        }
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "MemberStatsData":
+        """Create MemberStatsData from a database row."""
+        return cls(
+            member_id=row.member_id,
+            games_played=row.games_played,
+            total_buyins=row.total_buyins,
+            net_result=Money.coerce(row.net_result),
+            best_night=Money.coerce(row.best_night),
+            worst_night=Money.coerce(row.worst_night),
+        )
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Player row model for a member's participation in a game.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+from .member_data import MemberData
+from ..entities.game_member import BUYIN_VALUE
+from ..utils.money import Money, ZERO_MONEY
+
+
+@dataclass(slots=True)
+class PlayerData:
+    """Compact game_members row with the member display name."""
+    
+    member_id: int
+    name: str
+    credit_buyin: int = 0
+    cash_buyin: int = 0
+    final_chips: Money = ZERO_MONEY
+    received_amount: Money = ZERO_MONEY
+    rango: Money = ZERO_MONEY
+    pingo: Money = ZERO_MONEY
+    version: int = 0
+    
+    @property
+    def balance(self) -> Money:
+        """Player balance (positive = receives); cash buy-ins are already paid."""
+        return (
+            self.final_chips + self.rango + self.pingo
+            - self.received_amount - self.credit_buyin * BUYIN_VALUE
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for Reflex state (player id is the member id, money in cents)."""
+        return {
+            "id": self.member_id,
+            "member_id": self.member_id,
+            "name": self.name,
+            "credit_buyin": self.credit_buyin,
+            "cash_buyin": self.cash_buyin,
+            "final_chips": self.final_chips,
+            "received_amount": self.received_amount,
+            "rango": self.rango,
+            "pingo": self.pingo,
+            "version": self.version,
+        }
+    
+    @classmethod
+    def from_row(cls, row: Any, member: Optional[MemberData] = None) -> "PlayerData":
+        """Create PlayerData from a game_members row, named after the member (from the directory)."""
+        return cls(
+            member_id=row.member_id,
+            name=member.display_name if member is not None else f"#{row.member_id}",
+            credit_buyin=row.credit_buyin or 0,
+            cash_buyin=row.cash_buyin or 0,
+            final_chips=Money.coerce(row.final_chips or 0),
+            received_amount=Money.coerce(row.received_amount or 0),
+            rango=Money.coerce(row.rango or 0),
+            pingo=Money.coerce(row.pingo or 0),
+            version=row.version or 0,
+        )
@@ -13,6 +13,8 @@ from .change_password import change_password_page
 from .members_management import members_management_page
 from .games_management import games_management_page
 from .game_buyins import game_buyins_page
+from .leaderboard import leaderboard_page
+from .exports import exports_page
 
 __version__ = "1.0.0"
-__all__ = ["login_page", "profile_page", "change_password_page", "members_management_page", "games_management_page", "game_buyins_page"]
+__all__ = ["login_page", "profile_page", "change_password_page", "members_management_page", "games_management_page", "game_buyins_page", "leaderboard_page", "exports_page"]
@@ -6,9 +6,10 @@ Change password page for users.
 """
 
 import reflex as rx
-import asyncio
 from ..components.password_form import PasswordForm, PasswordFormState
 from ..state.auth_state import AuthState
+from ..repositories.member_repository import MemberRepository
+from ..utils.password import hash_password_async, verify_password_async
 
 
 class ChangePasswordState(PasswordFormState):
@@ -26,15 +27,14 @@ class ChangePasswordState(PasswordFormState):
             if not self._validate_form():
                 return
             
-            # TODO: Verify current password against database
-            # For now, simulate verification with hardcoded password
-            if self.current_password != "admin123":
+            auth_state = await self.get_state(AuthState)
+            hashed = await MemberRepository.get_password_hash(auth_state.user_id)
+            if not hashed or not await verify_password_async(self.current_password, hashed):
                 self.error_message = "Senha atual incorreta"
                 return
             
-            # TODO: Implement database update
-            # For now, simulate API call
-            await asyncio.sleep(1)
+            new_hash = await hash_password_async(self.new_password)
+            await MemberRepository.update_password(auth_state.user_id, new_hash)
             
             # Clear form and show success
             self.clear_form()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Data export page: CSV downloads of members, games and buy-ins for the treasurer.
+"""
+
+import reflex as rx
+from datetime import date
+from urllib.parse import urlencode
+from rxconfig import config
+from ..api import export_path
+from ..state.auth_state import AuthState
+from ..utils.signed_url import sign_path
+
+# Export name -> (title, description)
+EXPORT_OPTIONS = {
+    "game_members": ("Cacifes e resultados", "Uma linha por jogador em cada jogo"),
+    "games": ("Jogos", "Data, descrição e encerramento"),
+    "members": ("Membros", "Cadastro completo, sem senhas"),
+}
+
+
+class ExportsState(rx.State):
+    """State for data export page."""
+    
+    # Optional date filter (ISO dates, empty means open)
+    start_date: str = ""
+    end_date: str = ""
+    
+    # Messages
+    error_message: str = ""
+    
+    async def download(self, name: str):
+        """Download an export through a short-lived signed link."""
+        self.error_message = ""
+        auth_state = await self.get_state(AuthState)
+        if not auth_state.is_admin:
+            self.error_message = "Apenas administradores podem exportar dados"
+            return
+        
+        try:
+            start = date.fromisoformat(self.start_date) if self.start_date else None
+            end = date.fromisoformat(self.end_date) if self.end_date else None
+        except ValueError:
+            self.error_message = "Período inválido"
+            return
+        if start and end and start > end:
+            self.error_message = "A data inicial deve ser anterior à data final"
+            return
+        
+        url = f"{config.api_url}{sign_path(export_path(name))}"
+        filters = {key: value.isoformat() for key, value in (("start", start), ("end", end)) if value}
+        if filters:
+            url = f"{url}&{urlencode(filters)}"
+        return rx.redirect(url, is_external=True)
+    
+    def set_start_date(self, value: str):
+        """Set filter start date."""
+        self.start_date = value
+    
+    def set_end_date(self, value: str):
+        """Set filter end date."""
+        self.end_date = value
+
+
+def ExportCard(name: str) -> rx.Component:
+    """Card with one export's download button."""
+    title, description = EXPORT_OPTIONS[name]
+    return rx.card(
+        rx.vstack(
+            rx.text(title, font_weight="bold", size="4", id=f"exports-{name}-title"),
+            rx.text(description, size="2", color="gray", id=f"exports-{name}-description"),
+            rx.button(
+                rx.icon("download", size=16),
+                "Baixar CSV",
+                on_click=ExportsState.download(name),
+                id=f"exports-{name}-button",
+            ),
+            spacing="3",
+            align="start",
+            id=f"exports-{name}-content",
+        ),
+        padding="1.5rem",
+        id=f"exports-{name}-card",
+    )
+
+
+@rx.page(route="/exports", title="PokerCDS - Exportar Dados", on_load=AuthState.require_auth)
+def exports_page() -> rx.Component:
+    """Data export page."""
+    return rx.box(
+        # Header
+        rx.box(
+            rx.container(
+                rx.hstack(
+                    rx.button(
+                        rx.icon("arrow-left", size=16, id="exports-back-icon"),
+                        "Voltar",
+                        variant="outline",
+                        on_click=lambda: rx.redirect("/dashboard"),
+                        id="exports-back-button",
+                    ),
+                    rx.heading("Exportar Dados", size="6", id="exports-page-title"),
+                    justify="between",
+                    align="center",
+                    width="100%",
+                    id="exports-header-content",
+                ),
+                max_width="1200px",
+                id="exports-header-container",
+            ),
+            padding="1.5rem 0",
+            width="100%",
+            id="exports-header",
+        ),
+        
+        # Main content
+        rx.container(
+            rx.vstack(
+                # Date filter
+                rx.hstack(
+                    rx.text("Período (opcional):", id="exports-range-label"),
+                    rx.input(
+                        type="date",
+                        value=ExportsState.start_date,
+                        on_change=ExportsState.set_start_date,
+                        id="exports-start-date-input",
+                    ),
+                    rx.input(
+                        type="date",
+                        value=ExportsState.end_date,
+                        on_change=ExportsState.set_end_date,
+                        id="exports-end-date-input",
+                    ),
+                    spacing="3",
+                    align="center",
+                    id="exports-range-controls",
+                ),
+                
+                # Messages
+                rx.cond(
+                    ExportsState.error_message != "",
+                    rx.callout(
+                        ExportsState.error_message,
+                        icon="alert-circle",
+                        color_scheme="red",
+                        id="exports-error-message",
+                    ),
+                ),
+                
+                rx.grid(
+                    *(ExportCard(name) for name in EXPORT_OPTIONS),
+                    columns="3",
+                    spacing="4",
+                    width="100%",
+                    id="exports-grid",
+                ),
+                
+                spacing="4",
+                width="100%",
+                id="exports-main-content",
+            ),
+            max_width="1200px",
+            padding="2rem",
+            id="exports-main-container",
+        ),
+        
+        min_height="100vh",
+        id="exports-page",
+    )
@@ -6,8 +6,313 @@ Game buyins management page for poker session financial control.
 """
 
 import reflex as rx
+from reflex.vars.base import VarData
 from ..state.auth_state import AuthState
-from ..state.game_buyins_state import GameBuyinsState
+from ..state.game_buyins_state import GameBuyinsState, ROW_PATCH_LIMIT
+from ..components.money_format import format_money
+from ..entities.game_member import BUYIN_VALUE
+
+
+def current_row(player: rx.Var) -> rx.Var:
+    """Overlay the player's row patch (if any) on the row loaded with the page, in the browser."""
+    patches = [getattr(GameBuyinsState, f"row_patch_{slot}") for slot in range(ROW_PATCH_LIMIT)]
+    slots = ", ".join(str(patch) for patch in patches)
+    return rx.Var(
+        _js_expr=f"({{...{str(player)}, ...([{slots}].find((patch) => patch?.id === {str(player)}.id) ?? {{}})}})",
+        _var_type=dict,
+        _var_data=VarData.merge(player._get_all_var_data(), *(patch._get_all_var_data() for patch in patches)),
+    ).to(dict)
+
+
+def is_editing_cell(player: rx.Var, field_name: str) -> rx.Var:
+    """Client-side check whether a player's cell is being edited (only editing_cell changes on focus)."""
+    return GameBuyinsState.editing_cell == f"{player['id']}:{field_name}"
+
+
+def PlayerRow(player: rx.Var) -> rx.Component:
+    """Table row for one player (fields come from current_row, so patched rows render their latest values)."""
+    return rx.table.row(
+        rx.table.cell(
+            player["name"],
+            font_weight="medium",
+            id=f"player-cell-name-{player['id']}",
+        ),
+        rx.table.cell(
+            rx.hstack(
+                rx.button(
+                    rx.icon("minus", size=12),
+                    on_click=lambda: GameBuyinsState.decrement_credit_buyin(player["id"]),
+                    variant="ghost",
+                    size="1",
+                    disabled=player["credit_buyin"] == 0,
+                    id=f"player-credit-minus-{player['id']}",
+                ),
+                rx.text(
+                    player["credit_buyin"],
+                    min_width="20px",
+                    text_align="center",
+                    font_weight="medium",
+                    id=f"player-credit-value-{player['id']}",
+                ),
+                rx.button(
+                    rx.icon("plus", size=12),
+                    on_click=lambda: GameBuyinsState.increment_credit_buyin(player["id"]),
+                    variant="ghost",
+                    size="1",
+                    id=f"player-credit-plus-{player['id']}",
+                ),
+                spacing="1",
+                align="center",
+                justify="center",
+            ),
+            text_align="center",
+            id=f"player-cell-credit-{player['id']}",
+        ),
+        rx.table.cell(
+            rx.hstack(
+                rx.button(
+                    rx.icon("minus", size=12),
+                    on_click=lambda: GameBuyinsState.decrement_cash_buyin(player["id"]),
+                    variant="ghost",
+                    size="1",
+                    disabled=player["cash_buyin"] == 0,
+                    id=f"player-cash-minus-{player['id']}",
+                ),
+                rx.text(
+                    player["cash_buyin"],
+                    min_width="20px",
+                    text_align="center",
+                    font_weight="medium",
+                    id=f"player-cash-value-{player['id']}",
+                ),
+                rx.button(
+                    rx.icon("plus", size=12),
+                    on_click=lambda: GameBuyinsState.increment_cash_buyin(player["id"]),
+                    variant="ghost",
+                    size="1",
+                    id=f"player-cash-plus-{player['id']}",
+                ),
+                spacing="1",
+                align="center",
+                justify="center",
+            ),
+            text_align="center",
+            id=f"player-cell-cash-{player['id']}",
+        ),
+        # Final Chips - Editable
+        rx.table.cell(
+            rx.cond(
+                is_editing_cell(player, "final_chips"),
+                rx.hstack(
+                    rx.input(
+                        type="number",
+                        step="0.01",
+                        value=GameBuyinsState.editing_value,
+                        on_change=GameBuyinsState.set_editing_value,
+                        on_key_down=lambda key: rx.cond(
+                            key == "Enter",
+                            GameBuyinsState.save_inline_edit(player["id"], "final_chips"),
+                            rx.cond(
+                                key == "Escape",
+                                GameBuyinsState.cancel_inline_edit(),
+                                rx.noop()
+                            )
+                        ),
+                        size="1",
+                        width="80px",
+                        auto_focus=True,
+                        id=f"edit-final-chips-{player['id']}",
+                    ),
+                    rx.button(
+                        rx.icon("check", size=10),
+                        on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "final_chips"),
+                        variant="ghost",
+                        size="1",
+                        id=f"save-final-chips-{player['id']}",
+                    ),
+                    spacing="1",
+                    align="center",
+                    justify="end",
+                ),
+                rx.text(
+                    format_money(player["final_chips"]),
+                    on_click=lambda: GameBuyinsState.start_inline_edit(
+                        player["id"], "final_chips"
+                    ),
+                    cursor="pointer",
+                    _hover={"background": "gray.100"},
+                    padding="2px 4px",
+                    border_radius="2px",
+                    id=f"final-chips-text-{player['id']}",
+                ),
+            ),
+            text_align="right",
+            id=f"player-cell-chips-{player['id']}",
+        ),
+                            
+        # Rango - Editable
+        rx.table.cell(
+            rx.cond(
+                is_editing_cell(player, "rango"),
+                rx.hstack(
+                    rx.input(
+                        type="number",
+                        step="0.01",
+                        value=GameBuyinsState.editing_value,
+                        on_change=GameBuyinsState.set_editing_value,
+                        on_key_down=lambda key: rx.cond(
+                            key == "Enter",
+                            GameBuyinsState.save_inline_edit(player["id"], "rango"),
+                            rx.cond(
+                                key == "Escape",
+                                GameBuyinsState.cancel_inline_edit(),
+                                rx.noop()
+                            )
+                        ),
+                        size="1",
+                        width="70px",
+                        auto_focus=True,
+                        id=f"edit-rango-{player['id']}",
+                    ),
+                    rx.button(
+                        rx.icon("check", size=10),
+                        on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "rango"),
+                        variant="ghost",
+                        size="1",
+                        id=f"save-rango-{player['id']}",
+                    ),
+                    spacing="1",
+                    align="center",
+                    justify="end",
+                ),
+                rx.text(
+                    format_money(player["rango"]),
+                    on_click=lambda: GameBuyinsState.start_inline_edit(
+                        player["id"], "rango"
+                    ),
+                    cursor="pointer",
+                    _hover={"background": "gray.100"},
+                    padding="2px 4px",
+                    border_radius="2px",
+                    id=f"rango-text-{player['id']}",
+                ),
+            ),
+            text_align="right",
+            id=f"player-cell-rango-{player['id']}",
+        ),
+                            
+        # Pingo - Editable
+        rx.table.cell(
+            rx.cond(
+                is_editing_cell(player, "pingo"),
+                rx.hstack(
+                    rx.input(
+                        type="number",
+                        step="0.01",
+                        value=GameBuyinsState.editing_value,
+                        on_change=GameBuyinsState.set_editing_value,
+                        on_key_down=lambda key: rx.cond(
+                            key == "Enter",
+                            GameBuyinsState.save_inline_edit(player["id"], "pingo"),
+                            rx.cond(
+                                key == "Escape",
+                                GameBuyinsState.cancel_inline_edit(),
+                                rx.noop()
+                            )
+                        ),
+                        size="1",
+                        width="70px",
+                        auto_focus=True,
+                        id=f"edit-pingo-{player['id']}",
+                    ),
+                    rx.button(
+                        rx.icon("check", size=10),
+                        on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "pingo"),
+                        variant="ghost",
+                        size="1",
+                        id=f"save-pingo-{player['id']}",
+                    ),
+                    spacing="1",
+                    align="center",
+                    justify="end",
+                ),
+                rx.text(
+                    format_money(player["pingo"]),
+                    on_click=lambda: GameBuyinsState.start_inline_edit(
+                        player["id"], "pingo"
+                    ),
+                    cursor="pointer",
+                    _hover={"background": "gray.100"},
+                    padding="2px 4px",
+                    border_radius="2px",
+                    id=f"pingo-text-{player['id']}",
+                ),
+            ),
+            text_align="right",
+            id=f"player-cell-pingo-{player['id']}",
+        ),
+                            
+        # Received Amount - Editable
+        rx.table.cell(
+            rx.cond(
+                is_editing_cell(player, "received_amount"),
+                rx.hstack(
+                    rx.input(
+                        type="number",
+                        step="0.01",
+                        value=GameBuyinsState.editing_value,
+                        on_change=GameBuyinsState.set_editing_value,
+                        on_key_down=lambda key: rx.cond(
+                            key == "Enter",
+                            GameBuyinsState.save_inline_edit(player["id"], "received_amount"),
+                            rx.cond(
+                                key == "Escape",
+                                GameBuyinsState.cancel_inline_edit(),
+                                rx.noop()
+                            )
+                        ),
+                        size="1",
+                        width="80px",
+                        auto_focus=True,
+                        id=f"edit-received-{player['id']}",
+                    ),
+                    rx.button(
+                        rx.icon("check", size=10),
+                        on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "received_amount"),
+                        variant="ghost",
+                        size="1",
+                        id=f"save-received-{player['id']}",
+                    ),
+                    spacing="1",
+                    align="center",
+                    justify="end",
+                ),
+                rx.text(
+                    format_money(player["received_amount"]),
+                    on_click=lambda: GameBuyinsState.start_inline_edit(
+                        player["id"], "received_amount"
+                    ),
+                    cursor="pointer",
+                    _hover={"background": "gray.100"},
+                    padding="2px 4px",
+                    border_radius="2px",
+                    id=f"received-text-{player['id']}",
+                ),
+            ),
+            text_align="right",
+            id=f"player-cell-received-{player['id']}",
+        ),
+        rx.table.cell(
+            rx.text(
+                format_money(player["calculated_balance"]),
+                color=player["balance_color"],
+                font_weight="bold",
+                text_align="right",
+                id=f"player-cell-balance-{player['id']}",
+            ),
+        ),
+        id=f"player-row-{player['id']}",
+    )
 
 
 def PlayersTable() -> rx.Component:
@@ -69,289 +374,8 @@ def PlayersTable() -> rx.Component:
                 ),
                 rx.table.body(
                     rx.foreach(
-                        GameBuyinsState.players_with_edit_states,
-                        lambda player: rx.table.row(
-                            rx.table.cell(
-                                player["name"],
-                                font_weight="medium",
-                                id=f"player-cell-name-{player['id']}",
-                            ),
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.button(
-                                        rx.icon("minus", size=12),
-                                        on_click=lambda: GameBuyinsState.decrement_credit_buyin(player["id"]),
-                                        variant="ghost",
-                                        size="1",
-                                        disabled=player["credit_buyin"] == 0,
-                                        id=f"player-credit-minus-{player['id']}",
-                                    ),
-                                    rx.text(
-                                        player["credit_buyin"],
-                                        min_width="20px",
-                                        text_align="center",
-                                        font_weight="medium",
-                                        id=f"player-credit-value-{player['id']}",
-                                    ),
-                                    rx.button(
-                                        rx.icon("plus", size=12),
-                                        on_click=lambda: GameBuyinsState.increment_credit_buyin(player["id"]),
-                                        variant="ghost",
-                                        size="1",
-                                        id=f"player-credit-plus-{player['id']}",
-                                    ),
-                                    spacing="1",
-                                    align="center",
-                                    justify="center",
-                                ),
-                                text_align="center",
-                                id=f"player-cell-credit-{player['id']}",
-                            ),
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.button(
-                                        rx.icon("minus", size=12),
-                                        on_click=lambda: GameBuyinsState.decrement_cash_buyin(player["id"]),
-                                        variant="ghost",
-                                        size="1",
-                                        disabled=player["cash_buyin"] == 0,
-                                        id=f"player-cash-minus-{player['id']}",
-                                    ),
-                                    rx.text(
-                                        player["cash_buyin"],
-                                        min_width="20px",
-                                        text_align="center",
-                                        font_weight="medium",
-                                        id=f"player-cash-value-{player['id']}",
-                                    ),
-                                    rx.button(
-                                        rx.icon("plus", size=12),
-                                        on_click=lambda: GameBuyinsState.increment_cash_buyin(player["id"]),
-                                        variant="ghost",
-                                        size="1",
-                                        id=f"player-cash-plus-{player['id']}",
-                                    ),
-                                    spacing="1",
-                                    align="center",
-                                    justify="center",
-                                ),
-                                text_align="center",
-                                id=f"player-cell-cash-{player['id']}",
-                            ),
-                            # Final Chips - Editable
-                            rx.table.cell(
-                                rx.cond(
-                                    player["editing_final_chips"],
-                                    rx.hstack(
-                                        rx.input(
-                                            type="number",
-                                            step="0.01",
-                                            value=GameBuyinsState.editing_value,
-                                            on_change=GameBuyinsState.set_editing_value,
-                                            on_key_down=lambda key: rx.cond(
-                                                key == "Enter",
-                                                GameBuyinsState.save_inline_edit(player["id"], "final_chips"),
-                                                rx.cond(
-                                                    key == "Escape",
-                                                    GameBuyinsState.cancel_inline_edit(),
-                                                    rx.noop()
-                                                )
-                                            ),
-                                            size="1",
-                                            width="80px",
-                                            auto_focus=True,
-                                            id=f"edit-final-chips-{player['id']}",
-                                        ),
-                                        rx.button(
-                                            rx.icon("check", size=10),
-                                            on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "final_chips"),
-                                            variant="ghost",
-                                            size="1",
-                                            id=f"save-final-chips-{player['id']}",
-                                        ),
-                                        spacing="1",
-                                        align="center",
-                                        justify="end",
-                                    ),
-                                    rx.text(
-                                        f"R$ {player['final_chips']:.2f}",
-                                        on_click=lambda: GameBuyinsState.start_inline_edit(
-                                            player["id"], "final_chips", str(player["final_chips"])
-                                        ),
-                                        cursor="pointer",
-                                        _hover={"background": "gray.100"},
-                                        padding="2px 4px",
-                                        border_radius="2px",
-                                        id=f"final-chips-text-{player['id']}",
-                                    ),
-                                ),
-                                text_align="right",
-                                id=f"player-cell-chips-{player['id']}",
-                            ),
-                            
-                            # Rango - Editable
-                            rx.table.cell(
-                                rx.cond(
-                                    player["editing_rango"],
-                                    rx.hstack(
-                                        rx.input(
-                                            type="number",
-                                            step="0.01",
-                                            value=GameBuyinsState.editing_value,
-                                            on_change=GameBuyinsState.set_editing_value,
-                                            on_key_down=lambda key: rx.cond(
-                                                key == "Enter",
-                                                GameBuyinsState.save_inline_edit(player["id"], "rango"),
-                                                rx.cond(
-                                                    key == "Escape",
-                                                    GameBuyinsState.cancel_inline_edit(),
-                                                    rx.noop()
-                                                )
-                                            ),
-                                            size="1",
-                                            width="70px",
-                                            auto_focus=True,
-                                            id=f"edit-rango-{player['id']}",
-                                        ),
-                                        rx.button(
-                                            rx.icon("check", size=10),
-                                            on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "rango"),
-                                            variant="ghost",
-                                            size="1",
-                                            id=f"save-rango-{player['id']}",
-                                        ),
-                                        spacing="1",
-                                        align="center",
-                                        justify="end",
-                                    ),
-                                    rx.text(
-                                        f"R$ {player['rango']:.2f}",
-                                        on_click=lambda: GameBuyinsState.start_inline_edit(
-                                            player["id"], "rango", str(player["rango"])
-                                        ),
-                                        cursor="pointer",
-                                        _hover={"background": "gray.100"},
-                                        padding="2px 4px",
-                                        border_radius="2px",
-                                        id=f"rango-text-{player['id']}",
-                                    ),
-                                ),
-                                text_align="right",
-                                id=f"player-cell-rango-{player['id']}",
-                            ),
-                            
-                            # Pingo - Editable
-                            rx.table.cell(
-                                rx.cond(
-                                    player["editing_pingo"],
-                                    rx.hstack(
-                                        rx.input(
-                                            type="number",
-                                            step="0.01",
-                                            value=GameBuyinsState.editing_value,
-                                            on_change=GameBuyinsState.set_editing_value,
-                                            on_key_down=lambda key: rx.cond(
-                                                key == "Enter",
-                                                GameBuyinsState.save_inline_edit(player["id"], "pingo"),
-                                                rx.cond(
-                                                    key == "Escape",
-                                                    GameBuyinsState.cancel_inline_edit(),
-                                                    rx.noop()
-                                                )
-                                            ),
-                                            size="1",
-                                            width="70px",
-                                            auto_focus=True,
-                                            id=f"edit-pingo-{player['id']}",
-                                        ),
-                                        rx.button(
-                                            rx.icon("check", size=10),
-                                            on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "pingo"),
-                                            variant="ghost",
-                                            size="1",
-                                            id=f"save-pingo-{player['id']}",
-                                        ),
-                                        spacing="1",
-                                        align="center",
-                                        justify="end",
-                                    ),
-                                    rx.text(
-                                        f"R$ {player['pingo']:.2f}",
-                                        on_click=lambda: GameBuyinsState.start_inline_edit(
-                                            player["id"], "pingo", str(player["pingo"])
-                                        ),
-                                        cursor="pointer",
-                                        _hover={"background": "gray.100"},
-                                        padding="2px 4px",
-                                        border_radius="2px",
-                                        id=f"pingo-text-{player['id']}",
-                                    ),
-                                ),
-                                text_align="right",
-                                id=f"player-cell-pingo-{player['id']}",
-                            ),
-                            
-                            # Received Amount - Editable
-                            rx.table.cell(
-                                rx.cond(
-                                    player["editing_received_amount"],
-                                    rx.hstack(
-                                        rx.input(
-                                            type="number",
-                                            step="0.01",
-                                            value=GameBuyinsState.editing_value,
-                                            on_change=GameBuyinsState.set_editing_value,
-                                            on_key_down=lambda key: rx.cond(
-                                                key == "Enter",
-                                                GameBuyinsState.save_inline_edit(player["id"], "received_amount"),
-                                                rx.cond(
-                                                    key == "Escape",
-                                                    GameBuyinsState.cancel_inline_edit(),
-                                                    rx.noop()
-                                                )
-                                            ),
-                                            size="1",
-                                            width="80px",
-                                            auto_focus=True,
-                                            id=f"edit-received-{player['id']}",
-                                        ),
-                                        rx.button(
-                                            rx.icon("check", size=10),
-                                            on_click=lambda: GameBuyinsState.save_inline_edit(player["id"], "received_amount"),
-                                            variant="ghost",
-                                            size="1",
-                                            id=f"save-received-{player['id']}",
-                                        ),
-                                        spacing="1",
-                                        align="center",
-                                        justify="end",
-                                    ),
-                                    rx.text(
-                                        f"R$ {player['received_amount']:.2f}",
-                                        on_click=lambda: GameBuyinsState.start_inline_edit(
-                                            player["id"], "received_amount", str(player["received_amount"])
-                                        ),
-                                        cursor="pointer",
-                                        _hover={"background": "gray.100"},
-                                        padding="2px 4px",
-                                        border_radius="2px",
-                                        id=f"received-text-{player['id']}",
-                                    ),
-                                ),
-                                text_align="right",
-                                id=f"player-cell-received-{player['id']}",
-                            ),
-                            rx.table.cell(
-                                rx.text(
-                                    f"R$ {player['calculated_balance']:.2f}",
-                                    color=player["balance_color"],
-                                    font_weight="bold",
-                                    text_align="right",
-                                    id=f"player-cell-balance-{player['id']}",
-                                ),
-                            ),
-                            id=f"player-row-{player['id']}",
-                        ),
+                        GameBuyinsState.players,
+                        lambda player: PlayerRow(current_row(player)),
                     ),
                     
                     # Totals row
@@ -374,7 +398,7 @@ def PlayersTable() -> rx.Component:
                             id="totals-cell-cash",
                         ),
                         rx.table.cell(
-                            f"R$ {GameBuyinsState.total_final_chips:.2f}",
+                            format_money(GameBuyinsState.total_final_chips),
                             font_weight="bold",
                             text_align="right",
                             id="totals-cell-chips",
@@ -393,7 +417,7 @@ def PlayersTable() -> rx.Component:
                         ),
                         rx.table.cell(
                             rx.text(
-                                f"R$ {GameBuyinsState.total_balance:.2f}",
+                                format_money(GameBuyinsState.total_balance),
                                 font_weight="bold",
                                 color=GameBuyinsState.total_balance_color,
                                 text_align="right",
@@ -413,14 +437,14 @@ def PlayersTable() -> rx.Component:
                             id="values-cell-label",
                         ),
                         rx.table.cell(
-                            f"{GameBuyinsState.total_credit_buyins * 50:.2f}",
+                            format_money(GameBuyinsState.total_credit_buyins * BUYIN_VALUE, prefix=""),
                             font_weight="bold",
                             color="blue.600",
                             text_align="center",
                             id="values-cell-credit",
                         ),
                         rx.table.cell(
-                            f"{GameBuyinsState.total_cash_buyins * 50:.2f}",
+                            format_money(GameBuyinsState.total_cash_buyins * BUYIN_VALUE, prefix=""),
                             font_weight="bold",
                             color="blue.600",
                             text_align="center",
@@ -428,7 +452,7 @@ def PlayersTable() -> rx.Component:
                         ),
                         rx.table.cell(
                             rx.text(
-                                f"{GameBuyinsState.chips_difference_value:.2f}",
+                                format_money(GameBuyinsState.chips_difference_value, prefix=""),
                                 font_weight="bold",
                                 color=GameBuyinsState.chips_difference_color,
                                 text_align="right",
@@ -628,7 +652,7 @@ def EditPlayerModal() -> rx.Component:
     )
 
 
-@rx.page(route="/games/[game_id]/buyins", title="PokerCDS - Controle de Cacifes", on_load=GameBuyinsState.load_game_data)
+@rx.page(route="/games/[game_id]/buyins", title="PokerCDS - Controle de Cacifes", on_load=[GameBuyinsState.load_game_data, GameBuyinsState.watch_game])
 def game_buyins_page() -> rx.Component:
     """Game buyins management page."""
     return rx.box(
@@ -644,6 +668,23 @@ def game_buyins_page() -> rx.Component:
                         id="buyins-back-button",
                     ),
                     rx.heading("Controle de Cacifes", size="6", id="buyins-page-title"),
+                    rx.button(
+                        rx.icon("file-down", size=16, id="buyins-report-icon"),
+                        "Relatório PDF",
+                        variant="outline",
+                        on_click=GameBuyinsState.download_report,
+                        id="buyins-report-button",
+                    ),
+                    rx.cond(
+                        AuthState.is_admin,
+                        rx.button(
+                            rx.icon("lock", size=16, id="buyins-close-icon"),
+                            rx.cond(GameBuyinsState.game_closed, "Atualizar fechamento", "Encerrar jogo"),
+                            on_click=GameBuyinsState.close_game,
+                            loading=GameBuyinsState.is_saving,
+                            id="buyins-close-button",
+                        ),
+                    ),
                     justify="between",
                     align="center",
                     width="100%",
@@ -7,9 +7,13 @@ Games management page with full CRUD operations.
 
 import reflex as rx
 import asyncio
+import logging
 from datetime import date
 from typing import List, Optional
 from ..state.auth_state import AuthState
+from ..repositories.game_repository import GameRepository
+
+logger = logging.getLogger(__name__)
 
 
 class GamesManagementState(rx.State):
@@ -18,9 +22,8 @@ class GamesManagementState(rx.State):
     # Games list
     games: List[dict] = []
     selected_games: List[int] = []
-    current_page: int = 1
-    total_pages: int = 1
     games_per_page: int = 20
+    has_more_games: bool = False
     
     # Modal states
     show_add_modal: bool = False
@@ -34,6 +37,7 @@ class GamesManagementState(rx.State):
     
     # Loading states
     is_loading: bool = False
+    is_loading_more: bool = False
     is_deleting: bool = False
     is_form_loading: bool = False
     
@@ -42,42 +46,39 @@ class GamesManagementState(rx.State):
     success_message: str = ""
     
     async def load_games(self):
-        """Load games from database (paginated, ordered by date desc)."""
+        """Load the first page of games from database (ordered by date desc)."""
         self.is_loading = True
         self.error_message = ""
         
         try:
-            # TODO: Replace with actual database query
-            # Simulate API call
-            await asyncio.sleep(0.5)
+            games, self.has_more_games = await GameRepository.list_games(self.games_per_page)
+            self.games = [game.to_dict() for game in games]
             
-            # Mock data for demonstration (ordered by date desc)
-            mock_games = [
-                {
-                    "id": 3,
-                    "created_at": "2024-01-15",
-                    "description": "Jogo de domingo - Mesa cheia",
-                },
-                {
-                    "id": 2,
-                    "created_at": "2024-01-10",
-                    "description": "Jogo da semana",
-                },
-                {
-                    "id": 1,
-                    "created_at": "2024-01-05",
-                    "description": None,
-                },
-            ]
+        except Exception as e:
+            self.error_message = f"Erro ao carregar jogos: {str(e)}"
             
-            self.games = mock_games
-            self.total_pages = 1  # For now, single page
+        finally:
+            self.is_loading = False
+    
+    async def load_more_games(self):
+        """Append the next page of games after the last one shown."""
+        if not self.games or not self.has_more_games or self.is_loading_more:
+            return
+        
+        self.is_loading_more = True
+        self.error_message = ""
+        
+        try:
+            last_game = self.games[-1]
+            after = (date.fromisoformat(last_game["created_at"]), last_game["id"])
+            games, self.has_more_games = await GameRepository.list_games(self.games_per_page, after=after)
+            self.games.extend([game.to_dict() for game in games])
             
         except Exception as e:
             self.error_message = f"Erro ao carregar jogos: {str(e)}"
             
         finally:
-            self.is_loading = False
+            self.is_loading_more = False
     
     def set_created_at(self, value: str):
         """Set created_at value."""
@@ -178,7 +179,7 @@ class GamesManagementState(rx.State):
                 "created_at": self.created_at,
                 "description": self.description if self.description else None,
             }
-            print(f"DEBUG: Adding game: {game_data}")
+            logger.debug("Adding game: %s", game_data)
             
             self.success_message = "Jogo adicionado com sucesso!"
             self.close_add_modal()
@@ -209,7 +210,7 @@ class GamesManagementState(rx.State):
                 "created_at": self.created_at,
                 "description": self.description if self.description else None,
             }
-            print(f"DEBUG: Updating game: {game_data}")
+            logger.debug("Updating game: %s", game_data)
             
             self.success_message = "Jogo atualizado com sucesso!"
             self.close_edit_modal()
@@ -378,6 +379,29 @@ def GamesTable() -> rx.Component:
                 id="games-table",
             ),
             
+            # Load more (keyset pagination)
+            rx.cond(
+                GamesManagementState.has_more_games,
+                rx.center(
+                    rx.button(
+                        rx.cond(
+                            GamesManagementState.is_loading_more,
+                            rx.spinner(size="1", id="games-load-more-spinner"),
+                            rx.icon("chevrons-down", size=16, id="games-load-more-icon"),
+                        ),
+                        "Carregar mais",
+                        on_click=GamesManagementState.load_more_games,
+                        disabled=GamesManagementState.is_loading_more,
+                        variant="outline",
+                        size="2",
+                        id="games-load-more-button",
+                    ),
+                    width="100%",
+                    padding_top="1rem",
+                    id="games-load-more-container",
+                ),
+            ),
+            
             width="100%",
             id="games-table-container",
         ),
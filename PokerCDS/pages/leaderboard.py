@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Leaderboard page ranking members by net result over a date range.
+"""
+
+import reflex as rx
+from datetime import date
+from typing import List
+from ..components.money_format import format_money
+from ..repositories.leaderboard_repository import LeaderboardRepository
+from ..state.auth_state import AuthState
+from ..utils.timezone import now
+
+# Range presets: value -> label
+RANGE_PRESETS = {
+    "this_year": "Este ano",
+    "last_12_months": "Últimos 12 meses",
+    "custom": "Período personalizado",
+}
+
+
+class LeaderboardState(rx.State):
+    """State for leaderboard page."""
+    
+    entries: List[dict] = []
+    
+    # Range selection
+    range_preset: str = "this_year"
+    start_date: str = ""
+    end_date: str = ""
+    
+    # Loading states
+    is_loading: bool = False
+    
+    # Messages
+    error_message: str = ""
+    
+    @rx.var
+    def range_label(self) -> str:
+        """Return the label of the selected preset."""
+        return RANGE_PRESETS.get(self.range_preset, "")
+    
+    def _apply_preset(self):
+        """Set the date range of the selected preset (custom keeps the chosen dates)."""
+        today = now().date()
+        if self.range_preset == "this_year":
+            start = date(today.year, 1, 1)
+        elif self.range_preset == "last_12_months":
+            # First day of the month eleven months back, so the range spans twelve months
+            months = today.year * 12 + today.month - 1 - 11
+            start = date(months // 12, months % 12 + 1, 1)
+        else:
+            return
+        self.start_date = start.isoformat()
+        self.end_date = today.isoformat()
+    
+    async def load_leaderboard(self):
+        """Load the ranking for the selected date range."""
+        self._apply_preset()
+        self.is_loading = True
+        self.error_message = ""
+        
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+            if start > end:
+                self.error_message = "A data inicial deve ser anterior à data final"
+                return
+            
+            entries = await LeaderboardRepository.ranking(start, end)
+            self.entries = [entry.to_dict() for entry in entries]
+        
+        except ValueError:
+            self.error_message = "Período inválido"
+        
+        except Exception as e:
+            self.error_message = f"Erro ao carregar ranking: {str(e)}"
+        
+        finally:
+            self.is_loading = False
+    
+    async def set_range_label(self, label: str):
+        """Select a range preset by its label and reload."""
+        for value, preset_label in RANGE_PRESETS.items():
+            if preset_label == label:
+                self.range_preset = value
+        if self.range_preset != "custom":
+            await self.load_leaderboard()
+    
+    def set_start_date(self, value: str):
+        """Set custom range start date."""
+        self.start_date = value
+    
+    def set_end_date(self, value: str):
+        """Set custom range end date."""
+        self.end_date = value
+
+
+def LeaderboardTable() -> rx.Component:
+    """Table with the ranked members."""
+    return rx.table.root(
+        rx.table.header(
+            rx.table.row(
+                rx.table.column_header_cell("#", width="8%", id="leaderboard-header-position"),
+                rx.table.column_header_cell("Membro", id="leaderboard-header-name"),
+                rx.table.column_header_cell("Jogos", width="12%", text_align="center", id="leaderboard-header-games"),
+                rx.table.column_header_cell("Cacifes", width="12%", text_align="center", id="leaderboard-header-buyins"),
+                rx.table.column_header_cell("Resultado", width="20%", text_align="right", id="leaderboard-header-net"),
+                id="leaderboard-header-row",
+            ),
+            id="leaderboard-header-section",
+        ),
+        rx.table.body(
+            rx.foreach(
+                LeaderboardState.entries,
+                lambda entry: rx.table.row(
+                    rx.table.cell(entry["position"], font_weight="bold", id=f"leaderboard-position-{entry['member_id']}"),
+                    rx.table.cell(entry["name"], id=f"leaderboard-name-{entry['member_id']}"),
+                    rx.table.cell(entry["games_played"], text_align="center", id=f"leaderboard-games-{entry['member_id']}"),
+                    rx.table.cell(entry["total_buyins"], text_align="center", id=f"leaderboard-buyins-{entry['member_id']}"),
+                    rx.table.cell(
+                        format_money(entry["net_result"]),
+                        text_align="right",
+                        font_weight="bold",
+                        color=rx.cond(entry["net_result"].to(int) >= 0, "green", "red"),
+                        id=f"leaderboard-net-{entry['member_id']}",
+                    ),
+                    id=f"leaderboard-row-{entry['member_id']}",
+                ),
+            ),
+            id="leaderboard-body",
+        ),
+        width="100%",
+        id="leaderboard-table",
+    )
+
+
+@rx.page(route="/leaderboard", title="PokerCDS - Ranking", on_load=[AuthState.require_auth, LeaderboardState.load_leaderboard])
+def leaderboard_page() -> rx.Component:
+    """Leaderboard page."""
+    return rx.box(
+        # Header
+        rx.box(
+            rx.container(
+                rx.hstack(
+                    rx.button(
+                        rx.icon("arrow-left", size=16, id="leaderboard-back-icon"),
+                        "Voltar",
+                        variant="outline",
+                        on_click=lambda: rx.redirect("/dashboard"),
+                        id="leaderboard-back-button",
+                    ),
+                    rx.heading("Ranking", size="6", id="leaderboard-page-title"),
+                    justify="between",
+                    align="center",
+                    width="100%",
+                    id="leaderboard-header-content",
+                ),
+                max_width="1200px",
+                id="leaderboard-header-container",
+            ),
+            padding="1.5rem 0",
+            width="100%",
+            id="leaderboard-header",
+        ),
+        
+        # Main content
+        rx.container(
+            rx.vstack(
+                # Range selection
+                rx.hstack(
+                    rx.select(
+                        list(RANGE_PRESETS.values()),
+                        value=LeaderboardState.range_label,
+                        on_change=LeaderboardState.set_range_label,
+                        id="leaderboard-range-select",
+                    ),
+                    rx.cond(
+                        LeaderboardState.range_preset == "custom",
+                        rx.hstack(
+                            rx.input(
+                                type="date",
+                                value=LeaderboardState.start_date,
+                                on_change=LeaderboardState.set_start_date,
+                                id="leaderboard-start-date-input",
+                            ),
+                            rx.input(
+                                type="date",
+                                value=LeaderboardState.end_date,
+                                on_change=LeaderboardState.set_end_date,
+                                id="leaderboard-end-date-input",
+                            ),
+                            rx.button(
+                                "Atualizar",
+                                on_click=LeaderboardState.load_leaderboard,
+                                loading=LeaderboardState.is_loading,
+                                id="leaderboard-refresh-button",
+                            ),
+                            spacing="2",
+                            id="leaderboard-custom-range",
+                        ),
+                    ),
+                    spacing="3",
+                    align="center",
+                    width="100%",
+                    id="leaderboard-range-controls",
+                ),
+                
+                # Messages
+                rx.cond(
+                    LeaderboardState.error_message != "",
+                    rx.callout(
+                        LeaderboardState.error_message,
+                        icon="alert-circle",
+                        color_scheme="red",
+                        id="leaderboard-error-message",
+                    ),
+                ),
+                
+                rx.cond(
+                    LeaderboardState.is_loading,
+                    rx.center(rx.spinner(size="3"), padding="2rem", id="leaderboard-loading"),
+                    rx.cond(
+                        LeaderboardState.entries.length() > 0,
+                        LeaderboardTable(),
+                        rx.text(
+                            "Nenhum jogo encerrado neste período.",
+                            color="gray",
+                            id="leaderboard-empty",
+                        ),
+                    ),
+                ),
+                
+                spacing="4",
+                width="100%",
+                id="leaderboard-main-content",
+            ),
+            max_width="1200px",
+            padding="2rem",
+            id="leaderboard-main-container",
+        ),
+        
+        min_height="100vh",
+        id="leaderboard-page",
+    )
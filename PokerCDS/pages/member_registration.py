@@ -9,7 +9,9 @@ import reflex as rx
 import asyncio
 from ..components.member_form import MemberForm, MemberFormState
 from ..components.password_form import PasswordForm, PasswordFormState
+from ..repositories.member_directory import MemberDirectory
 from ..state.auth_state import AuthState
+from ..utils.password import hash_password_async
 
 class MemberRegistrationState(MemberFormState):
     """State for member registration page."""
@@ -66,15 +68,8 @@ class MemberRegistrationState(MemberFormState):
             if not self._validate_form():
                 return
             
-            # TODO: Implement database insertion
-            # For now, simulate API call
-            await asyncio.sleep(1)
-            
-            # Get form data including password
-            member_data = self.get_form_data()
-            member_data["password"] = self.password
-            
-            print(f"DEBUG: Registering new member: {member_data}")
+            password_hash = await hash_password_async(self.password)
+            await MemberDirectory.create_member(self.get_form_data(), password_hash)
             
             self.success_message = f"Membro '{self.name}' cadastrado com sucesso!"
             
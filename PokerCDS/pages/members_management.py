@@ -7,9 +7,14 @@ Members management page with full CRUD operations.
 
 import reflex as rx
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..components.member_form import MemberForm, MemberFormState
 from ..state.auth_state import AuthState
+from ..repositories.member_directory import MemberDirectory
+from ..repositories.member_repository import MemberRepository
+
+# Running member searches per client token, so a newer keystroke cancels the older query
+_member_searches: Dict[str, asyncio.Task] = {}
 
 
 class MembersManagementState(rx.State):
@@ -18,9 +23,9 @@ class MembersManagementState(rx.State):
     # Members list
     members: List[dict] = []
     selected_members: List[int] = []
-    current_page: int = 1
-    total_pages: int = 1
     members_per_page: int = 20
+    has_more_members: bool = False
+    search_query: str = ""
     
     # Modal states
     show_add_modal: bool = False
@@ -30,6 +35,8 @@ class MembersManagementState(rx.State):
     
     # Loading states
     is_loading: bool = False
+    is_loading_more: bool = False
+    is_searching: bool = False
     is_deleting: bool = False
     
     # Messages
@@ -37,60 +44,78 @@ class MembersManagementState(rx.State):
     success_message: str = ""
     
     async def load_members(self):
-        """Load members from database (paginated)."""
+        """Load the first page of members matching the current search."""
         self.is_loading = True
         self.error_message = ""
         
         try:
-            # TODO: Replace with actual database query
-            # Simulate API call
-            await asyncio.sleep(0.5)
+            members, self.has_more_members = await MemberRepository.search_members(
+                self.search_query, self.members_per_page
+            )
+            self.members = [member.to_dict() for member in members]
             
-            # Mock data for demonstration
-            mock_members = [
-                {
-                    "id": 1,
-                    "cpf": "59469390415",
-                    "name": "Marcelo de Campos",
-                    "nickname": "That's Poker",
-                    "email": "sr.marcelo.campos@gmail.com",
-                    "pix_key": "sr.marcelo.campos@gmail.com",
-                    "phone": "61984017586",
-                    "is_admin": True,
-                    "is_enabled": True,
-                },
-                {
-                    "id": 2,
-                    "cpf": "12345678901",
-                    "name": "João Silva",
-                    "nickname": "Joãozinho",
-                    "email": "joao@exemplo.com",
-                    "pix_key": "joao@exemplo.com",
-                    "phone": "11999887766",
-                    "is_admin": False,
-                    "is_enabled": True,
-                },
-                {
-                    "id": 3,
-                    "cpf": "98765432100",
-                    "name": "Maria Santos",
-                    "nickname": "Mari",
-                    "email": "maria@exemplo.com",
-                    "pix_key": "maria@exemplo.com",
-                    "phone": "11888776655",
-                    "is_admin": False,
-                    "is_enabled": False,
-                },
-            ]
+        except Exception as e:
+            self.error_message = f"Erro ao carregar membros: {str(e)}"
             
-            self.members = mock_members
-            self.total_pages = 1  # For now, single page
+        finally:
+            self.is_loading = False
+    
+    async def load_more_members(self):
+        """Append the next page of members after the last one shown."""
+        if not self.members or not self.has_more_members or self.is_loading_more:
+            return
+        
+        self.is_loading_more = True
+        self.error_message = ""
+        
+        try:
+            last_member = self.members[-1]
+            members, self.has_more_members = await MemberRepository.search_members(
+                self.search_query, self.members_per_page, after=(last_member["name"], last_member["id"])
+            )
+            self.members.extend([member.to_dict() for member in members])
             
         except Exception as e:
             self.error_message = f"Erro ao carregar membros: {str(e)}"
             
         finally:
-            self.is_loading = False
+            self.is_loading_more = False
+    
+    @rx.event(background=True)
+    async def search_members(self, term: str):
+        """Search members server-side; a newer search cancels the one still running."""
+        token = self.router.session.client_token
+        task = asyncio.current_task()
+        previous = _member_searches.get(token)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        _member_searches[token] = task
+        
+        try:
+            async with self:
+                self.search_query = term
+                self.is_searching = True
+                self.error_message = ""
+            
+            members, has_more = await MemberRepository.search_members(term, self.members_per_page)
+            
+            async with self:
+                self.members = [member.to_dict() for member in members]
+                self.has_more_members = has_more
+                self.selected_members = []
+                
+        except asyncio.CancelledError:
+            raise  # Superseded by a newer search (or shutting down); the newer search owns the results
+            
+        except Exception as e:
+            async with self:
+                self.error_message = f"Erro ao buscar membros: {str(e)}"
+                
+        finally:
+            if _member_searches.get(token) is task:
+                del _member_searches[token]
+                async with self:
+                    self.is_searching = False
     
     def toggle_member_selection(self, member_id: int):
         """Toggle member selection for bulk operations."""
@@ -198,11 +223,7 @@ class MemberFormModalState(MemberFormState):
             if not self._validate_form():
                 return
             
-            # TODO: Implement database insertion
-            await asyncio.sleep(1)
-            
-            member_data = self.get_form_data()
-            print(f"DEBUG: Adding member: {member_data}")
+            await MemberDirectory.create_member(self.get_form_data())
             
             # Get main state and close modal
             main_state = await self.get_state(MembersManagementState)
@@ -228,14 +249,17 @@ class MemberFormModalState(MemberFormState):
             if not self._validate_form():
                 return
             
-            # TODO: Implement database update
-            await asyncio.sleep(1)
+            main_state = await self.get_state(MembersManagementState)
+            if main_state.editing_member is None:
+                self.error_message = "Membro não encontrado"
+                return
             
-            member_data = self.get_form_data()
-            print(f"DEBUG: Updating member: {member_data}")
+            member = await MemberDirectory.update_member(main_state.editing_member["id"], self.get_form_data())
+            if member is None:
+                self.error_message = "Membro não encontrado"
+                return
             
-            # Get main state and close modal
-            main_state = await self.get_state(MembersManagementState)
+            # Close modal
             main_state.success_message = f"Membro '{self.name}' atualizado com sucesso!"
             main_state.close_edit_modal()
             
@@ -270,6 +294,22 @@ def MembersTable() -> rx.Component:
                     align="center",
                     id="members-select-all-container",
                 ),
+                rx.input(
+                    rx.input.slot(
+                        rx.cond(
+                            MembersManagementState.is_searching,
+                            rx.spinner(size="1", id="members-search-spinner"),
+                            rx.icon("search", size=16, id="members-search-icon"),
+                        ),
+                    ),
+                    placeholder="Buscar por nome, apelido, CPF ou telefone",
+                    value=MembersManagementState.search_query,
+                    on_change=MembersManagementState.search_members,
+                    debounce_timeout=300,
+                    width="100%",
+                    max_width="360px",
+                    id="members-search-input",
+                ),
                 rx.hstack(
                     rx.button(
                         rx.icon("plus", size=16, id="members-add-icon"),
@@ -378,6 +418,29 @@ def MembersTable() -> rx.Component:
                 id="members-table",
             ),
             
+            # Load more (keyset pagination)
+            rx.cond(
+                MembersManagementState.has_more_members,
+                rx.center(
+                    rx.button(
+                        rx.cond(
+                            MembersManagementState.is_loading_more,
+                            rx.spinner(size="1", id="members-load-more-spinner"),
+                            rx.icon("chevrons-down", size=16, id="members-load-more-icon"),
+                        ),
+                        "Carregar mais",
+                        on_click=MembersManagementState.load_more_members,
+                        disabled=MembersManagementState.is_loading_more,
+                        variant="outline",
+                        size="2",
+                        id="members-load-more-button",
+                    ),
+                    width="100%",
+                    padding_top="1rem",
+                    id="members-load-more-container",
+                ),
+            ),
+            
             width="100%",
             id="members-table-container",
         ),
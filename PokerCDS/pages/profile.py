@@ -8,12 +8,23 @@ User profile page for editing own data.
 import reflex as rx
 import asyncio
 from ..components.member_form import MemberForm, MemberFormState
+from ..components.money_format import format_money
+from ..repositories.member_stats_repository import MemberStatsRepository
 from ..state.auth_state import AuthState
 
 
 class ProfileState(MemberFormState):
     """State for user profile page."""
     
+    # Lifetime statistics over closed games (money in cents)
+    has_stats: bool = False
+    games_played: int = 0
+    total_buyins: int = 0
+    net_result: int = 0
+    best_night: int = 0
+    worst_night: int = 0
+    average_result: int = 0
+    
     async def load_current_user_data(self):
         """Load current user data from auth state."""
         # Get auth state
@@ -33,6 +44,24 @@ class ProfileState(MemberFormState):
         
         self.load_member_data(user_data)
         self.is_editing = True
+        await self._load_stats(auth_state.user_id)
+    
+    async def _load_stats(self, member_id: int):
+        """Load the member's lifetime statistics rollup."""
+        try:
+            stats = await MemberStatsRepository.get_stats(member_id)
+        except Exception as e:
+            self.error_message = f"Erro ao carregar estatísticas: {str(e)}"
+            return
+        
+        self.has_stats = stats is not None
+        if stats is not None:
+            self.games_played = stats.games_played
+            self.total_buyins = stats.total_buyins
+            self.net_result = stats.net_result
+            self.best_night = stats.best_night
+            self.worst_night = stats.worst_night
+            self.average_result = stats.average_result
     
     async def handle_submit(self):
         """Handle profile form submission."""
@@ -72,6 +101,58 @@ class ProfileState(MemberFormState):
         return rx.redirect("/dashboard")
 
 
+def StatItem(label: str, value: rx.Var, item_id: str, color: rx.Var | str | None = None) -> rx.Component:
+    """A single statistic with its label."""
+    return rx.vstack(
+        rx.text(label, size="2", color="gray", id=f"{item_id}-label"),
+        rx.text(value, size="5", font_weight="bold", color=color, id=f"{item_id}-value"),
+        spacing="1",
+        align="center",
+        id=item_id,
+    )
+
+
+def MemberStatsCard() -> rx.Component:
+    """Lifetime statistics of the logged-in member."""
+    return rx.card(
+        rx.vstack(
+            rx.heading("Minhas Estatísticas", size="5", id="profile-stats-title"),
+            rx.cond(
+                ProfileState.has_stats,
+                rx.grid(
+                    StatItem("Jogos", ProfileState.games_played, "profile-stats-games"),
+                    StatItem("Cacifes", ProfileState.total_buyins, "profile-stats-buyins"),
+                    StatItem(
+                        "Resultado",
+                        format_money(ProfileState.net_result),
+                        "profile-stats-net",
+                        rx.cond(ProfileState.net_result >= 0, "green", "red"),
+                    ),
+                    StatItem("Média por jogo", format_money(ProfileState.average_result), "profile-stats-average"),
+                    StatItem("Melhor noite", format_money(ProfileState.best_night), "profile-stats-best"),
+                    StatItem("Pior noite", format_money(ProfileState.worst_night), "profile-stats-worst"),
+                    columns="3",
+                    spacing="4",
+                    width="100%",
+                    id="profile-stats-grid",
+                ),
+                rx.text(
+                    "Nenhum jogo encerrado ainda.",
+                    size="2",
+                    color="gray",
+                    id="profile-stats-empty",
+                ),
+            ),
+            spacing="4",
+            width="100%",
+            id="profile-stats-content",
+        ),
+        width="100%",
+        max_width="600px",
+        id="profile-stats-card",
+    )
+
+
 @rx.page(route="/profile", title="PokerCDS - Meu Perfil", on_load=[AuthState.require_auth, ProfileState.load_current_user_data])
 def profile_page() -> rx.Component:
     """User profile page."""
@@ -123,6 +204,8 @@ def profile_page() -> rx.Component:
                     on_cancel=ProfileState.handle_cancel,
                 ),
                 
+                MemberStatsCard(),
+                
                 spacing="4",
                 align="center",
                 width="100%",
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Repositories package for PokerCDS.
+
+This package contains the async data access layer built on a single
+pooled engine per process.
+"""
+
+from .engine import get_engine
+from .member_repository import MemberRepository
+from .member_directory import MemberDirectory
+from .game_repository import GameRepository
+from .game_member_repository import GameMemberRepository
+from .member_stats_repository import MemberStatsRepository
+from .leaderboard_repository import LeaderboardRepository
+from .buyin_event_repository import BuyinEventRepository, VersionConflict
+from .game_import_repository import GameImportRepository
+from .export_repository import ExportRepository
+
+__version__ = "1.0.0"
+__all__ = ["get_engine", "MemberRepository", "MemberDirectory", "GameRepository", "GameMemberRepository", "BuyinEventRepository", "VersionConflict", "MemberStatsRepository", "LeaderboardRepository", "GameImportRepository", "ExportRepository"]
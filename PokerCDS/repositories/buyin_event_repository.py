@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Buy-in event ledger data access.
+
+Every change to a player's game data is appended to buyin_events and
+then folded into the game_members snapshot. Folding only reads events
+newer than the snapshot's last_event_id, so the live table never
+replays the full history. Appends lock the player's snapshot row before
+inserting the event, so a player's event ids are taken (and folded) in
+commit order and none can fall behind the watermark.
+
+Folding adds the event deltas in SQL (credit_buyin = credit_buyin + 1)
+and bumps the row version. Edits that set values pass the version they
+started from; if the row moved on meanwhile nothing is written and
+VersionConflict carries the fresh row back for merging.
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy import and_, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from .engine import get_engine
+from ..entities.buyin_event import BuyinEvent, EVENT_FIELDS
+from ..entities.game_member import GameMember
+from ..models.player_data import PlayerData
+from .game_member_repository import GameMemberRepository
+from ..utils.money import ZERO_MONEY
+
+
+# Counters that a correction must never take below zero
+_COUNT_FIELDS = ("credit_buyin", "cash_buyin")
+
+
+class VersionConflict(Exception):
+    """The player's row changed since the edit started; player is the fresh row (None if removed)."""
+    
+    def __init__(self, player: Optional[PlayerData]):
+        super().__init__("Os dados do jogador foram alterados por outro administrador")
+        self.player = player
+
+
+class BuyinEventRepository:
+    """Append-only access to buyin_events and snapshot folding into game_members."""
+    
+    @staticmethod
+    async def append(
+        game_id: int,
+        member_id: int,
+        kind: str,
+        deltas: dict,
+        created_by: Optional[int] = None,
+        expected_version: Optional[int] = None,
+    ) -> int:
+        """
+        Append an event and fold it into the player's snapshot; return the row's new version.
+        With expected_version the fold is a compare-and-swap and raises VersionConflict
+        (after rolling the event back) when the row is at another version.
+        """
+        values = {field: deltas.get(field, 0) for field in EVENT_FIELDS}
+        try:
+            async with get_engine().begin() as conn:
+                await BuyinEventRepository._lock_snapshot(conn, game_id, member_id)
+                await conn.execute(
+                    insert(BuyinEvent)
+                    .values(game_id=game_id, member_id=member_id, kind=kind, created_by=created_by, **values)
+                )
+                versions = await BuyinEventRepository.fold(conn, game_id, member_id, expected_version)
+                if member_id not in versions:
+                    raise VersionConflict(None)
+        except VersionConflict:
+            raise VersionConflict(await GameMemberRepository.load_player(game_id, member_id))
+        return versions[member_id]
+    
+    @staticmethod
+    async def _lock_snapshot(conn: AsyncConnection, game_id: int, member_id: int):
+        """Create the player's snapshot row if needed and lock it until the transaction ends."""
+        await BuyinEventRepository._ensure_snapshot(conn, game_id, member_id)
+        await conn.execute(
+            select(GameMember.version)
+            .where(GameMember.game_id == game_id, GameMember.member_id == member_id)
+            .with_for_update()
+        )
+    
+    @staticmethod
+    async def _ensure_snapshot(conn: AsyncConnection, game_id: int, member_id: int):
+        """Create an empty snapshot row for a player joining the game."""
+        await conn.execute(
+            pg_insert(GameMember)
+            .values(
+                game_id=game_id,
+                member_id=member_id,
+                credit_buyin=0,
+                cash_buyin=0,
+                final_chips=ZERO_MONEY,
+                rango=ZERO_MONEY,
+                pingo=ZERO_MONEY,
+                received_amount=ZERO_MONEY,
+                last_event_id=0,
+            )
+            .on_conflict_do_nothing(index_elements=["game_id", "member_id"])
+        )
+    
+    @staticmethod
+    async def fold(
+        conn: AsyncConnection,
+        game_id: int,
+        member_id: Optional[int] = None,
+        expected_version: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """
+        Fold pending events of a game (or of one player) into the game_members snapshot.
+        Return the new version of each updated row by member id; rows whose counters would
+        go negative, or not at expected_version, are left untouched. Callers appending
+        events must hold the rows' locks (see _lock_snapshot).
+        """
+        conditions = [BuyinEvent.game_id == game_id, BuyinEvent.id > GameMember.last_event_id]
+        if member_id is not None:
+            conditions.append(BuyinEvent.member_id == member_id)
+        
+        pending = (
+            select(
+                BuyinEvent.game_id,
+                BuyinEvent.member_id,
+                func.max(BuyinEvent.id).label("last_event_id"),
+                *(func.sum(getattr(BuyinEvent, field)).label(field) for field in EVENT_FIELDS),
+            )
+            .join(GameMember, and_(
+                GameMember.game_id == BuyinEvent.game_id,
+                GameMember.member_id == BuyinEvent.member_id,
+            ))
+            .where(*conditions)
+            .group_by(BuyinEvent.game_id, BuyinEvent.member_id)
+            .subquery("pending")
+        )
+        snapshot = GameMember.__table__
+        guards = [func.coalesce(snapshot.c[field], 0) + pending.c[field] >= 0 for field in _COUNT_FIELDS]
+        if expected_version is not None:
+            guards.append(snapshot.c.version == expected_version)
+        
+        result = await conn.execute(
+            update(snapshot)
+            .where(snapshot.c.game_id == pending.c.game_id, snapshot.c.member_id == pending.c.member_id, *guards)
+            .values(
+                last_event_id=pending.c.last_event_id,
+                version=snapshot.c.version + 1,
+                **{
+                    field: func.coalesce(snapshot.c[field], 0) + pending.c[field]
+                    for field in EVENT_FIELDS
+                },
+            )
+            .returning(snapshot.c.member_id, snapshot.c.version)
+        )
+        return {row.member_id: row.version for row in result}
+    
+    @staticmethod
+    async def list_player_events(game_id: int, member_id: int) -> List[dict]:
+        """Return a player's buy-in history for a game, oldest first."""
+        query = (
+            select(BuyinEvent.id, BuyinEvent.kind, BuyinEvent.created_at, *(getattr(BuyinEvent, field) for field in EVENT_FIELDS))
+            .where(BuyinEvent.game_id == game_id, BuyinEvent.member_id == member_id)
+            .order_by(BuyinEvent.id)
+        )
+        async with get_engine().connect() as conn:
+            result = await conn.execute(query)
+            return [dict(row._mapping) for row in result]
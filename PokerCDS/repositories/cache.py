@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process-wide Redis client shared by the caches and limiters.
+"""
+
+from typing import Optional
+from redis.asyncio import Redis
+from reflex.utils.prerequisites import get_redis
+
+_redis: Optional[Redis] = None
+_redis_checked = False
+
+
+def get_redis_client() -> Optional[Redis]:
+    """Return the shared async Redis client (from rxconfig's redis_url), or None when not configured."""
+    global _redis, _redis_checked
+    if not _redis_checked:
+        _redis = get_redis()
+        _redis_checked = True
+    return _redis
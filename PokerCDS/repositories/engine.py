@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process-wide async database engine.
+"""
+
+import time
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from rxconfig import config
+from ..utils.metrics import current_event
+from ..utils.query_recorder import record_statement
+
+_engine: Optional[AsyncEngine] = None
+
+
+def get_engine() -> AsyncEngine:
+    """Return the shared pooled async engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            config.async_db_url,
+            echo=getattr(config, "echo", False),
+            echo_pool=getattr(config, "echo_pool", False),
+            hide_parameters=getattr(config, "hide_parameters", True),
+            pool_pre_ping=getattr(config, "pool_pre_ping", True),
+            pool_size=getattr(config, "pool_size", 5),
+            max_overflow=getattr(config, "max_overflow", 10),
+        )
+        event.listen(_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return _engine
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Note when the statement started."""
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Add the statement's time, rows and shape to the running Reflex event, if any."""
+    record = current_event.get()
+    if record is not None:
+        record.db_seconds += time.perf_counter() - context._query_started
+        record_statement(record, statement, cursor.rowcount)
+
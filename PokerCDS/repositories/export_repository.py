@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Raw table exports read through server-side cursors.
+
+Rows are fetched EXPORT_FETCH_ROWS at a time from a named cursor and
+handed over batch by batch, so exporting the whole history never holds
+more than one batch in memory.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Optional, Sequence
+from sqlalchemy import Row, Select, select
+from .engine import get_engine
+from .member_stats_repository import night_result
+from ..entities.game import Game
+from ..entities.game_member import GameMember
+from ..entities.member import Member
+from ..utils.timezone import SAO_PAULO_TZ
+
+EXPORT_FETCH_ROWS = 2000
+
+# Never exported: password hashes
+MEMBER_EXPORT_COLUMNS = (
+    Member.id,
+    Member.name,
+    Member.nickname,
+    Member.cpf,
+    Member.email,
+    Member.phone,
+    Member.pix_key,
+    Member.is_admin,
+    Member.is_enabled,
+    Member.created_at,
+)
+
+GAME_EXPORT_COLUMNS = (Game.id, Game.created_at, Game.description, Game.closed_at)
+
+GAME_MEMBER_EXPORT_COLUMNS = (
+    Game.created_at,
+    Game.description,
+    GameMember.game_id,
+    GameMember.member_id,
+    Member.name,
+    Member.nickname,
+    GameMember.credit_buyin,
+    GameMember.cash_buyin,
+    GameMember.final_chips,
+    GameMember.rango,
+    GameMember.pingo,
+    GameMember.received_amount,
+    night_result().label("result"),
+)
+
+
+def _in_range(column, start: Optional[date], end: Optional[date]) -> list:
+    """Conditions keeping a date column within [start, end] (either may be open)."""
+    conditions = []
+    if start is not None:
+        conditions.append(column >= start)
+    if end is not None:
+        conditions.append(column <= end)
+    return conditions
+
+
+def _day_start(day: date) -> datetime:
+    """Midnight of a day in São Paulo."""
+    return datetime.combine(day, time(), SAO_PAULO_TZ)
+
+
+class ExportRepository:
+    """Streaming reads of members, games and game_members."""
+    
+    @staticmethod
+    async def stream(query: Select) -> AsyncIterator[Sequence[Row]]:
+        """Yield the query's rows in batches from a server-side cursor."""
+        async with get_engine().connect() as conn:
+            result = await conn.stream(query.execution_options(yield_per=EXPORT_FETCH_ROWS))
+            async for rows in result.partitions():
+                yield rows
+    
+    @staticmethod
+    def members_query(start: Optional[date] = None, end: Optional[date] = None) -> Select:
+        """Members registered between start and end (São Paulo dates), oldest first."""
+        query = select(*MEMBER_EXPORT_COLUMNS).order_by(Member.id)
+        if start is not None:
+            query = query.where(Member.created_at >= _day_start(start))
+        if end is not None:
+            query = query.where(Member.created_at < _day_start(end + timedelta(days=1)))
+        return query
+    
+    @staticmethod
+    def games_query(start: Optional[date] = None, end: Optional[date] = None) -> Select:
+        """Games played between start and end, oldest first."""
+        return (
+            select(*GAME_EXPORT_COLUMNS)
+            .where(*_in_range(Game.created_at, start, end))
+            .order_by(Game.created_at, Game.id)
+        )
+    
+    @staticmethod
+    def game_members_query(start: Optional[date] = None, end: Optional[date] = None) -> Select:
+        """Every player's results in the games played between start and end, game by game."""
+        return (
+            select(*GAME_MEMBER_EXPORT_COLUMNS)
+            .join(Game, Game.id == GameMember.game_id)
+            .join(Member, Member.id == GameMember.member_id)
+            .where(*_in_range(Game.created_at, start, end))
+            .order_by(Game.created_at, GameMember.game_id, Member.name)
+        )
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bulk write of imported historical games.
+
+Validated rows are COPYed into a temporary staging table in batches,
+then games, buy-in events and game_members snapshots are written with
+a few set-based INSERT ... SELECT statements, all in one transaction.
+Players already present in a game are left untouched, so running the
+same file again imports nothing twice.
+"""
+
+from datetime import date
+from itertools import islice
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import (
+    Column, Date, Integer, MetaData, Numeric, Table, Text,
+    and_, exists, func, insert, literal, select,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection
+from .engine import get_engine
+from .leaderboard_repository import LeaderboardRepository, month_start, next_month
+from .member_stats_repository import MemberStatsRepository
+from ..entities.buyin_event import BuyinEvent, EVENT_CORRECTION, EVENT_FIELDS
+from ..entities.game import Game
+from ..entities.game_member import GameMember
+from ..models.import_row import ImportRow
+
+IMPORT_BATCH_SIZE = 5000
+
+# Dropped automatically when the import transaction ends
+_staging = Table(
+    "import_rows",
+    MetaData(),
+    Column("game_date", Date, nullable=False),
+    Column("description", Text),
+    Column("member_id", Integer, nullable=False),
+    Column("credit_buyin", Integer, nullable=False),
+    Column("cash_buyin", Integer, nullable=False),
+    Column("final_chips", Numeric(12, 2), nullable=False),
+    Column("rango", Numeric(12, 2), nullable=False),
+    Column("pingo", Numeric(12, 2), nullable=False),
+    Column("received_amount", Numeric(12, 2), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Staging columns in ImportRow.staging_values() order
+_COPY_SQL = f"COPY {_staging.name} ({', '.join(column.name for column in _staging.columns)}) FROM STDIN"
+
+_same_game = and_(
+    Game.created_at == _staging.c.game_date,
+    Game.description.is_not_distinct_from(_staging.c.description),
+)
+
+
+class GameImportRepository:
+    """Set-based bulk insert of historical games and their players."""
+    
+    @staticmethod
+    async def bulk_import(rows: Iterable[ImportRow], created_by: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Write the rows' games and players and refresh the statistics rollups.
+        Games are matched on (date, description) and created closed when missing.
+        Return (games created, players imported).
+        """
+        async with get_engine().begin() as conn:
+            await conn.run_sync(_staging.create)
+            if not await GameImportRepository._copy_rows(conn, rows):
+                return 0, 0
+            
+            games_created = await GameImportRepository._insert_games(conn)
+            players_imported = await GameImportRepository._insert_players(conn, created_by)
+            
+            members = select(_staging.c.member_id).distinct()
+            first, last = (await conn.execute(
+                select(func.min(_staging.c.game_date), func.max(_staging.c.game_date))
+            )).one()
+            await MemberStatsRepository.refresh_members(conn, members)
+            await LeaderboardRepository.refresh_buckets(conn, members, month_start(first), next_month(month_start(last)))
+        return games_created, players_imported
+    
+    @staticmethod
+    async def _copy_rows(conn: AsyncConnection, rows: Iterable[ImportRow]) -> int:
+        """COPY the rows into the staging table in batches; return how many were copied."""
+        driver_connection = (await conn.get_raw_connection()).driver_connection
+        rows = iter(rows)
+        copied = 0
+        async with driver_connection.cursor() as cursor:
+            while batch := list(islice(rows, IMPORT_BATCH_SIZE)):
+                async with cursor.copy(_COPY_SQL) as copy:
+                    for row in batch:
+                        await copy.write_row(row.staging_values())
+                copied += len(batch)
+        return copied
+    
+    @staticmethod
+    async def _insert_games(conn: AsyncConnection) -> int:
+        """Create the staged games that do not exist yet, already closed."""
+        new_games = (
+            select(_staging.c.game_date, _staging.c.description, func.now())
+            .where(~exists().where(_same_game))
+            .distinct()
+        )
+        result = await conn.execute(
+            insert(Game).from_select(["created_at", "description", "closed_at"], new_games)
+        )
+        return result.rowcount
+    
+    @staticmethod
+    async def _insert_players(conn: AsyncConnection, created_by: Optional[int]) -> int:
+        """
+        Append one correction event per staged player not yet in the game and
+        create the game_members snapshot already folded up to that event.
+        """
+        staged = (
+            select(
+                Game.id,
+                _staging.c.member_id,
+                literal(EVENT_CORRECTION),
+                literal(created_by, Integer),
+                *(_staging.c[field] for field in EVENT_FIELDS),
+            )
+            .join(Game, _same_game)
+            .where(~exists().where(
+                GameMember.game_id == Game.id,
+                GameMember.member_id == _staging.c.member_id,
+            ))
+        )
+        events = (
+            insert(BuyinEvent)
+            .from_select(["game_id", "member_id", "kind", "created_by", *EVENT_FIELDS], staged)
+            .returning(BuyinEvent.id, BuyinEvent.game_id, BuyinEvent.member_id, *(getattr(BuyinEvent, field) for field in EVENT_FIELDS))
+            .cte("events")
+        )
+        snapshots = select(
+            events.c.game_id,
+            events.c.member_id,
+            *(events.c[field] for field in EVENT_FIELDS),
+            events.c.id,
+            literal(1),
+        )
+        # The events CTE writes, so it must sit at the top of the statement
+        result = await conn.execute(
+            insert(GameMember)
+            .from_select(["game_id", "member_id", *EVENT_FIELDS, "last_event_id", "version"], snapshots)
+            .add_cte(events)
+        )
+        return result.rowcount
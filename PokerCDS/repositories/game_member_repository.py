@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game members (players of a game) data access.
+
+Player names come from the member directory cache instead of a join
+with members, so only game_members rows are read from Postgres.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, literal, select
+from .engine import get_engine
+from .member_directory import MemberDirectory
+from ..entities.game import Game
+from ..entities.game_member import GameMember, BUYIN_VALUE
+from ..models.game_data import GameData
+from ..models.game_totals import GameTotals
+from ..models.player_data import PlayerData
+
+
+def _game_sum(column):
+    """Sum of a game_members column over the whole game (window), zero when there are no players."""
+    return func.coalesce(func.sum(column).over(), literal(0))
+
+
+class GameMemberRepository:
+    """Read access to the game_members table."""
+    
+    @staticmethod
+    async def load_game_with_players(game_id: int) -> Tuple[Optional[GameData], List[PlayerData], GameTotals]:
+        """
+        Return the game header, its players and the game totals in a single round trip.
+        The game is outer-joined so a game without players still returns its header;
+        totals are window aggregates repeated on every row.
+        """
+        total_credit = _game_sum(GameMember.credit_buyin)
+        total_cash = _game_sum(GameMember.cash_buyin)
+        total_chips = _game_sum(GameMember.final_chips)
+        total_rango = _game_sum(GameMember.rango)
+        total_pingo = _game_sum(GameMember.pingo)
+        total_received = _game_sum(GameMember.received_amount)
+        total_final_chips = total_chips + total_rango + total_pingo
+        
+        query = (
+            select(
+                Game.id,
+                Game.created_at,
+                Game.description,
+                Game.closed_at,
+                GameMember.member_id,
+                GameMember.credit_buyin,
+                GameMember.cash_buyin,
+                GameMember.final_chips,
+                GameMember.received_amount,
+                GameMember.rango,
+                GameMember.pingo,
+                GameMember.version,
+                total_credit.label("total_credit_buyins"),
+                total_cash.label("total_cash_buyins"),
+                total_final_chips.label("total_final_chips"),
+                total_rango.label("total_rango"),
+                total_pingo.label("total_pingo"),
+                total_received.label("total_received"),
+                (
+                    total_final_chips + total_received - (total_credit + total_cash) * BUYIN_VALUE.to_decimal()
+                ).label("total_balance"),
+            )
+            .select_from(Game)
+            .outerjoin(GameMember, GameMember.game_id == Game.id)
+            .where(Game.id == game_id)
+        )
+        async with get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        
+        if not rows:
+            return None, [], GameTotals()
+        
+        game = GameData.from_row(rows[0])
+        player_rows = [row for row in rows if row.member_id is not None]
+        members = await MemberDirectory.get_members(row.member_id for row in player_rows)
+        players = [PlayerData.from_row(row, members.get(row.member_id)) for row in player_rows]
+        players.sort(key=lambda player: player.name.casefold())
+        return game, players, GameTotals.from_row(rows[0])
+    
+    @staticmethod
+    async def load_player(game_id: int, member_id: int) -> Optional[PlayerData]:
+        """Return one player of a game, or None if the member is not (or no longer) in the game."""
+        return (await GameMemberRepository.load_players(game_id, (member_id,))).get(member_id)
+    
+    @staticmethod
+    async def load_players(game_id: int, member_ids: Iterable[int]) -> Dict[int, PlayerData]:
+        """Return the given players of a game by member id in one query; members not in the game are absent."""
+        member_ids = list(member_ids)
+        if not member_ids:
+            return {}
+        query = (
+            select(
+                GameMember.member_id,
+                GameMember.credit_buyin,
+                GameMember.cash_buyin,
+                GameMember.final_chips,
+                GameMember.received_amount,
+                GameMember.rango,
+                GameMember.pingo,
+                GameMember.version,
+            )
+            .where(GameMember.game_id == game_id, GameMember.member_id.in_(member_ids))
+        )
+        async with get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        members = await MemberDirectory.get_members(row.member_id for row in rows)
+        return {row.member_id: PlayerData.from_row(row, members.get(row.member_id)) for row in rows}
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Games data access.
+"""
+
+from datetime import date
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select, tuple_, update
+from .engine import get_engine
+from .leaderboard_repository import LeaderboardRepository
+from .member_stats_repository import MemberStatsRepository
+from ..entities.game import Game
+from ..models.game_data import GameData
+
+GAME_COLUMNS = (Game.id, Game.created_at, Game.description, Game.closed_at)
+
+
+class GameRepository:
+    """Read access to the games table."""
+    
+    @staticmethod
+    async def list_games(limit: int, after: Optional[Tuple[date, int]] = None) -> Tuple[List[GameData], bool]:
+        """
+        Return a page of games ordered by date desc (most recent first) and
+        whether more games follow. Pages are keyset based: pass the
+        (created_at, id) of the last game already shown as `after`.
+        """
+        query = select(*GAME_COLUMNS).order_by(Game.created_at.desc(), Game.id.desc()).limit(limit + 1)
+        if after is not None:
+            query = query.where(tuple_(Game.created_at, Game.id) < tuple_(*after))
+        async with get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        return [GameData.from_row(row) for row in rows[:limit]], len(rows) > limit
+    
+    @staticmethod
+    async def get_game(game_id: int) -> Optional[GameData]:
+        """Return a single game by id."""
+        query = select(*GAME_COLUMNS).where(Game.id == game_id)
+        async with get_engine().connect() as conn:
+            row = (await conn.execute(query)).first()
+            return GameData.from_row(row) if row else None
+    
+    @staticmethod
+    async def close_game(game_id: int) -> bool:
+        """
+        Mark a game as closed and refresh its players' lifetime statistics and
+        leaderboard month bucket in the same transaction.
+        Closing again (after a correction) refreshes the statistics again. Return False if the game does not exist.
+        """
+        async with get_engine().begin() as conn:
+            result = await conn.execute(
+                update(Game).where(Game.id == game_id).values(closed_at=func.now())
+            )
+            if result.rowcount == 0:
+                return False
+            await MemberStatsRepository.refresh_game_players(conn, game_id)
+            await LeaderboardRepository.refresh_game_month(conn, game_id)
+        return True
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Leaderboard data access.
+
+Rankings read whole months from the member_month_results buckets (one
+row per member and month, refreshed when a game is closed) and only the
+partial months at the edges of the range from game_members, so "this
+year" or "last 12 months" never scan years of games.
+"""
+
+from datetime import date, timedelta
+from typing import List, Tuple
+from sqlalchemy import Date, Select, and_, func, literal, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from .engine import get_engine
+from .member_stats_repository import night_result
+from ..entities.game import Game
+from ..entities.game_member import GameMember
+from ..entities.member import Member
+from ..entities.member_month_result import MemberMonthResult
+from ..models.leaderboard_entry import LeaderboardEntry
+
+
+def month_start(day: date) -> date:
+    """Return the first day of the day's month."""
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    """Return the first day of the month after the day's month."""
+    return (month_start(day) + timedelta(days=32)).replace(day=1)
+
+
+def _whole_months(start: date, end: date) -> Tuple[date, date]:
+    """Return the [first, stop) months fully inside [start, end]; empty when first == stop."""
+    first = start if start.day == 1 else next_month(start)
+    stop = next_month(end) if next_month(end) - timedelta(days=1) == end else month_start(end)
+    return first, max(first, stop)
+
+
+def _buyins():
+    """Credit plus cash buy-ins of a game_members row."""
+    return func.coalesce(GameMember.credit_buyin, 0) + func.coalesce(GameMember.cash_buyin, 0)
+
+
+class LeaderboardRepository:
+    """Rankings of members by net result over closed games."""
+    
+    @staticmethod
+    async def ranking(start: date, end: date, limit: int = 100) -> List[LeaderboardEntry]:
+        """Return members ranked by net result over the closed games played from start to end (inclusive)."""
+        first, stop = _whole_months(start, end)
+        
+        raw_range = and_(Game.created_at >= start, Game.created_at <= end)
+        if first < stop:
+            raw_range = or_(
+                and_(Game.created_at >= start, Game.created_at < first),
+                and_(Game.created_at >= stop, Game.created_at <= end),
+            )
+        raw = (
+            select(
+                GameMember.member_id,
+                literal(1).label("games_played"),
+                _buyins().label("total_buyins"),
+                night_result().label("net_result"),
+            )
+            .join(Game, Game.id == GameMember.game_id)
+            .where(Game.closed_at.is_not(None), raw_range)
+        )
+        buckets = select(
+            MemberMonthResult.member_id,
+            MemberMonthResult.games_played,
+            MemberMonthResult.total_buyins,
+            MemberMonthResult.net_result,
+        ).where(MemberMonthResult.month >= first, MemberMonthResult.month < stop)
+        parts = union_all(buckets, raw).subquery("parts")
+        
+        totals = (
+            select(
+                parts.c.member_id,
+                func.sum(parts.c.games_played).label("games_played"),
+                func.sum(parts.c.total_buyins).label("total_buyins"),
+                func.sum(parts.c.net_result).label("net_result"),
+            )
+            .group_by(parts.c.member_id)
+            .subquery("totals")
+        )
+        position = func.rank().over(order_by=totals.c.net_result.desc())
+        query = (
+            select(
+                position.label("position"),
+                totals.c.member_id,
+                totals.c.games_played,
+                totals.c.total_buyins,
+                totals.c.net_result,
+                Member.name,
+                Member.nickname,
+            )
+            .join(Member, Member.id == totals.c.member_id)
+            .order_by(position, Member.name)
+            .limit(limit)
+        )
+        async with get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        return [LeaderboardEntry.from_row(row) for row in rows]
+    
+    @staticmethod
+    async def refresh_game_month(conn: AsyncConnection, game_id: int):
+        """Recompute the month bucket rows of one game's players for the game's month."""
+        game_date = await conn.scalar(select(Game.created_at).where(Game.id == game_id))
+        if game_date is None:
+            return
+        month = month_start(game_date)
+        players = select(GameMember.member_id).where(GameMember.game_id == game_id)
+        await LeaderboardRepository.refresh_buckets(conn, players, month, next_month(month))
+    
+    @staticmethod
+    async def refresh_buckets(conn: AsyncConnection, member_ids: Select, first: date, stop: date):
+        """Recompute the month bucket rows of the selected members for the months in [first, stop)."""
+        month = func.date_trunc("month", Game.created_at).cast(Date)
+        rollup = (
+            select(
+                month.label("month"),
+                GameMember.member_id,
+                func.count().label("games_played"),
+                func.sum(_buyins()).label("total_buyins"),
+                func.sum(night_result()).label("net_result"),
+            )
+            .join(Game, Game.id == GameMember.game_id)
+            .where(
+                GameMember.member_id.in_(member_ids),
+                Game.closed_at.is_not(None),
+                Game.created_at >= first,
+                Game.created_at < stop,
+            )
+            .group_by(month, GameMember.member_id)
+        )
+        columns = ["month", "member_id", "games_played", "total_buyins", "net_result"]
+        statement = pg_insert(MemberMonthResult).from_select(columns, rollup)
+        await conn.execute(
+            statement.on_conflict_do_update(
+                index_elements=["month", "member_id"],
+                set_={column: statement.excluded[column] for column in columns[2:]},
+            )
+        )
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cached member directory: Redis shared by all nodes plus a short in-process L1.
+
+Member rows (never password hashes) are kept in Redis as JSON under
+pokercds:member:id:<id>, with pokercds:member:cpf:<cpf> holding the id.
+Each process also keeps the rows it has read for L1_TTL_SECONDS, so a
+warm node renders rosters and names without a network round trip.
+
+Member writes go through create_member/update_member, which write the
+fresh row to Redis and to the local L1 (write-through). Reads that fall
+through to Postgres only fill keys that are missing (SET NX), so a
+reader holding a row loaded before an update cannot overwrite the
+written-through one. Other nodes' L1 copies age out within
+L1_TTL_SECONDS. When Redis is not configured or not reachable, lookups
+fall back to Postgres.
+
+CPFs that matched no member are remembered in Redis for
+UNKNOWN_CPF_TTL_SECONDS (pokercds:member:unknown_cpf:<cpf>), so repeated
+logins with unknown CPFs skip the database. Creating or updating a
+member clears the Redis entry; the local L1 keeps unknown CPFs for
+L1_TTL_SECONDS only, so a member registered on another node can log in
+here within that time.
+"""
+
+import json
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from redis.exceptions import RedisError
+from .cache import get_redis_client
+from .member_repository import MemberRepository
+from ..models.member_data import MemberData
+
+KEY_PREFIX = "pokercds:member:"
+REDIS_TTL_SECONDS = 24 * 60 * 60  # safety net; writes replace entries right away
+L1_TTL_SECONDS = 30
+UNKNOWN_CPF_TTL_SECONDS = 5 * 60
+UNKNOWN_CPF_L1_MAX = 10000  # bounds memory when someone sprays random CPFs
+
+logger = logging.getLogger(__name__)
+
+# member id -> (expires at, row); cpf -> (expires at, member id)
+_l1: Dict[int, Tuple[float, MemberData]] = {}
+_l1_cpf: Dict[str, Tuple[float, int]] = {}
+_l1_unknown_cpfs: Dict[str, float] = {}  # cpf -> expires at, oldest first
+
+
+def _id_key(member_id: int) -> str:
+    """Redis key of a member row."""
+    return f"{KEY_PREFIX}id:{member_id}"
+
+
+def _cpf_key(cpf: str) -> str:
+    """Redis key of the CPF -> member id index."""
+    return f"{KEY_PREFIX}cpf:{cpf}"
+
+
+def _unknown_cpf_key(cpf: str) -> str:
+    """Redis key marking a CPF that matched no member."""
+    return f"{KEY_PREFIX}unknown_cpf:{cpf}"
+
+
+def _remember(member: MemberData):
+    """Put a row in the local L1."""
+    expires = time.monotonic() + L1_TTL_SECONDS
+    _l1[member.id] = (expires, member)
+    _l1_cpf[member.cpf] = (expires, member.id)
+    _l1_unknown_cpfs.pop(member.cpf, None)
+
+
+def _l1_get(member_id: int) -> Optional[MemberData]:
+    """Return a row from the local L1 if it has not expired."""
+    entry = _l1.get(member_id)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _l1[member_id]
+        return None
+    return entry[1]
+
+
+def _remember_unknown_cpf(cpf: str, ttl: float):
+    """Put an unknown CPF in the local L1, dropping the oldest entry when full."""
+    _l1_unknown_cpfs.pop(cpf, None)
+    if len(_l1_unknown_cpfs) >= UNKNOWN_CPF_L1_MAX:
+        del _l1_unknown_cpfs[next(iter(_l1_unknown_cpfs))]
+    _l1_unknown_cpfs[cpf] = time.monotonic() + ttl
+
+
+async def _redis_store(members: Iterable[MemberData], stale_cpfs: Iterable[str] = (), fill: bool = False):
+    """
+    Write rows (and their CPF index) to Redis, dropping CPF keys that no longer apply.
+    A fill (rows read from Postgres) only sets missing keys, so it never replaces a fresher write.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for cpf in stale_cpfs:
+                pipe.delete(_cpf_key(cpf))
+            for member in members:
+                pipe.set(_id_key(member.id), json.dumps(member.to_dict()), ex=REDIS_TTL_SECONDS, nx=fill)
+                pipe.set(_cpf_key(member.cpf), member.id, ex=REDIS_TTL_SECONDS, nx=fill)
+                pipe.delete(_unknown_cpf_key(member.cpf))
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Member directory: Redis write failed", exc_info=True)
+
+
+class MemberDirectory:
+    """Read-through, write-through cache of member rows."""
+    
+    @staticmethod
+    async def get_members(member_ids: Iterable[int]) -> Dict[int, MemberData]:
+        """Return the existing members among the ids: L1 first, then Redis, then Postgres."""
+        found: Dict[int, MemberData] = {}
+        missing: List[int] = []
+        for member_id in dict.fromkeys(member_ids):
+            member = _l1_get(member_id)
+            if member is not None:
+                found[member_id] = member
+            else:
+                missing.append(member_id)
+        if not missing:
+            return found
+        
+        redis = get_redis_client()
+        if redis is not None:
+            try:
+                cached = await redis.mget([_id_key(member_id) for member_id in missing])
+            except (RedisError, OSError):
+                logger.warning("Member directory: Redis read failed", exc_info=True)
+                cached = [None] * len(missing)
+            still_missing = []
+            for member_id, value in zip(missing, cached):
+                if value is None:
+                    still_missing.append(member_id)
+                    continue
+                member = MemberData(**json.loads(value))
+                _remember(member)
+                found[member_id] = member
+            missing = still_missing
+        
+        if missing:
+            members = await MemberRepository.get_members(missing)
+            for member in members:
+                _remember(member)
+                found[member.id] = member
+            await _redis_store(members, fill=True)
+        return found
+    
+    @staticmethod
+    async def get_member(member_id: int) -> Optional[MemberData]:
+        """Return one member by id."""
+        return (await MemberDirectory.get_members((member_id,))).get(member_id)
+    
+    @staticmethod
+    async def get_by_cpf(cpf: str) -> Optional[MemberData]:
+        """Return a member by CPF (digits only)."""
+        entry = _l1_cpf.get(cpf)
+        if entry is not None and entry[0] >= time.monotonic():
+            member = await MemberDirectory.get_member(entry[1])
+            if member is not None and member.cpf == cpf:
+                return member
+        
+        redis = get_redis_client()
+        if redis is not None:
+            try:
+                member_id = await redis.get(_cpf_key(cpf))
+            except (RedisError, OSError):
+                logger.warning("Member directory: Redis read failed", exc_info=True)
+                member_id = None
+            if member_id is not None:
+                member = await MemberDirectory.get_member(int(member_id))
+                if member is not None and member.cpf == cpf:
+                    return member
+        
+        member = await MemberRepository.get_member_by_cpf(cpf)
+        if member is not None:
+            _remember(member)
+            await _redis_store((member,), fill=True)
+        return member
+    
+    @staticmethod
+    async def is_unknown_cpf(cpf: str) -> bool:
+        """Return True if the CPF recently matched no member."""
+        expires = _l1_unknown_cpfs.get(cpf)
+        if expires is not None:
+            if expires >= time.monotonic():
+                return True
+            del _l1_unknown_cpfs[cpf]
+        
+        redis = get_redis_client()
+        if redis is None:
+            return False
+        try:
+            if not await redis.exists(_unknown_cpf_key(cpf)):
+                return False
+        except (RedisError, OSError):
+            logger.warning("Member directory: Redis read failed", exc_info=True)
+            return False
+        _remember_unknown_cpf(cpf, L1_TTL_SECONDS)
+        return True
+    
+    @staticmethod
+    async def remember_unknown_cpf(cpf: str):
+        """Record that the CPF matched no member."""
+        _remember_unknown_cpf(cpf, L1_TTL_SECONDS)
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            await redis.set(_unknown_cpf_key(cpf), 1, ex=UNKNOWN_CPF_TTL_SECONDS)
+        except (RedisError, OSError):
+            logger.warning("Member directory: Redis write failed", exc_info=True)
+    
+    @staticmethod
+    async def create_member(data: dict, password_hash: Optional[str] = None) -> MemberData:
+        """Insert a member and write it through to the cache."""
+        member = await MemberRepository.create_member(data, password_hash)
+        _remember(member)
+        await _redis_store((member,))
+        return member
+    
+    @staticmethod
+    async def update_member(member_id: int, data: dict) -> Optional[MemberData]:
+        """Update a member's data and write the new row through to the cache; None if not found."""
+        previous = await MemberDirectory.get_member(member_id)
+        member = await MemberRepository.update_member(member_id, data)
+        if member is None:
+            await MemberDirectory.forget(member_id)
+            return None
+        stale_cpfs = [previous.cpf] if previous is not None and previous.cpf != member.cpf else []
+        for cpf in stale_cpfs:
+            _l1_cpf.pop(cpf, None)
+        _remember(member)
+        await _redis_store((member,), stale_cpfs)
+        return member
+    
+    @staticmethod
+    async def forget(member_id: int):
+        """Drop a member from the cache (for writes that bypass update_member)."""
+        entry = _l1.pop(member_id, None)
+        keys = [_id_key(member_id)]
+        if entry is not None:
+            _l1_cpf.pop(entry[1].cpf, None)
+            keys.append(_cpf_key(entry[1].cpf))
+        redis = get_redis_client()
+        if redis is None:
+            return
+        try:
+            await redis.delete(*keys)
+        except (RedisError, OSError):
+            logger.warning("Member directory: Redis delete failed", exc_info=True)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Members data access.
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import insert, literal_column, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from .engine import get_engine
+from ..entities.member import Member, MEMBER_SEARCH_TEXT
+from ..models.member_data import MemberData
+from ..models.user_data import UserData
+from ..utils.cpf import normalize_cpf
+from ..utils.timezone import now
+
+MEMBER_COLUMNS = (
+    Member.id,
+    Member.cpf,
+    Member.name,
+    Member.nickname,
+    Member.email,
+    Member.pix_key,
+    Member.phone,
+    Member.is_admin,
+    Member.is_enabled,
+)
+
+LOGIN_COLUMNS = (
+    Member.id,
+    Member.password,
+    Member.is_enabled,
+    Member.is_admin,
+    Member.name,
+    Member.nickname,
+    Member.email,
+)
+
+# Columns a member form may write
+EDITABLE_FIELDS = ("cpf", "name", "nickname", "email", "pix_key", "phone", "is_admin", "is_enabled")
+
+# Shorter terms cannot use the trigram index; they are matched column by column instead
+MIN_SEARCH_LENGTH = 3
+_FORMATTED_NUMBER = re.compile(r"^[\d\s.\-()/+]+$")
+
+
+def _search_term(term: str) -> str:
+    """Normalize a search term (formatted CPF/phone reduced to digits)."""
+    term = term.strip()
+    if _FORMATTED_NUMBER.match(term):
+        term = normalize_cpf(term)
+    return term
+
+
+def _search_pattern(term: str) -> str:
+    """Return the ILIKE pattern matching the term anywhere."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class MemberRepository:
+    """Access to the members table."""
+    
+    @staticmethod
+    async def search_members(
+        term: str,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> Tuple[List[MemberData], bool]:
+        """
+        Return a page of members ordered by name whose name, nickname, CPF or
+        phone contains the term (all members for an empty term), and whether
+        more members follow. Pass the (name, id) of the last member shown as
+        `after` to get the next page.
+        """
+        query = select(*MEMBER_COLUMNS).order_by(Member.name, Member.id).limit(limit + 1)
+        term = _search_term(term)
+        pattern = _search_pattern(term)
+        if len(term) >= MIN_SEARCH_LENGTH:
+            query = query.where(literal_column(MEMBER_SEARCH_TEXT).ilike(pattern))
+        elif term:
+            query = query.where(or_(
+                Member.name.ilike(pattern),
+                Member.nickname.ilike(pattern),
+                Member.cpf.like(pattern),
+                Member.phone.like(pattern),
+            ))
+        if after is not None:
+            query = query.where(tuple_(Member.name, Member.id) > tuple_(*after))
+        async with get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        return [MemberData.from_row(row) for row in rows[:limit]], len(rows) > limit
+    
+    @staticmethod
+    async def list_names() -> List[Tuple[int, str, Optional[str]]]:
+        """Return (id, name, nickname) of every member, for in-memory name lookups."""
+        query = select(Member.id, Member.name, Member.nickname)
+        async with get_engine().connect() as conn:
+            return [tuple(row) for row in await conn.execute(query)]
+    
+    @staticmethod
+    async def get_member(member_id: int) -> Optional[MemberData]:
+        """Return a single member by id."""
+        query = select(*MEMBER_COLUMNS).where(Member.id == member_id)
+        async with get_engine().connect() as conn:
+            row = (await conn.execute(query)).first()
+            return MemberData.from_row(row) if row else None
+    
+    @staticmethod
+    async def get_members(member_ids: Iterable[int]) -> List[MemberData]:
+        """Return the members with the given ids (missing ids are skipped)."""
+        query = select(*MEMBER_COLUMNS).where(Member.id.in_(list(member_ids)))
+        async with get_engine().connect() as conn:
+            return [MemberData.from_row(row) for row in await conn.execute(query)]
+    
+    @staticmethod
+    async def get_member_by_cpf(cpf: str) -> Optional[MemberData]:
+        """Return a single member by CPF (digits only)."""
+        query = select(*MEMBER_COLUMNS).where(Member.cpf == cpf)
+        async with get_engine().connect() as conn:
+            row = (await conn.execute(query)).first()
+            return MemberData.from_row(row) if row else None
+    
+    @staticmethod
+    async def create_member(data: dict, password_hash: Optional[str] = None) -> MemberData:
+        """Insert a member from form data; raise ValueError if the CPF or e-mail is taken."""
+        values = {field: data[field] for field in EDITABLE_FIELDS if field in data}
+        query = (
+            insert(Member)
+            .values(**values, password=password_hash, created_at=now())
+            .returning(*MEMBER_COLUMNS)
+        )
+        try:
+            async with get_engine().begin() as conn:
+                return MemberData.from_row((await conn.execute(query)).one())
+        except IntegrityError:
+            raise ValueError("CPF ou e-mail já cadastrado")
+    
+    @staticmethod
+    async def update_member(member_id: int, data: dict) -> Optional[MemberData]:
+        """Update a member from form data and return the new row (None if not found)."""
+        values = {field: data[field] for field in EDITABLE_FIELDS if field in data}
+        query = (
+            update(Member)
+            .where(Member.id == member_id)
+            .values(**values, updated_at=now())
+            .returning(*MEMBER_COLUMNS)
+        )
+        try:
+            async with get_engine().begin() as conn:
+                row = (await conn.execute(query)).first()
+        except IntegrityError:
+            raise ValueError("CPF ou e-mail já cadastrado")
+        return MemberData.from_row(row) if row else None
+    
+    @staticmethod
+    async def get_login(cpf: str) -> Optional[Tuple[UserData, Optional[str]]]:
+        """
+        Return the session data and password hash of the member with a normalized CPF.
+        One lookup on ix_members_cpf reading only the columns a login needs.
+        """
+        query = select(*LOGIN_COLUMNS).where(Member.cpf == cpf)
+        async with get_engine().connect() as conn:
+            row = (await conn.execute(query)).first()
+        if row is None:
+            return None
+        user = UserData(
+            id=row.id,
+            name=row.name,
+            nickname=row.nickname,
+            email=row.email,
+            is_admin=bool(row.is_admin),
+            is_enabled=bool(row.is_enabled),
+        )
+        return user, row.password
+    
+    @staticmethod
+    async def get_password_hash(member_id: int) -> Optional[str]:
+        """Return the stored password hash of a member."""
+        query = select(Member.password).where(Member.id == member_id)
+        async with get_engine().connect() as conn:
+            return await conn.scalar(query)
+    
+    @staticmethod
+    async def update_password(member_id: int, hashed: str):
+        """Store a new password hash for a member."""
+        query = update(Member).where(Member.id == member_id).values(password=hashed, updated_at=now())
+        async with get_engine().begin() as conn:
+            await conn.execute(query)
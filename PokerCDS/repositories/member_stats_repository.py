@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Member lifetime statistics data access.
+
+member_stats is a rollup of game_members over closed games. Closing a
+game refreshes only the rows of that game's players, reading their own
+game history through ix_game_members_member_id.
+"""
+
+from typing import Optional
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from .engine import get_engine
+from ..entities.game import Game
+from ..entities.game_member import GameMember, BUYIN_VALUE
+from ..entities.member_stats import MemberStats
+from ..models.member_stats_data import MemberStatsData
+
+STATS_COLUMNS = (
+    MemberStats.member_id,
+    MemberStats.games_played,
+    MemberStats.total_buyins,
+    MemberStats.net_result,
+    MemberStats.best_night,
+    MemberStats.worst_night,
+)
+
+
+def night_result():
+    """A player's result in one game: chips taken home minus buy-ins paid."""
+    return (
+        func.coalesce(GameMember.final_chips, 0)
+        + func.coalesce(GameMember.rango, 0)
+        + func.coalesce(GameMember.pingo, 0)
+        - (func.coalesce(GameMember.credit_buyin, 0) + func.coalesce(GameMember.cash_buyin, 0)) * BUYIN_VALUE.to_decimal()
+    )
+
+
+class MemberStatsRepository:
+    """Access to the member_stats rollup."""
+    
+    @staticmethod
+    async def get_stats(member_id: int) -> Optional[MemberStatsData]:
+        """Return a member's lifetime statistics (primary key lookup), None before the first closed game."""
+        query = select(*STATS_COLUMNS).where(MemberStats.member_id == member_id)
+        async with get_engine().connect() as conn:
+            row = (await conn.execute(query)).first()
+        return MemberStatsData.from_row(row) if row is not None else None
+    
+    @staticmethod
+    async def refresh_game_players(conn: AsyncConnection, game_id: int):
+        """Recompute the rollup rows of the players of one game from their closed games."""
+        players = select(GameMember.member_id).where(GameMember.game_id == game_id)
+        await MemberStatsRepository.refresh_members(conn, players)
+    
+    @staticmethod
+    async def refresh_members(conn: AsyncConnection, member_ids: Select):
+        """Recompute the rollup rows of the selected members from their closed games."""
+        result = night_result()
+        rollup = (
+            select(
+                GameMember.member_id,
+                func.count().label("games_played"),
+                func.sum(func.coalesce(GameMember.credit_buyin, 0) + func.coalesce(GameMember.cash_buyin, 0)).label("total_buyins"),
+                func.sum(result).label("net_result"),
+                func.max(result).label("best_night"),
+                func.min(result).label("worst_night"),
+                func.now().label("updated_at"),
+            )
+            .join(Game, Game.id == GameMember.game_id)
+            .where(GameMember.member_id.in_(member_ids), Game.closed_at.is_not(None))
+            .group_by(GameMember.member_id)
+        )
+        columns = ["member_id", "games_played", "total_buyins", "net_result", "best_night", "worst_night", "updated_at"]
+        statement = pg_insert(MemberStats).from_select(columns, rollup)
+        await conn.execute(
+            statement.on_conflict_do_update(
+                index_elements=["member_id"],
+                set_={column: statement.excluded[column] for column in columns[1:]},
+            )
+        )
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Services package for PokerCDS.
+
+This package contains business logic that does not belong to a single page.
+"""
+
+from .game_changes import subscribe_game
+from .game_import import import_games
+from .settlement import HOUSE_ID, Transfer, settle, settle_game
+
+__version__ = "1.0.0"
+__all__ = ["HOUSE_ID", "Transfer", "settle", "settle_game", "subscribe_game", "import_games"]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming CSV exports of members, games and game_members.
+
+Rows go from the repository's server-side cursor into the CSV writer
+and out to the response one fetch batch at a time, so the download
+starts right away and memory stays flat whatever the date range.
+
+Files use the Brazilian spreadsheet conventions (';' separator, decimal
+comma, dd/mm/yyyy dates, UTF-8 with BOM). Text cells starting like a
+formula ('=', '+', '-', '@') get a leading apostrophe, so spreadsheets
+show them as text instead of running them. The game_members export keeps
+the importer's column names, so it can be loaded back by game_import,
+which drops that apostrophe again.
+"""
+
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
+from sqlalchemy import Select
+from ..repositories.export_repository import ExportRepository
+from ..utils.money import Money
+from ..utils.timezone import utc_to_sao_paulo
+
+# Export name -> (CSV header, query builder taking start and end dates)
+EXPORTS: Dict[str, Tuple[Sequence[str], Callable[[Optional[date], Optional[date]], Select]]] = {
+    "members": (
+        ("id", "nome", "apelido", "cpf", "email", "telefone", "chave_pix", "admin", "ativo", "cadastrado_em"),
+        ExportRepository.members_query,
+    ),
+    "games": (
+        ("id", "data", "descricao", "encerrado_em"),
+        ExportRepository.games_query,
+    ),
+    "game_members": (
+        (
+            "data", "descricao", "id_jogo", "id_membro", "nome", "apelido",
+            "credito", "dinheiro", "fichas", "rango", "pingo", "recebido", "resultado",
+        ),
+        ExportRepository.game_members_query,
+    ),
+}
+
+CSV_BOM = "\ufeff"  # lets Excel detect UTF-8
+
+# Text starting with these is run as a formula by Excel and LibreOffice
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _format_decimal(value: Decimal) -> str:
+    """Format an amount in reais with a decimal comma (no thousands separator)."""
+    return f"{value:.2f}".replace(".", ",")
+
+
+def escape_formula(text: str) -> str:
+    """Prefix text that a spreadsheet would run as a formula with an apostrophe."""
+    return f"'{text}" if text.startswith(FORMULA_PREFIXES) else text
+
+
+def unescape_formula(text: str) -> str:
+    """Undo escape_formula on a cell read back from an exported file."""
+    return text[1:] if text.startswith("'") and text[1:].startswith(FORMULA_PREFIXES) else text
+
+
+def format_cell(value: Any) -> Any:
+    """Format a value the way Brazilian spreadsheets read it."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "sim" if value else "não"
+    if isinstance(value, Money):
+        return _format_decimal(value.to_decimal())
+    if isinstance(value, Decimal):
+        return _format_decimal(value)
+    if isinstance(value, datetime):
+        return utc_to_sao_paulo(value).strftime("%d/%m/%Y %H:%M")
+    if isinstance(value, date):
+        return value.strftime("%d/%m/%Y")
+    if isinstance(value, str):
+        return escape_formula(value)
+    return value
+
+
+async def stream_csv(name: str, start: Optional[date] = None, end: Optional[date] = None) -> AsyncIterator[bytes]:
+    """Yield an export as CSV bytes, one chunk per cursor fetch."""
+    header, build_query = EXPORTS[name]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\r\n")
+    
+    buffer.write(CSV_BOM)
+    writer.writerow(header)
+    yield buffer.getvalue().encode("utf-8")
+    
+    async for rows in ExportRepository.stream(build_query(start, end)):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([format_cell(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
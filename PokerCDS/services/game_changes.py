@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Live game_members change notifications (Postgres LISTEN/NOTIFY).
+
+A trigger on game_members sends NOTIFY game_members_<game_id> with the
+member id of every changed row. While a game has subscribers, one task
+LISTENs on that game's channel and fans each member id out to them.
+Subscribing waits until the LISTEN is active, so data read after
+subscribing misses no change. Notifications sent while the listener is
+reconnecting are lost, so after a reconnect every subscriber receives
+RESYNC and should re-read the whole game.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Set
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.engine import make_url
+from rxconfig import config
+
+# Must match the trigger in alembic/versions/e91d4a6f3b28_game_members_notify.py
+CHANNEL_PREFIX = "game_members_"
+RECONNECT_DELAY = 1.0
+LISTEN_READY_TIMEOUT = 5.0
+
+# Queued instead of a member id after the listener reconnects: re-read the whole game
+RESYNC = 0
+
+logger = logging.getLogger(__name__)
+
+_subscribers: Dict[int, Set[asyncio.Queue]] = {}
+_listeners: Dict[int, asyncio.Task] = {}
+_ready: Dict[int, asyncio.Event] = {}  # set once the game's LISTEN is active
+
+
+def channel_name(game_id: int) -> str:
+    """Return the NOTIFY channel of a game."""
+    return f"{CHANNEL_PREFIX}{game_id}"
+
+
+def _conninfo() -> str:
+    """Return a libpq connection string for the configured database."""
+    url = make_url(config.async_db_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def _broadcast(game_id: int, item: int):
+    """Hand a changed member id (or RESYNC) to every subscriber of the game."""
+    for queue in _subscribers.get(game_id, ()):
+        queue.put_nowait(item)
+
+
+def _publish(game_id: int, payload: str):
+    """Hand the member id of a notification to every subscriber of the game."""
+    try:
+        member_id = int(payload)
+    except ValueError:
+        return
+    if member_id != RESYNC:
+        _broadcast(game_id, member_id)
+
+
+async def _listen(game_id: int):
+    """LISTEN on the game's channel until cancelled, reconnecting on errors."""
+    ready = _ready[game_id]
+    reconnecting = False
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(_conninfo(), autocommit=True) as conn:
+                await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel_name(game_id))))
+                ready.set()
+                if reconnecting:
+                    _broadcast(game_id, RESYNC)
+                async for notify in conn.notifies():
+                    _publish(game_id, notify.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Listener for game %s failed, reconnecting", game_id)
+            reconnecting = True
+            await asyncio.sleep(RECONNECT_DELAY)
+
+
+@asynccontextmanager
+async def subscribe_game(game_id: int) -> AsyncIterator[asyncio.Queue]:
+    """
+    Yield a queue receiving the member id of each changed game_members row of the game,
+    once the game's LISTEN is active. The game's listener starts with its first subscriber
+    and stops with the last one.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    _subscribers.setdefault(game_id, set()).add(queue)
+    if game_id not in _listeners:
+        _ready[game_id] = asyncio.Event()
+        _listeners[game_id] = asyncio.create_task(_listen(game_id))
+    try:
+        try:
+            await asyncio.wait_for(_ready[game_id].wait(), LISTEN_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Listener for game %s not ready, changes may be missed until it connects", game_id)
+        yield queue
+    finally:
+        subscribers = _subscribers.get(game_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del _subscribers[game_id]
+                _ready.pop(game_id, None)
+                listener = _listeners.pop(game_id, None)
+                if listener is not None:
+                    listener.cancel()
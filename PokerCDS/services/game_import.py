@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Import of historical games from the CSV/XLSX game spreadsheets.
+
+Each spreadsheet line holds one player's results in one game:
+
+    data;descricao;apelido;credito;dinheiro;fichas;rango;pingo;recebido
+    05/03/2021;Quinta;Lima;2;1;412,50;5;2,50;0
+
+Rows are streamed from the file, nicknames are resolved to member ids
+through an in-memory index loaded once, and valid rows are handed to
+GameImportRepository, which COPYs them in batches. Invalid lines are
+collected in the report and never abort the import.
+
+Run from the project root:
+
+    python -m PokerCDS.services.game_import planilha.csv --dry-run
+"""
+
+import argparse
+import asyncio
+import csv
+import unicodedata
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from openpyxl import load_workbook
+from ..models.import_row import ImportReport, ImportRow, ImportRowError
+from ..repositories.game_import_repository import GameImportRepository
+from ..repositories.member_repository import MemberRepository
+from .exports import unescape_formula
+from ..utils.money import Money, ZERO_MONEY
+
+# Accepted header names (normalized) -> ImportRow field
+COLUMN_ALIASES = {
+    "data": "game_date",
+    "descricao": "description",
+    "jogo": "description",
+    "apelido": "nickname",
+    "jogador": "nickname",
+    "credito": "credit_buyin",
+    "dinheiro": "cash_buyin",
+    "fichas": "final_chips",
+    "rango": "rango",
+    "pingo": "pingo",
+    "recebido": "received_amount",
+}
+REQUIRED_COLUMNS = ("game_date", "nickname")
+DATE_FORMATS = ("%d/%m/%Y", "%d/%m/%y", "%Y-%m-%d")
+
+# Spreadsheet line number and raw values by ImportRow field
+RawRow = Tuple[int, Dict[str, Any]]
+
+
+def normalize_name(text: Any) -> str:
+    """Return a name folded for matching: no accents, case or extra spaces."""
+    decomposed = unicodedata.normalize("NFKD", str(text or ""))
+    return " ".join("".join(c for c in decomposed if not unicodedata.combining(c)).casefold().split())
+
+
+def _map_header(header: List[Any]) -> List[Optional[str]]:
+    """Map the header cells to ImportRow fields (None for unknown columns)."""
+    fields = [COLUMN_ALIASES.get(normalize_name(cell)) for cell in header]
+    missing = [column for column in REQUIRED_COLUMNS if column not in fields]
+    if missing:
+        names = {field: alias for alias, field in reversed(list(COLUMN_ALIASES.items()))}
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(names[column] for column in missing)}")
+    return fields
+
+
+def _read_csv(path: Path) -> Iterator[List[Any]]:
+    """Yield the lines of a CSV file, detecting ';' or ',' as separator."""
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        sample = file.read(4096)
+        file.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=";,\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(file, dialect)
+
+
+def _read_xlsx(path: Path) -> Iterator[List[Any]]:
+    """Yield the lines of the first sheet of an XLSX workbook."""
+    # read_only streams the sheet instead of loading every cell
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for values in workbook.worksheets[0].iter_rows(values_only=True):
+            yield list(values)
+    finally:
+        workbook.close()
+
+
+def read_rows(path: Union[str, Path]) -> Iterator[RawRow]:
+    """Stream the non-empty lines of a CSV or XLSX file as (line, values by field)."""
+    path = Path(path)
+    if path.suffix.lower() == ".xlsx":
+        lines = _read_xlsx(path)
+    elif path.suffix.lower() in (".csv", ".txt"):
+        lines = _read_csv(path)
+    else:
+        raise ValueError("Formato não suportado: use CSV ou XLSX")
+    
+    fields = _map_header(next(lines, []))
+    for line, cells in enumerate(lines, start=2):
+        if not any(str(cell).strip() for cell in cells if cell is not None):
+            continue
+        yield line, {field: cell for field, cell in zip(fields, cells) if field is not None}
+
+
+class MemberIndex:
+    """In-memory nickname/name -> member id lookup."""
+    
+    def __init__(self, members: List[Tuple[int, str, Optional[str]]]):
+        self._ids: Dict[str, Optional[int]] = {}
+        # Names only fill what no nickname claimed; a key shared by two members resolves to None
+        for position in (2, 1):
+            keys: Dict[str, Optional[int]] = {}
+            for member in members:
+                key = normalize_name(member[position])
+                if key and key not in self._ids:
+                    keys[key] = member[0] if key not in keys else None
+            self._ids.update(keys)
+    
+    def resolve(self, nickname: Any) -> int:
+        """Return the member id of a nickname or name; raise ValueError if unknown or ambiguous."""
+        key = normalize_name(nickname)
+        if key not in self._ids:
+            raise ValueError(f"Jogador não cadastrado: {nickname}")
+        member_id = self._ids[key]
+        if member_id is None:
+            raise ValueError(f"Apelido ambíguo, mais de um membro: {nickname}")
+        return member_id
+
+
+def _parse_date(value: Any) -> date:
+    """Parse a date cell (date, datetime or dd/mm/yyyy text)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            pass
+    raise ValueError(f"Data inválida: {text}")
+
+
+def _parse_count(value: Any, label: str) -> int:
+    """Parse a buy-in count cell (empty means zero)."""
+    if value in (None, ""):
+        return 0
+    try:
+        count = Decimal(str(value).strip() or "0")
+    except InvalidOperation:
+        raise ValueError(f"{label} inválido: {value}")
+    if count < 0 or count != count.to_integral_value():
+        raise ValueError(f"{label} inválido: {value}")
+    return int(count)
+
+
+def _parse_money(value: Any, label: str) -> Money:
+    """Parse a money cell: numbers are reais, text goes through Money.parse (empty means zero)."""
+    if value in (None, ""):
+        return ZERO_MONEY
+    try:
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return Money.from_decimal(Decimal(str(value)))
+        return Money.parse(str(value)) if str(value).strip() else ZERO_MONEY
+    except (ValueError, InvalidOperation):
+        raise ValueError(f"{label} inválido: {value}")
+
+
+def parse_row(line: int, values: Dict[str, Any], members: MemberIndex) -> ImportRow:
+    """Validate one spreadsheet line; raise ValueError with the reason."""
+    description = unescape_formula(str(values.get("description") or "").strip()) or None
+    return ImportRow(
+        line=line,
+        game_date=_parse_date(values.get("game_date")),
+        description=description,
+        member_id=members.resolve(unescape_formula(str(values.get("nickname") or ""))),
+        credit_buyin=_parse_count(values.get("credit_buyin"), "Crédito"),
+        cash_buyin=_parse_count(values.get("cash_buyin"), "Dinheiro"),
+        final_chips=_parse_money(values.get("final_chips"), "Fichas"),
+        rango=_parse_money(values.get("rango"), "Rango"),
+        pingo=_parse_money(values.get("pingo"), "Pingo"),
+        received_amount=_parse_money(values.get("received_amount"), "Recebido"),
+    )
+
+
+def _valid_rows(path: Union[str, Path], members: MemberIndex, report: ImportReport) -> Iterator[ImportRow]:
+    """Yield the valid rows of the file, recording the invalid ones in the report."""
+    seen: Dict[Tuple[date, Optional[str], int], int] = {}
+    games = set()
+    for line, values in read_rows(path):
+        report.rows_read += 1
+        try:
+            row = parse_row(line, values, members)
+        except ValueError as e:
+            report.errors.append(ImportRowError(line, str(e)))
+            continue
+        
+        key = (row.game_date, row.description, row.member_id)
+        if key in seen:
+            report.errors.append(ImportRowError(line, f"Jogador repetido no mesmo jogo (linha {seen[key]})"))
+            continue
+        seen[key] = line
+        games.add(key[:2])
+        report.rows_valid += 1
+        yield row
+    report.games = len(games)
+
+
+async def import_games(path: Union[str, Path], dry_run: bool = False, created_by: Optional[int] = None) -> ImportReport:
+    """
+    Import a spreadsheet of historical games.
+    With dry_run the file is only validated and nothing is written.
+    Raise ValueError if the file itself cannot be read.
+    """
+    report = ImportReport(dry_run=dry_run)
+    members = MemberIndex(await MemberRepository.list_names())
+    rows = _valid_rows(path, members, report)
+    
+    if dry_run:
+        for _ in rows:
+            pass
+    else:
+        report.games_created, report.players_imported = await GameImportRepository.bulk_import(rows, created_by)
+    return report
+
+
+def format_report(report: ImportReport) -> str:
+    """Return the report as text, one line per rejected row."""
+    lines = [
+        f"Linhas lidas: {report.rows_read}",
+        f"Linhas válidas: {report.rows_valid}",
+        f"Jogos na planilha: {report.games}",
+    ]
+    if report.dry_run:
+        lines.append("Simulação: nada foi gravado")
+    else:
+        lines.append(f"Jogos criados: {report.games_created}")
+        lines.append(f"Jogadores importados: {report.players_imported}")
+        lines.append(f"Jogadores já existentes (ignorados): {report.players_skipped}")
+    if report.errors:
+        lines.append(f"Erros ({len(report.errors)}):")
+        lines.extend(f"  linha {error.line}: {error.message}" for error in report.errors)
+    return "\n".join(lines)
+
+
+async def _import_files(paths: List[Path], dry_run: bool):
+    """Import the files one after the other, printing each report."""
+    for path in paths:
+        print(f"== {path}")
+        try:
+            report = await import_games(path, dry_run=dry_run)
+        except (OSError, ValueError) as e:
+            print(f"Erro: {e}")
+            continue
+        print(format_report(report))
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Importa jogos históricos de planilhas CSV/XLSX.")
+    parser.add_argument("files", nargs="+", type=Path, help="planilhas a importar")
+    parser.add_argument("--dry-run", action="store_true", help="apenas valida, sem gravar")
+    args = parser.parse_args()
+    asyncio.run(_import_files(args.files, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
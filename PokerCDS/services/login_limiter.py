@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sliding-window login throttling per CPF and per client IP.
+
+Each attempt is recorded in a Redis sorted set per subject (scored by
+time) before the password is checked. One Lua script trims the windows,
+checks every limit and records the attempt atomically, so a burst of
+parallel attempts cannot slip past the count. A blocked attempt never
+reaches bcrypt. A successful login clears its CPF window.
+
+Without Redis (or while it is down) the same windows are kept per
+process.
+"""
+
+import logging
+import secrets
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from redis.exceptions import RedisError
+from ..repositories.cache import get_redis_client
+
+KEY_PREFIX = "pokercds:login:"
+WINDOW_SECONDS = 5 * 60
+CPF_MAX_ATTEMPTS = 5
+IP_MAX_ATTEMPTS = 30
+LOCAL_MAX_KEYS = 10000  # bounds the per-process fallback under a CPF/IP spray
+
+logger = logging.getLogger(__name__)
+
+# KEYS: one sorted set per subject. ARGV: now (ms), window (ms), attempt id, then one limit per key.
+# Returns 0 when the attempt was recorded, otherwise the ms until the oldest blocking attempt expires.
+_SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= tonumber(ARGV[3 + i]) then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        retry_after = math.max(retry_after, tonumber(oldest[2]) + window - now)
+    end
+end
+if retry_after > 0 then
+    return retry_after
+end
+for _, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[3])
+    redis.call('PEXPIRE', key, window)
+end
+return 0
+"""
+
+_script = None
+
+# Per-process fallback: key -> attempt times (monotonic seconds), oldest first
+_local_windows: Dict[str, Deque[float]] = {}
+
+
+def _cpf_key(cpf: str) -> str:
+    """Window key of a CPF."""
+    return f"{KEY_PREFIX}cpf:{cpf}"
+
+
+def _ip_key(client_ip: str) -> str:
+    """Window key of a client IP."""
+    return f"{KEY_PREFIX}ip:{client_ip}"
+
+
+def _limits(cpf: str, client_ip: Optional[str]) -> List[Tuple[str, int]]:
+    """Return (key, max attempts) of every window an attempt counts against."""
+    limits = [(_cpf_key(cpf), CPF_MAX_ATTEMPTS)]
+    if client_ip:
+        limits.append((_ip_key(client_ip), IP_MAX_ATTEMPTS))
+    return limits
+
+
+def _acquire_local(limits: List[Tuple[str, int]]) -> float:
+    """Per-process version of the Lua script; return seconds to wait (0 when recorded)."""
+    now = time.monotonic()
+    retry_after = 0.0
+    for key, max_attempts in limits:
+        attempts = _local_windows.setdefault(key, deque())
+        while attempts and attempts[0] <= now - WINDOW_SECONDS:
+            attempts.popleft()
+        if len(attempts) >= max_attempts:
+            retry_after = max(retry_after, attempts[0] + WINDOW_SECONDS - now)
+    if retry_after > 0:
+        return retry_after
+    for key, _ in limits:
+        _local_windows[key].append(now)
+    while len(_local_windows) > LOCAL_MAX_KEYS:
+        del _local_windows[next(iter(_local_windows))]
+    return 0.0
+
+
+async def acquire_attempt(cpf: str, client_ip: Optional[str]) -> float:
+    """
+    Record a login attempt for the CPF and client IP if both are under their limits.
+    Return 0 when the attempt may proceed, otherwise the seconds until it would be allowed.
+    """
+    global _script
+    limits = _limits(cpf, client_ip)
+    redis = get_redis_client()
+    if redis is not None:
+        if _script is None:
+            _script = redis.register_script(_SLIDING_WINDOW_LUA)
+        now_ms = int(time.time() * 1000)
+        try:
+            retry_after_ms = await _script(
+                keys=[key for key, _ in limits],
+                args=[now_ms, WINDOW_SECONDS * 1000, f"{now_ms}-{secrets.token_hex(4)}", *(limit for _, limit in limits)],
+            )
+            return int(retry_after_ms) / 1000
+        except (RedisError, OSError):
+            logger.warning("Login limiter: Redis unavailable, using per-process windows", exc_info=True)
+    return _acquire_local(limits)
+
+
+async def reset_cpf(cpf: str):
+    """Forget a CPF's attempts after a successful login."""
+    key = _cpf_key(cpf)
+    _local_windows.pop(key, None)
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        await redis.delete(key)
+    except (RedisError, OSError):
+        logger.warning("Login limiter: Redis delete failed", exc_info=True)
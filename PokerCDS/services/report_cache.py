@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Content-addressed disk cache for generated report files.
+
+Files are named after a hash of the data they were generated from (for
+a game, its game_members snapshot), so any correction produces a new
+key and the stale file simply stops being asked for. Files are evicted
+least recently used first once the cache exceeds its size budget.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+
+REPORT_CACHE_DIR = Path(
+    os.environ.get("POKERCDS_REPORT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "pokercds-reports"))
+)
+REPORT_CACHE_MAX_BYTES = int(os.environ.get("POKERCDS_REPORT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Bump when a report's layout changes so cached files are not reused
+REPORT_FORMAT_VERSION = 1
+
+_lock = threading.Lock()
+_entries: Optional["OrderedDict[str, int]"] = None  # file name -> size, least recently used first
+_total_bytes = 0
+
+
+def snapshot_key(kind: str, *parts: Any) -> str:
+    """Return the cache key of a report generated from the given data."""
+    digest = hashlib.sha256(f"{REPORT_FORMAT_VERSION}|{kind}|{parts!r}".encode())
+    return f"{kind}-{digest.hexdigest()}"
+
+
+def _load_entries() -> "OrderedDict[str, int]":
+    """Index the files already on disk, oldest first (called with the lock held)."""
+    global _entries, _total_bytes
+    if _entries is None:
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        files = [(path.stat(), path.name) for path in REPORT_CACHE_DIR.iterdir() if path.is_file() and not path.name.startswith(".")]
+        files.sort(key=lambda item: item[0].st_mtime)
+        _entries = OrderedDict((name, stat.st_size) for stat, name in files)
+        _total_bytes = sum(_entries.values())
+    return _entries
+
+
+def _forget(name: str):
+    """Drop a file from the index (called with the lock held)."""
+    global _total_bytes
+    _total_bytes -= _entries.pop(name, 0)
+
+
+def get(key: str, suffix: str) -> Optional[Path]:
+    """Return the cached file for the key (marked as recently used) or None; blocking, run it off the event loop."""
+    name = f"{key}{suffix}"
+    path = REPORT_CACHE_DIR / name
+    with _lock:
+        entries = _load_entries()
+        if name not in entries:
+            return None
+        if not path.exists():  # removed by another process
+            _forget(name)
+            return None
+        entries.move_to_end(name)
+    os.utime(path)  # keeps the LRU order across restarts
+    return path
+
+
+def store(key: str, suffix: str, write: Callable[[BinaryIO], None]) -> Path:
+    """Generate the file with write() and add it to the cache; blocking, run it off the event loop."""
+    global _total_bytes
+    name = f"{key}{suffix}"
+    path = REPORT_CACHE_DIR / name
+    with _lock:
+        _load_entries()
+    
+    # Write under a temporary name so readers never see a partial file
+    fd, temp_name = tempfile.mkstemp(prefix=".", suffix=suffix, dir=REPORT_CACHE_DIR)
+    try:
+        with os.fdopen(fd, "wb") as output:
+            write(output)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    
+    with _lock:
+        _forget(name)
+        _entries[name] = path.stat().st_size
+        _total_bytes += _entries[name]
+        _evict(keep=name)
+    return path
+
+
+def _evict(keep: str):
+    """Delete least recently used files until the cache fits its budget (called with the lock held)."""
+    while _total_bytes > REPORT_CACHE_MAX_BYTES and len(_entries) > 1:
+        name = next(iter(_entries))
+        if name == keep:
+            _entries.move_to_end(name)
+            continue
+        _forget(name)
+        try:
+            (REPORT_CACHE_DIR / name).unlink()
+        except FileNotFoundError:
+            pass
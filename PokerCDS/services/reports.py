@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PDF reports drawn with reportlab.
+
+Reports are drawn directly on a canvas, one page at a time, from row
+iterables, so no flowable list of the whole document is built. The
+canvas still keeps every finished page (compressed) until save(), so a
+report's whole document is in memory while it is drawn; REPORT_WORKERS
+bounds how many are drawn at once. Drawing runs on that small thread
+pool straight into a file of the report cache, which the HTTP endpoint
+then serves from disk.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional, Sequence, Tuple
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+from . import report_cache
+from .settlement import HOUSE_ID, Transfer, settle_game
+from ..entities.game_member import BUYIN_VALUE
+from ..models.game_data import GameData
+from ..models.game_totals import GameTotals
+from ..models.player_data import PlayerData
+from ..repositories.game_member_repository import GameMemberRepository
+
+# Few workers: each running report holds its whole (compressed) document in memory until saved
+REPORT_WORKERS = 2
+
+MARGIN = 15 * mm
+ROW_HEIGHT = 6 * mm
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+HOUSE_NAME = "Caixa"
+
+_executor = ThreadPoolExecutor(max_workers=REPORT_WORKERS, thread_name_prefix="reports")
+
+# Table column: header, width in mm, alignment ("left", "right" or "center")
+Column = Tuple[str, float, str]
+
+
+class PdfReport:
+    """Report drawn straight onto a reportlab canvas, page by page (pages are kept until close)."""
+    
+    def __init__(self, output: BinaryIO, title: str, subtitle: str = ""):
+        self._canvas = canvas.Canvas(output, pagesize=A4, pageCompression=1)
+        self._canvas.setTitle(title)
+        self._title = title
+        self._subtitle = subtitle
+        self._width, self._height = A4
+        self._page = 0
+        self._y = 0.0
+        self._new_page()
+    
+    def _new_page(self):
+        """Finish the current page and start the next one with the report header."""
+        if self._page:
+            self._canvas.showPage()
+        self._page += 1
+        c = self._canvas
+        c.setFont(FONT_BOLD, 14)
+        c.drawString(MARGIN, self._height - MARGIN, self._title)
+        c.setFont(FONT, 9)
+        if self._subtitle:
+            c.drawString(MARGIN, self._height - MARGIN - 5 * mm, self._subtitle)
+        c.drawRightString(self._width - MARGIN, MARGIN / 2, f"Página {self._page}")
+        self._y = self._height - MARGIN - 14 * mm
+    
+    def _ensure_space(self, height: float) -> bool:
+        """Start a new page if height does not fit; return True if it did."""
+        if self._y - height >= MARGIN:
+            return False
+        self._new_page()
+        return True
+    
+    def _draw_cells(self, columns: Sequence[Column], values: Sequence[str], font: str):
+        """Draw one table line at the current position."""
+        c = self._canvas
+        c.setFont(font, 9)
+        x = MARGIN
+        for (_, width, align), value in zip(columns, values):
+            width *= mm
+            if align == "right":
+                c.drawRightString(x + width - 1 * mm, self._y, value)
+            elif align == "center":
+                c.drawCentredString(x + width / 2, self._y, value)
+            else:
+                c.drawString(x + 1 * mm, self._y, value)
+            x += width
+        self._y -= ROW_HEIGHT
+    
+    def _draw_header(self, columns: Sequence[Column]):
+        """Draw a table header followed by a rule."""
+        self._draw_cells(columns, [header for header, _, _ in columns], FONT_BOLD)
+        table_width = sum(width for _, width, _ in columns) * mm
+        rule_y = self._y + ROW_HEIGHT - 1.5 * mm
+        self._canvas.line(MARGIN, rule_y, MARGIN + table_width, rule_y)
+    
+    def heading(self, text: str):
+        """Draw a section heading."""
+        self._ensure_space(3 * ROW_HEIGHT)
+        self._y -= ROW_HEIGHT / 2
+        self._canvas.setFont(FONT_BOLD, 11)
+        self._canvas.drawString(MARGIN, self._y, text)
+        self._y -= ROW_HEIGHT
+    
+    def table(self, columns: Sequence[Column], rows: Iterable[Sequence[str]], footer: Optional[Sequence[str]] = None):
+        """Draw a table, repeating the header on every page it spans."""
+        self._ensure_space(2 * ROW_HEIGHT)
+        self._draw_header(columns)
+        for row in rows:
+            if self._ensure_space(ROW_HEIGHT):
+                self._draw_header(columns)
+            self._draw_cells(columns, row, FONT)
+        if footer is not None:
+            self._ensure_space(ROW_HEIGHT)
+            self._draw_cells(columns, footer, FONT_BOLD)
+    
+    def key_values(self, items: Iterable[Tuple[str, str]]):
+        """Draw label/value lines."""
+        for label, value in items:
+            self._ensure_space(ROW_HEIGHT)
+            self._draw_cells((("", 60, "left"), ("", 40, "right")), (label, value), FONT)
+    
+    def text(self, text: str):
+        """Draw a single line of text."""
+        self._ensure_space(ROW_HEIGHT)
+        self._draw_cells((("", 180, "left"),), (text,), FONT)
+    
+    def close(self):
+        """Finish the last page and write the document."""
+        self._canvas.save()
+
+
+PLAYER_COLUMNS: Sequence[Column] = (
+    ("Jogador", 44, "left"),
+    ("Créd.", 12, "center"),
+    ("Din.", 12, "center"),
+    ("Fichas", 22, "right"),
+    ("Rango", 18, "right"),
+    ("Pingo", 18, "right"),
+    ("Recebido", 22, "right"),
+    ("Saldo", 32, "right"),
+)
+
+TRANSFER_COLUMNS: Sequence[Column] = (
+    ("Paga", 70, "left"),
+    ("Recebe", 70, "left"),
+    ("Valor", 40, "right"),
+)
+
+
+def write_game_report(
+    output: BinaryIO,
+    game: GameData,
+    players: List[PlayerData],
+    totals: GameTotals,
+    transfers: List[Transfer],
+):
+    """Draw the end-of-game report: players, totals, chips difference and PIX transfers."""
+    report = PdfReport(output, "PokerCDS - Fechamento do Jogo", f"{game.display_date}  {game.description or ''}")
+    
+    report.heading("Jogadores")
+    report.table(
+        PLAYER_COLUMNS,
+        (
+            (
+                player.name,
+                str(player.credit_buyin),
+                str(player.cash_buyin),
+                player.final_chips.format(),
+                player.rango.format(),
+                player.pingo.format(),
+                player.received_amount.format(),
+                player.balance.format(),
+            )
+            for player in players
+        ),
+        footer=(
+            "TOTAL",
+            str(totals.credit_buyins),
+            str(totals.cash_buyins),
+            (totals.final_chips - totals.rango - totals.pingo).format(),
+            totals.rango.format(),
+            totals.pingo.format(),
+            totals.received.format(),
+            totals.balance.format(),
+        ),
+    )
+    
+    chips_difference = (totals.credit_buyins + totals.cash_buyins) * BUYIN_VALUE - totals.final_chips
+    report.heading("Resumo")
+    report.key_values((
+        ("Cacifes", f"{totals.credit_buyins + totals.cash_buyins} x {BUYIN_VALUE.format()}"),
+        ("Total em cacifes", ((totals.credit_buyins + totals.cash_buyins) * BUYIN_VALUE).format()),
+        ("Fichas finais (com rango e pingo)", totals.final_chips.format()),
+        ("Diferença de fichas", chips_difference.format()),
+        ("Saldo do jogo", totals.balance.format()),
+    ))
+    
+    names = {player.member_id: player.name for player in players}
+    names[HOUSE_ID] = HOUSE_NAME
+    report.heading("Acertos (PIX)")
+    if transfers:
+        report.table(
+            TRANSFER_COLUMNS,
+            (
+                (names[transfer.debtor_id], names[transfer.creditor_id], transfer.amount.format())
+                for transfer in transfers
+            ),
+        )
+    else:
+        report.text("Nenhuma transferência necessária.")
+    
+    report.close()
+
+
+async def game_report_file(game_id: int) -> Optional[Path]:
+    """
+    Return the game's PDF report file, or None if the game does not exist.
+    The file is keyed by the game's current snapshot, so it is only drawn
+    again after the game data changes.
+    """
+    game, players, totals = await GameMemberRepository.load_game_with_players(game_id)
+    if game is None:
+        return None
+    
+    loop = asyncio.get_running_loop()
+    key = report_cache.snapshot_key("game-pdf", game, players)
+    path = await loop.run_in_executor(_executor, report_cache.get, key, ".pdf")
+    if path is None:
+        transfers = settle_game({player.member_id: player.balance for player in players})
+        path = await loop.run_in_executor(
+            _executor,
+            report_cache.store,
+            key,
+            ".pdf",
+            lambda output: write_game_report(output, game, players, totals, transfers),
+        )
+    return path
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+End-of-game settlement: who pays whom, with the fewest PIX transfers.
+
+Balances are Money (integer cents) keyed by member id (positive =
+receives, negative = pays) and must add up to exactly zero.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Tuple
+from ..utils.money import Money
+
+# Tables up to this many open balances get the exact zero-sum partition pass
+EXACT_MATCH_LIMIT = 12
+
+# Pseudo member standing for the club's cash box in game settlements
+HOUSE_ID = 0
+
+
+@dataclass(slots=True, frozen=True)
+class Transfer:
+    """A single PIX transfer from a debtor to a creditor."""
+    
+    debtor_id: int
+    creditor_id: int
+    amount: Money
+
+
+def settle(balances: Mapping[int, int]) -> List[Transfer]:
+    """
+    Return the transfers that settle all balances.
+    
+    Exact debt/credit pairs are matched first. Small tables are then split
+    into the largest number of independent zero-sum groups (each group of k
+    players needs at most k - 1 transfers), and every group is settled by
+    repeatedly matching the largest creditor with the largest debtor.
+    """
+    total = 0
+    for member_id, amount in balances.items():
+        if not isinstance(amount, int):
+            raise TypeError(f"Saldo do membro {member_id} deve estar em centavos (int)")
+        total += amount
+    if total != 0:
+        raise ValueError(f"Saldos não fecham: diferença de {total} centavos")
+    
+    open_balances = [(member_id, amount) for member_id, amount in balances.items() if amount]
+    transfers, remaining = _match_exact_pairs(open_balances)
+    
+    if len(remaining) <= EXACT_MATCH_LIMIT:
+        for group in _zero_sum_groups(remaining):
+            transfers.extend(_greedy(group))
+    else:
+        transfers.extend(_greedy(remaining))
+    return transfers
+
+
+def settle_game(balances: Mapping[int, int]) -> List[Transfer]:
+    """
+    Settle a game's player balances against the cash box (HOUSE_ID).
+    The box takes whatever the players do not cover among themselves:
+    cash buy-ins it already holds and any chips difference.
+    """
+    house = -sum(balances.values())
+    return settle({**balances, HOUSE_ID: house})
+
+
+def _match_exact_pairs(entries: List[Tuple[int, int]]) -> Tuple[List[Transfer], List[Tuple[int, int]]]:
+    """Settle every debtor whose debt equals some creditor's credit with one transfer."""
+    creditors_by_amount: Dict[int, List[int]] = {}
+    for member_id, amount in entries:
+        if amount > 0:
+            creditors_by_amount.setdefault(amount, []).append(member_id)
+    
+    transfers = []
+    remaining = []
+    for member_id, amount in entries:
+        if amount < 0:
+            candidates = creditors_by_amount.get(-amount)
+            if candidates:
+                transfers.append(Transfer(member_id, candidates.pop(), Money(-amount)))
+                continue
+            remaining.append((member_id, amount))
+    
+    for amount, member_ids in creditors_by_amount.items():
+        remaining.extend((member_id, amount) for member_id in member_ids)
+    return transfers, remaining
+
+
+def _zero_sum_groups(entries: List[Tuple[int, int]]) -> List[List[Tuple[int, int]]]:
+    """Split entries into the maximum number of disjoint zero-sum groups."""
+    if len(entries) < 3:
+        return [entries] if entries else []
+    
+    # sums[mask] = sum of the amounts whose bits are set in mask
+    sums = [0]
+    for _, amount in entries:
+        sums += [s + amount for s in sums]
+    full = len(sums) - 1
+    
+    # Zero-sum masks ordered by size; a zero-sum subset of a zero-sum set
+    # leaves a zero-sum complement, so groups form a chain of nested masks.
+    zero_masks = [mask for mask, s in enumerate(sums) if s == 0 and mask]
+    zero_masks.sort(key=int.bit_count)
+    by_depth: List[List[int]] = [[]]
+    inner: Dict[int, int] = {}
+    for mask in zero_masks:
+        depth, sub = 1, 0
+        for level in range(len(by_depth) - 1, 0, -1):
+            sub = next((m for m in by_depth[level] if m & mask == m and m != mask), 0)
+            if sub:
+                depth = level + 1
+                break
+        if depth == len(by_depth):
+            by_depth.append([])
+        by_depth[depth].append(mask)
+        inner[mask] = sub
+    
+    groups = []
+    mask = full
+    while mask:
+        sub = inner[mask]
+        diff = mask ^ sub
+        groups.append([entries[i] for i in range(len(entries)) if diff >> i & 1])
+        mask = sub
+    return groups
+
+
+def _greedy(entries: Iterable[Tuple[int, int]]) -> List[Transfer]:
+    """Match the largest creditor with the largest debtor until all balances close."""
+    creditors = []
+    debtors = []
+    for member_id, amount in entries:
+        if amount > 0:
+            creditors.append((-amount, member_id))
+        elif amount < 0:
+            debtors.append((amount, member_id))
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+    
+    transfers = []
+    while creditors and debtors:
+        credit, creditor_id = heapq.heappop(creditors)
+        debt, debtor_id = heapq.heappop(debtors)
+        amount = min(-credit, -debt)
+        transfers.append(Transfer(debtor_id, creditor_id, Money(amount)))
+        if -credit > amount:
+            heapq.heappush(creditors, (credit + amount, creditor_id))
+        if -debt > amount:
+            heapq.heappush(debtors, (debt + amount, debtor_id))
+    return transfers
@@ -7,7 +7,6 @@ Authentication state management.
 
 import reflex as rx
 from typing import Optional
-from ..utils.timezone import now
 from ..models.user_data import UserData
 
 
@@ -72,19 +71,6 @@ class AuthState(rx.State):
         self.is_admin = False
         return rx.redirect("/")
 
-    def debug_print_state(self, more_info: str | None = ""):
-        """Print all auth state variables for debugging."""
-        current_time = now().strftime("%Y-%m-%d %H:%M:%S %Z")
-        print(f"=== AUTH STATE DEBUG - {current_time} ==={more_info}")
-        print(f"user_id: {self.user_id}")
-        print(f"user_name: '{self.user_name}'")
-        print(f"user_nickname: '{self.user_nickname}'")
-        print(f"user_email: '{self.user_email}'")
-        print(f"is_admin: {self.is_admin}")
-        print(f"user_display_name: '{self.user_display_name}'")
-        print(f"user_display_initials: '{self.user_display_initials}'")
-        print("=" * 50)
-        
     def require_auth(self):
         """Redirect to login if not authenticated."""
         if not self.user_id:
@@ -7,8 +7,47 @@ Game buyins state management.
 
 import reflex as rx
 import asyncio
-from decimal import Decimal
-from typing import List, Optional
+from reflex.utils.prerequisites import get_and_validate_app
+from rxconfig import config
+from typing import Dict, List, Optional, Tuple
+from ..entities.buyin_event import EVENT_BUYIN, EVENT_CASH_OUT, EVENT_CORRECTION, EVENT_FIELDS
+from ..entities.game_member import BUYIN_VALUE
+from ..models.game_data import GameData
+from ..models.game_totals import GameTotals
+from ..models.player_data import PlayerData
+from ..repositories.buyin_event_repository import BuyinEventRepository, VersionConflict
+from ..repositories.game_member_repository import GameMemberRepository
+from ..repositories.game_repository import GameRepository
+from ..api import game_report_path
+from ..services.game_changes import RESYNC, subscribe_game
+from ..utils.signed_url import sign_path
+from ..utils.money import Money
+from .auth_state import AuthState
+
+
+# Rows patched since the last full send of players (one row_patch_<n> var each); past this the patches are folded back in
+ROW_PATCH_LIMIT = 8
+
+# Live sync: how often an idle watcher checks the page is still open, and when it gives up
+WATCH_CHECK_SECONDS = 60
+WATCH_IDLE_SECONDS = 6 * 60 * 60
+WATCH_MAX_SECONDS = 12 * 60 * 60  # hard limit, even on a game that keeps changing
+
+# Field names shown when a concurrent edit has to be reviewed
+FIELD_LABELS = {
+    "credit_buyin": "cacifes a crédito",
+    "cash_buyin": "cacifes em dinheiro",
+    "final_chips": "fichas finais",
+    "rango": "rango",
+    "pingo": "pingo",
+    "received_amount": "valor recebido",
+}
+
+
+def _is_connected(client_token: str) -> bool:
+    """Return True while the client's websocket is connected to this backend (closed tabs stop their watchers)."""
+    namespace = get_and_validate_app().app.event_namespace
+    return namespace is None or client_token in namespace.token_to_sid
 
 
 class GameBuyinsState(rx.State):
@@ -18,9 +57,23 @@ class GameBuyinsState(rx.State):
     current_game_id: Optional[int] = None
     game_date: str = ""
     game_description: str = ""
+    game_closed: bool = False
     
-    # Players data
+    # Players data: players is sent on load, later changes go out as per-row patches.
+    # Each patched row gets its own slot var, so an event's delta carries only the rows it changed.
     players: List[dict] = []
+    row_patch_0: dict = {}
+    row_patch_1: dict = {}
+    row_patch_2: dict = {}
+    row_patch_3: dict = {}
+    row_patch_4: dict = {}
+    row_patch_5: dict = {}
+    row_patch_6: dict = {}
+    row_patch_7: dict = {}
+    _patch_slots: Dict[int, int] = {}  # player id -> row_patch_<n> holding its row
+    _players: Dict[int, dict] = {}  # player id -> current row (source of truth)
+    _watch_generation: int = 0  # bumped on each load so older watchers stop
+    _edit_base: dict = {}  # player row as it was when the modal or inline edit was opened
     
     # Form fields for editing player
     editing_player_id: Optional[int] = None
@@ -40,12 +93,12 @@ class GameBuyinsState(rx.State):
     error_message: str = ""
     success_message: str = ""
     
-    # Totals (calculated)
+    # Totals (calculated, money in cents)
     total_credit_buyins: int = 0
     total_cash_buyins: int = 0
-    total_final_chips: Decimal = Decimal('0.00')
-    total_received: Decimal = Decimal('0.00')
-    total_balance: Decimal = Decimal('0.00')
+    total_final_chips: int = 0
+    total_received: int = 0
+    total_balance: int = 0
     
     # Inline editing states
     editing_cell: str = ""  # Format: "player_id:field_name"
@@ -54,51 +107,21 @@ class GameBuyinsState(rx.State):
     @rx.var
     def total_balance_color(self) -> str:
         """Return color for total balance."""
-        return "green" if float(self.total_balance) >= 0 else "red"
+        return "green" if self.total_balance >= 0 else "red"
     
     @rx.var
     def chips_difference_color(self) -> str:
         """Return color for chips difference calculation."""
-        chips_difference = self.chips_difference_value
-        color = "red" if float(chips_difference) < 0 else "blue"
-        print (f"Color: {color}")
-        return color
+        return "red" if self.chips_difference_value < 0 else "blue"
 
     @rx.var
-    def chips_difference_value(self) -> Decimal:
-        """Calculate chips difference: (total cred + total cash) * 50 - total final chips."""
-        total_buyins_value = (self.total_credit_buyins + self.total_cash_buyins) * Decimal('50.00')
+    def chips_difference_value(self) -> int:
+        """Calculate chips difference in cents: (total cred + total cash) * 50 - total final chips."""
+        total_buyins_value = (self.total_credit_buyins + self.total_cash_buyins) * BUYIN_VALUE
         return total_buyins_value - self.total_final_chips
 
-    @rx.var
-    def players_with_edit_states(self) -> List[dict]:
-        """Return players with calculated balance and edit states."""
-        result = []
-        for player in self.players:
-            player_copy = player.copy()
-            total_buyins = player["credit_buyin"] * 50.00
-            balance = (
-                float(player["final_chips"]) + 
-                float(player["rango"]) + 
-                float(player["pingo"]) - 
-                float(player["received_amount"]) - 
-                total_buyins
-            )
-            player_copy["calculated_balance"] = balance
-            player_copy["balance_color"] = "green.600" if balance >= 0 else "red.600"
-            
-            # Add edit states for each field
-            player_id = player["id"]
-            player_copy["editing_final_chips"] = self.editing_cell == f"{player_id}:final_chips"
-            player_copy["editing_rango"] = self.editing_cell == f"{player_id}:rango"
-            player_copy["editing_pingo"] = self.editing_cell == f"{player_id}:pingo"
-            player_copy["editing_received_amount"] = self.editing_cell == f"{player_id}:received_amount"
-            
-            result.append(player_copy)
-        return result
-    
     async def load_game_data(self):
-        """Load game and players data using router state."""
+        """Pick the game from the router; watch_game then loads its data and follows changes."""
         # Get game_id from router
         game_id = self.router.page.params.get("game_id")
         if not game_id:
@@ -114,113 +137,290 @@ class GameBuyinsState(rx.State):
             return
             
         self.current_game_id = game_id
+        self._watch_generation += 1
         self.is_loading = True
         self.error_message = ""
+    
+    def _apply_game(self, game: Optional[GameData], players: List[PlayerData], totals: GameTotals):
+        """Replace the page data with the game as loaded."""
+        if game is None:
+            self.error_message = "Jogo não encontrado"
+            return
         
-        try:
-            # TODO: Replace with actual database query
-            await asyncio.sleep(0.5)
-            
-            # Mock game data
-            self.game_date = "24/04/2025"
-            self.game_description = "Jogo de sexta-feira"
-            
-            # Mock players data based on the spreadsheet
-            mock_players = [
-                {
-                    "id": 1,
-                    "member_id": 1,
-                    "name": "thats",
-                    "credit_buyin": 2,
-                    "cash_buyin": 0,
-                    "final_chips": Decimal('140.00'),
-                    "received_amount": Decimal('0.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-                {
-                    "id": 2,
-                    "member_id": 2,
-                    "name": "didi",
-                    "credit_buyin": 8,
-                    "cash_buyin": 0,
-                    "final_chips": Decimal('80.00'),
-                    "received_amount": Decimal('0.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-                {
-                    "id": 3,
-                    "member_id": 3,
-                    "name": "arrudao",
-                    "credit_buyin": 3,
-                    "cash_buyin": 0,
-                    "final_chips": Decimal('0.00'),
-                    "received_amount": Decimal('0.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-                {
-                    "id": 4,
-                    "member_id": 4,
-                    "name": "jassa",
-                    "credit_buyin": 1,
-                    "cash_buyin": 0,
-                    "final_chips": Decimal('100.00'),
-                    "received_amount": Decimal('0.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-                {
-                    "id": 5,
-                    "member_id": 5,
-                    "name": "pedrinho",
-                    "credit_buyin": 0,
-                    "cash_buyin": 2,
-                    "final_chips": Decimal('280.00'),
-                    "received_amount": Decimal('100.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-                {
-                    "id": 6,
-                    "member_id": 6,
-                    "name": "vg",
-                    "credit_buyin": 0,
-                    "cash_buyin": 1,
-                    "final_chips": Decimal('250.00'),
-                    "received_amount": Decimal('50.00'),
-                    "rango": Decimal('0.00'),
-                    "pingo": Decimal('0.00'),
-                },
-            ]
-            
-            self.players = mock_players
-            self._calculate_totals()
+        self.game_date = game.display_date
+        self.game_description = game.description or ""
+        self.game_closed = game.is_closed
+        self._players = {
+            player.member_id: self._with_balance(player.to_dict()) for player in players
+        }
+        self._send_all_rows()
+        self._apply_totals(totals)
+    
+    def _apply_totals(self, totals: GameTotals):
+        """Set game totals computed by the database."""
+        self.total_credit_buyins = totals.credit_buyins
+        self.total_cash_buyins = totals.cash_buyins
+        self.total_final_chips = totals.final_chips
+        self.total_received = totals.received
+        self.total_balance = totals.balance
+    
+    def _find_player(self, player_id: int) -> Optional[dict]:
+        """Return the current row of the player with the given id."""
+        return self._players.get(player_id)
+    
+    def _send_all_rows(self):
+        """Send the whole table once and drop the row patches it now includes."""
+        self.players = [dict(player) for player in self._players.values()]
+        for slot in self._patch_slots.values():
+            setattr(self, f"row_patch_{slot}", {})
+        self._patch_slots = {}
+    
+    def _send_row(self, player_id: int):
+        """Send only this player's row to the client, in its patch slot over players."""
+        slot = self._patch_slots.get(player_id)
+        if slot is None:
+            if len(self._patch_slots) >= ROW_PATCH_LIMIT:
+                self._send_all_rows()
+                return
+            slot = len(self._patch_slots)
+            self._patch_slots[player_id] = slot
+        setattr(self, f"row_patch_{slot}", dict(self._players[player_id]))
+    
+    @rx.event(background=True)
+    async def watch_game(self):
+        """
+        Load the game, then apply changes made by other admins as they are committed (LISTEN/NOTIFY).
+        The subscription starts before the load, so no change can fall in between. Queries run
+        outside the state lock, which is only held to apply their results.
+        """
+        async with self:
+            game_id = self.current_game_id
+            generation = self._watch_generation
+            if game_id is None or self.router.page.params.get("game_id") != str(game_id):
+                return
+        
+        async with subscribe_game(game_id) as changes:
+            try:
+                game, players, totals = await GameMemberRepository.load_game_with_players(game_id)
+            except Exception as e:
+                async with self:
+                    if self._watch_generation == generation:
+                        self.error_message = f"Erro ao carregar dados do jogo: {str(e)}"
+                        self.is_loading = False
+                return
+            async with self:
+                if self._watch_generation != generation:
+                    return
+                self._apply_game(game, players, totals)
+                self.is_loading = False
+            if game is None:
+                return
             
-        except Exception as e:
-            self.error_message = f"Erro ao carregar dados do jogo: {str(e)}"
+            loop = asyncio.get_running_loop()
+            started = last_change = loop.time()
+            disconnected_since = None
+            while (
+                loop.time() - last_change < WATCH_IDLE_SECONDS
+                and loop.time() - started < WATCH_MAX_SECONDS
+            ):
+                member_ids = set()
+                try:
+                    member_ids.add(await asyncio.wait_for(changes.get(), WATCH_CHECK_SECONDS))
+                    while not changes.empty():
+                        member_ids.add(changes.get_nowait())
+                except asyncio.TimeoutError:
+                    pass
+                
+                if RESYNC in member_ids:  # the listener reconnected and may have missed changes
+                    reloaded = await GameMemberRepository.load_game_with_players(game_id)
+                else:
+                    fresh_rows = await GameMemberRepository.load_players(game_id, member_ids)
+                async with self:
+                    # A closed tab keeps its route: stop once the client has been gone for a whole check
+                    if _is_connected(self.router.session.client_token):
+                        disconnected_since = None
+                    elif disconnected_since is None:
+                        disconnected_since = loop.time()
+                    if (
+                        self._watch_generation != generation
+                        or self.router.page.params.get("game_id") != str(game_id)
+                        or (disconnected_since is not None and loop.time() - disconnected_since >= WATCH_CHECK_SECONDS)
+                    ):
+                        return
+                    if RESYNC in member_ids:
+                        self._apply_game(*reloaded)
+                    else:
+                        for member_id in member_ids:
+                            self._apply_fresh_row(member_id, fresh_rows.get(member_id))
+                if member_ids:
+                    last_change = loop.time()
+    
+    async def _refresh_player(self, player_id: int):
+        """Re-read one player from the database and apply whatever changed (our own writes diff to nothing)."""
+        fresh = await GameMemberRepository.load_player(self.current_game_id, player_id)
+        self._apply_fresh_row(player_id, fresh)
+    
+    def _apply_fresh_row(self, player_id: int, fresh: Optional[PlayerData]):
+        """Bring a player's row (and the totals) to the row as stored; None means the player left the game."""
+        is_new = player_id not in self._players
+        if fresh is None and is_new:
+            return
+        if is_new:
+            self._players[player_id] = self._with_balance(
+                {**fresh.to_dict(), **{field: 0 for field in EVENT_FIELDS}}
+            )
+        
+        target = fresh.to_dict() if fresh is not None else {field: 0 for field in EVENT_FIELDS}
+        diffs = self._player_diffs(player_id, {field: target[field] for field in EVENT_FIELDS})
+        if fresh is not None and fresh.version != self._players[player_id]["version"]:
+            self._players[player_id]["version"] = fresh.version
+        if diffs:
+            self._apply_player_diffs(player_id, diffs)
+        
+        if fresh is None:
+            del self._players[player_id]
+        if fresh is None or is_new:
+            self._send_all_rows()
+    
+    def _player_diffs(self, player_id: int, changes: dict) -> dict:
+        """Return the non-zero differences between new field values and the player's current ones."""
+        player = self._find_player(player_id)
+        if player is None:
+            return {}
+        diffs = {}
+        for field, value in changes.items():
+            diff = value - player[field]
+            if diff:
+                diffs[field] = diff
+        return diffs
+    
+    def _apply_player_diffs(self, player_id: int, diffs: dict):
+        """Apply field differences to a player and adjust the totals by the same amounts."""
+        player = self._find_player(player_id)
+        if player is None:
+            return
+        
+        for field, diff in diffs.items():
+            player[field] += diff
             
-        finally:
-            self.is_loading = False
+            if field == "credit_buyin":
+                self.total_credit_buyins += diff
+                self.total_balance -= diff * BUYIN_VALUE
+            elif field == "cash_buyin":
+                self.total_cash_buyins += diff
+                self.total_balance -= diff * BUYIN_VALUE
+            elif field == "received_amount":
+                self.total_received += diff
+                self.total_balance += diff
+            else:  # final_chips, rango and pingo all count as final chips
+                self.total_final_chips += diff
+                self.total_balance += diff
+        
+        self._with_balance(player)
+        self._send_row(player_id)
     
-    def _calculate_totals(self):
-        """Calculate totals for the game."""
-        total_rango = sum(p["rango"] for p in self.players)
-        total_pingo = sum(p["pingo"] for p in self.players)
-        self.total_credit_buyins = sum(p["credit_buyin"] for p in self.players)
-        self.total_cash_buyins = sum(p["cash_buyin"] for p in self.players)
-        self.total_final_chips = sum(p["final_chips"] for p in self.players) + total_rango + total_pingo
-        self.total_received = sum(p["received_amount"] for p in self.players)
+    async def _record_diffs(self, player_id: int, kind: str, diffs: dict, expected_version: Optional[int] = None):
+        """Record the differences as a buy-in ledger event, then apply them locally."""
+        auth_state = await self.get_state(AuthState)
+        version = await BuyinEventRepository.append(
+            self.current_game_id, player_id, kind, diffs,
+            created_by=auth_state.user_id, expected_version=expected_version,
+        )
         
-        # Calculate total balance (should be close to zero in a balanced game)
-        total_buyins_value = (self.total_credit_buyins + self.total_cash_buyins) * Decimal('50.00')
-        self.total_balance = self.total_final_chips + self.total_received - total_buyins_value
-    
-    def _calculate_player_balance(self, player: dict) -> Decimal:
-        """Calculate individual player balance."""
-        total_buyins = (player["credit_buyin"] + player["cash_buyin"]) * Decimal('50.00')
-        return (
+        player = self._find_player(player_id)
+        if player is not None and version == player["version"] + 1:
+            player["version"] = version
+            self._apply_player_diffs(player_id, diffs)
+        else:  # another admin's change landed in between; take the row as stored
+            await self._refresh_player(player_id)
+    
+    async def _save_player_changes(
+        self, player_id: int, kind: str, changes: dict, expected_version: Optional[int] = None
+    ):
+        """Record new field values as a ledger event (compare-and-swap when expected_version is given)."""
+        diffs = self._player_diffs(player_id, changes)
+        if diffs:
+            await self._record_diffs(player_id, kind, diffs, expected_version)
+    
+    async def _save_edit(self, player_id: int, kind: str, changes: dict) -> Tuple[dict, List[str]]:
+        """
+        Save values edited from _edit_base, only if the row is still at that version.
+        On a concurrent change the edit is merged with the fresh row and retried; fields
+        changed on both sides are returned (with the merged values) for the admin to review.
+        """
+        for _ in range(2):
+            base = self._edit_base
+            try:
+                await self._save_player_changes(player_id, kind, changes, expected_version=base["version"])
+                return changes, []
+            except VersionConflict as conflict:
+                self._apply_fresh_row(player_id, conflict.player)
+                if conflict.player is None:
+                    raise
+                fresh = self._find_player(player_id)
+                self._edit_base = dict(fresh)
+                changes, clashes = self._merge_edit(base, changes, fresh)
+                if clashes:
+                    return changes, clashes
+        return changes, list(changes)
+    
+    @staticmethod
+    def _merge_edit(base: dict, mine: dict, theirs: dict) -> Tuple[dict, List[str]]:
+        """Three-way merge of edited values; return the merged values and the fields both sides changed."""
+        merged, clashes = {}, []
+        for field, value in mine.items():
+            if value == base[field]:
+                merged[field] = theirs[field]
+            else:
+                merged[field] = value
+                if theirs[field] not in (base[field], value):
+                    clashes.append(field)
+        return merged, clashes
+    
+    @staticmethod
+    def _conflict_message(clashes: List[str]) -> str:
+        """Message asking the admin to review fields changed concurrently."""
+        fields = ", ".join(FIELD_LABELS[field] for field in clashes)
+        return f"Outro administrador alterou {fields} deste jogador. Confira os valores e salve novamente."
+    
+    async def _change_buyin(self, player_id: int, field: str, step: int):
+        """Buy (step 1) or remove (step -1) a single buy-in, applied as an atomic increment."""
+        player = self._find_player(player_id)
+        if player is None or player[field] + step < 0:
+            return
+        
+        # A tap is a delta, never a compare-and-swap: it only conflicts when the fresh
+        # row cannot take it (removing a buy-in the player no longer has)
+        kind = EVENT_BUYIN if step > 0 else EVENT_CORRECTION
+        for _ in range(2):
+            try:
+                await self._record_diffs(player_id, kind, {field: step})
+                return
+            except VersionConflict as conflict:
+                self._apply_fresh_row(player_id, conflict.player)
+                player = self._find_player(player_id)
+                if player is None:
+                    self.error_message = "O jogador não está mais neste jogo"
+                    return
+                if player[field] + step < 0:
+                    self.error_message = "O jogador não tem cacife para remover"
+                    return
+            except Exception as e:
+                self.error_message = f"Erro ao salvar dados: {str(e)}"
+                return
+        self.error_message = "Não foi possível salvar o cacife. Tente novamente."
+    
+    def _with_balance(self, player: dict) -> dict:
+        """Store the player's derived balance fields on the row; refreshed only when the row changes."""
+        balance = self._calculate_player_balance(player)
+        player["calculated_balance"] = balance
+        player["balance_color"] = "green.600" if balance >= 0 else "red.600"
+        return player
+    
+    def _calculate_player_balance(self, player: dict) -> Money:
+        """Calculate individual player balance (cash buy-ins are already paid)."""
+        total_buyins = player["credit_buyin"] * BUYIN_VALUE
+        return Money(
             player["final_chips"] + 
             player["rango"] + 
             player["pingo"] - 
@@ -230,15 +430,23 @@ class GameBuyinsState(rx.State):
     
     def open_edit_modal(self, player: dict):
         """Open edit modal for player."""
+        player = self._find_player(player["id"])
+        if player is None:
+            return
         self.editing_player_id = player["id"]
-        self.credit_buyin = player["credit_buyin"]
-        self.cash_buyin = player["cash_buyin"]
-        self.final_chips = str(player["final_chips"])
-        self.received_amount = str(player["received_amount"])
-        self.rango = str(player["rango"])
-        self.pingo = str(player["pingo"])
+        self._edit_base = dict(player)
+        self._fill_edit_form(player)
         self.show_edit_modal = True
     
+    def _fill_edit_form(self, values: dict):
+        """Put player values into the edit form fields."""
+        self.credit_buyin = values["credit_buyin"]
+        self.cash_buyin = values["cash_buyin"]
+        self.final_chips = str(Money(values["final_chips"]))
+        self.received_amount = str(Money(values["received_amount"]))
+        self.rango = str(Money(values["rango"]))
+        self.pingo = str(Money(values["pingo"]))
+    
     def close_edit_modal(self):
         """Close edit modal."""
         self.show_edit_modal = False
@@ -293,11 +501,11 @@ class GameBuyinsState(rx.State):
             return False
         
         try:
-            Decimal(self.final_chips)
-            Decimal(self.received_amount)
-            Decimal(self.rango)
-            Decimal(self.pingo)
-        except:
+            Money.parse(self.final_chips)
+            Money.parse(self.received_amount)
+            Money.parse(self.rango)
+            Money.parse(self.pingo)
+        except ValueError:
             self.error_message = "Valores monetários devem ser numéricos válidos"
             return False
         
@@ -312,21 +520,19 @@ class GameBuyinsState(rx.State):
             if not self._validate_form():
                 return
             
-            # TODO: Implement database update
-            await asyncio.sleep(0.5)
-            
-            # Update player in local data
-            for player in self.players:
-                if player["id"] == self.editing_player_id:
-                    player["credit_buyin"] = self.credit_buyin
-                    player["cash_buyin"] = self.cash_buyin
-                    player["final_chips"] = Decimal(self.final_chips)
-                    player["received_amount"] = Decimal(self.received_amount)
-                    player["rango"] = Decimal(self.rango)
-                    player["pingo"] = Decimal(self.pingo)
-                    break
+            merged, clashes = await self._save_edit(self.editing_player_id, EVENT_CORRECTION, {
+                "credit_buyin": self.credit_buyin,
+                "cash_buyin": self.cash_buyin,
+                "final_chips": Money.parse(self.final_chips),
+                "received_amount": Money.parse(self.received_amount),
+                "rango": Money.parse(self.rango),
+                "pingo": Money.parse(self.pingo),
+            })
+            if clashes:
+                self._fill_edit_form(merged)
+                self.error_message = self._conflict_message(clashes)
+                return
             
-            self._calculate_totals()
             self.success_message = "Dados do jogador atualizados com sucesso!"
             self.close_edit_modal()
             
@@ -338,47 +544,63 @@ class GameBuyinsState(rx.State):
     
     async def increment_credit_buyin(self, player_id: int):
         """Increment credit buyin for a player."""
-        for player in self.players:
-            if player["id"] == player_id:
-                player["credit_buyin"] += 1
-                break
-        self._calculate_totals()
+        await self._change_buyin(player_id, "credit_buyin", 1)
         
     async def decrement_credit_buyin(self, player_id: int):
         """Decrement credit buyin for a player."""
-        for player in self.players:
-            if player["id"] == player_id:
-                if player["credit_buyin"] > 0:
-                    player["credit_buyin"] -= 1
-                break
-        self._calculate_totals()
+        await self._change_buyin(player_id, "credit_buyin", -1)
         
     async def increment_cash_buyin(self, player_id: int):
         """Increment cash buyin for a player."""
-        for player in self.players:
-            if player["id"] == player_id:
-                player["cash_buyin"] += 1
-                break
-        self._calculate_totals()
+        await self._change_buyin(player_id, "cash_buyin", 1)
         
     async def decrement_cash_buyin(self, player_id: int):
         """Decrement cash buyin for a player."""
-        for player in self.players:
-            if player["id"] == player_id:
-                if player["cash_buyin"] > 0:
-                    player["cash_buyin"] -= 1
-                break
-        self._calculate_totals()
+        await self._change_buyin(player_id, "cash_buyin", -1)
+    
+    async def close_game(self):
+        """Close the game and refresh its players' lifetime statistics (again after a correction)."""
+        auth_state = await self.get_state(AuthState)
+        if not auth_state.is_admin:
+            self.error_message = "Apenas administradores podem encerrar jogos"
+            return
+        
+        self.is_saving = True
+        self.error_message = ""
+        try:
+            if not await GameRepository.close_game(self.current_game_id):
+                self.error_message = "Jogo não encontrado"
+                return
+            self.game_closed = True
+            self.success_message = "Jogo encerrado e estatísticas atualizadas!"
+            
+        except Exception as e:
+            self.error_message = f"Erro ao encerrar jogo: {str(e)}"
+            
+        finally:
+            self.is_saving = False
+    
+    async def download_report(self):
+        """Open the game's PDF report through a short-lived signed link."""
+        auth_state = await self.get_state(AuthState)
+        if not auth_state.user_id or self.current_game_id is None:
+            return
+        url = f"{config.api_url}{sign_path(game_report_path(self.current_game_id))}"
+        return rx.redirect(url, is_external=True)
     
     def clear_messages(self):
         """Clear error and success messages."""
         self.error_message = ""
         self.success_message = ""
     
-    def start_inline_edit(self, player_id: int, field_name: str, current_value: str):
+    def start_inline_edit(self, player_id: int, field_name: str):
         """Start inline editing for a cell."""
+        player = self._find_player(player_id)
+        if player is None:
+            return
         self.editing_cell = f"{player_id}:{field_name}"
-        self.editing_value = str(current_value)
+        self.editing_value = str(Money(player[field_name]))
+        self._edit_base = dict(player)
     
     def cancel_inline_edit(self):
         """Cancel inline editing."""
@@ -394,20 +616,20 @@ class GameBuyinsState(rx.State):
         try:
             # Validate the value
             if field_name in ["final_chips", "received_amount", "rango", "pingo"]:
-                decimal_value = Decimal(self.editing_value)
-                if decimal_value < 0:
+                value = Money.parse(self.editing_value)
+                if value < 0:
                     self.error_message = "Valor não pode ser negativo"
                     return
             
-            # Update the player data
-            for player in self.players:
-                if player["id"] == player_id:
-                    if field_name in ["final_chips", "received_amount", "rango", "pingo"]:
-                        player[field_name] = Decimal(self.editing_value)
-                    break
-            
-            # Recalculate totals
-            self._calculate_totals()
+            # Update the player data and totals
+            if field_name in ["final_chips", "received_amount", "rango", "pingo"]:
+                merged, clashes = await self._save_edit(
+                    player_id, EVENT_CASH_OUT, {field_name: value}
+                )
+                if clashes:
+                    self.editing_value = str(Money(merged[field_name]))
+                    self.error_message = self._conflict_message(clashes)
+                    return
             
             # Clear editing state
             self.editing_cell = ""
@@ -415,3 +637,6 @@ class GameBuyinsState(rx.State):
             
         except (ValueError, TypeError):
             self.error_message = "Valor inválido"
+            
+        except Exception as e:
+            self.error_message = f"Erro ao salvar dados: {str(e)}"
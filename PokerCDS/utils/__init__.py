@@ -8,4 +8,4 @@ This package contains utility modules and helper functions.
 """
 
 __version__ = "1.0.0"
-__all__ = ["timezone", "now", "utc_to_sao_paulo", "sao_paulo_to_utc", "SAO_PAULO_TZ", "password", "hash_password", "verify_password"]
+__all__ = ["timezone", "now", "utc_to_sao_paulo", "sao_paulo_to_utc", "SAO_PAULO_TZ", "password", "hash_password", "verify_password", "hash_password_async", "verify_password_async", "password_queue_depth", "calibrate_rounds", "calibrate_rounds_async", "needs_rehash", "money", "Money", "ZERO_MONEY", "signed_url", "sign_path", "verify_path", "cpf", "normalize_cpf", "is_valid_cpf", "metrics", "render_metrics", "current_event", "query_recorder", "record_queries", "assert_max_queries"]
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPF normalization and check-digit validation.
+
+CPFs are stored as their 11 ASCII digits, so a normalized CPF can be
+compared to members.cpf directly and the lookup uses ix_members_cpf.
+"""
+
+import re
+
+CPF_LENGTH = 11
+
+# Only ASCII digits: str.isdigit() also accepts characters such as '²'
+_NON_DIGITS = re.compile(r"[^0-9]+")
+
+
+def normalize_cpf(text: str) -> str:
+    """Return the digits of a CPF typed with or without punctuation ('123.456.789-09')."""
+    if text.isdecimal() and text.isascii():
+        return text
+    return _NON_DIGITS.sub("", text)
+
+
+def is_valid_cpf(cpf: str) -> bool:
+    """Check a normalized CPF: 11 digits, not all equal, with matching check digits."""
+    if len(cpf) != CPF_LENGTH or not (cpf.isdecimal() and cpf.isascii()) or cpf == cpf[0] * CPF_LENGTH:
+        return False
+    digits = [ord(c) - 48 for c in cpf]
+    for position in (9, 10):
+        total = sum(digit * weight for digit, weight in zip(digits, range(position + 1, 1, -1)))
+        if total * 10 % 11 % 10 != digits[position]:
+            return False
+    return True
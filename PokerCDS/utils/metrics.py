@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+In-process histograms rendered in the Prometheus text format.
+
+EventRecord collects what one Reflex event costs while it runs. It is
+kept in a context variable, so the engine hooks can add database time
+to the event that issued the query, even from SQLAlchemy's greenlets
+or a background task started by the event.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds (le) of the histogram buckets
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Cumulative histogram with one label (e.g. the event handler)."""
+    
+    def __init__(self, name: str, help_text: str, label: str, buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # label value -> (per-bucket counts including +Inf, sum)
+        self._series: Dict[str, Tuple[List[int], List[float]]] = {}
+    
+    def observe(self, label_value: str, value: float):
+        """Record one observation."""
+        with self._lock:
+            counts, total = self._series.setdefault(label_value, ([0] * (len(self.buckets) + 1), [0.0]))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+    
+    def render(self) -> List[str]:
+        """Return the exposition lines of the histogram."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(value, list(counts), total[0]) for value, (counts, total) in sorted(self._series.items())]
+        for value, counts, total in series:
+            label = f'{self.label}="{_escape(value)}"'
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label}}} {total}")
+            lines.append(f"{self.name}_count{{{label}}} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+EVENT_SECONDS = Histogram(
+    "pokercds_event_duration_seconds", "Wall time of Reflex event handlers.", "handler", SECONDS_BUCKETS
+)
+EVENT_DB_SECONDS = Histogram(
+    "pokercds_event_db_seconds", "Database time spent inside Reflex event handlers.", "handler", SECONDS_BUCKETS
+)
+EVENT_DELTA_BYTES = Histogram(
+    "pokercds_event_delta_bytes", "Size of the state deltas sent for Reflex events.", "handler", BYTES_BUCKETS
+)
+
+EVENT_QUERIES = Histogram(
+    "pokercds_event_queries", "SQL statements executed by Reflex event handlers.", "handler", COUNT_BUCKETS
+)
+
+HISTOGRAMS = [EVENT_SECONDS, EVENT_DB_SECONDS, EVENT_DELTA_BYTES, EVENT_QUERIES]
+
+
+def render_metrics() -> str:
+    """Return every histogram in the Prometheus text format."""
+    return "\n".join(line for histogram in HISTOGRAMS for line in histogram.render()) + "\n"
+
+
+@dataclass
+class EventRecord:
+    """Costs of one Reflex event, filled in while it runs."""
+    
+    handler: str
+    started: float = field(default_factory=time.perf_counter)
+    db_seconds: float = 0.0
+    delta_bytes: int = 0
+    statements: int = 0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)  # normalized SQL -> executions
+    
+    def finish(self):
+        """Record the event in the histograms."""
+        EVENT_SECONDS.observe(self.handler, time.perf_counter() - self.started)
+        EVENT_DB_SECONDS.observe(self.handler, self.db_seconds)
+        EVENT_DELTA_BYTES.observe(self.handler, self.delta_bytes)
+        EVENT_QUERIES.observe(self.handler, self.statements)
+
+
+current_event: ContextVar[Optional[EventRecord]] = ContextVar("current_event", default=None)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Money type stored as integer cents.
+
+Money is an int subclass, so arithmetic is plain integer math, sums are
+exact, and Reflex serializes it as a bare JSON number (cents).
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
+
+_CENT = Decimal('0.01')
+
+
+class Money(int):
+    """Amount of money in integer cents (R$ 1.50 == Money(150))."""
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> "Money":
+        """Convert a Decimal amount in reais (e.g. a Numeric(12,2) column) to Money."""
+        return cls(int(value.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2)))
+    
+    @classmethod
+    def parse(cls, text: str) -> "Money":
+        """Parse user input such as '140', '140.5', '140,50' or 'R$ 1.234,56'."""
+        value = str(text).replace("R$", "").replace(" ", "").strip()
+        if "," in value:
+            value = value.replace(".", "").replace(",", ".")
+        
+        negative = value.startswith("-")
+        if negative:
+            value = value[1:]
+        reais, _, cents = value.partition(".")
+        if not reais and not cents:
+            raise ValueError("Valor monetário inválido")
+        if not (reais or "0").isdigit() or (cents and not cents.isdigit()) or len(cents) > 2:
+            raise ValueError("Valor monetário inválido")
+        
+        amount = int(reais or "0") * 100 + int(cents.ljust(2, "0") or "0")
+        return cls(-amount if negative else amount)
+    
+    @classmethod
+    def coerce(cls, value: Any) -> "Money":
+        """Convert Money, int cents, Decimal reais or text to Money."""
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, bool):
+            raise TypeError("Valor monetário inválido")
+        if isinstance(value, int):
+            return cls(value)
+        if isinstance(value, Decimal):
+            return cls.from_decimal(value)
+        if isinstance(value, str):
+            return cls.parse(value)
+        raise TypeError("Valor monetário inválido")
+    
+    def to_decimal(self) -> Decimal:
+        """Return the amount in reais as a 2-place Decimal."""
+        return Decimal(int(self)).scaleb(-2)
+    
+    def format(self) -> str:
+        """Return the amount for display, e.g. 'R$ 140.00'."""
+        return f"R$ {self}"
+    
+    def __str__(self) -> str:
+        cents = int(self)
+        sign = "-" if cents < 0 else ""
+        reais, cents = divmod(abs(cents), 100)
+        return f"{sign}{reais}.{cents:02d}"
+    
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+    
+    # Arithmetic keeps the Money type (int results would lose it)
+    
+    def __add__(self, other):
+        result = int.__add__(self, other)
+        return result if result is NotImplemented else Money(result)
+    
+    __radd__ = __add__
+    
+    def __sub__(self, other):
+        result = int.__sub__(self, other)
+        return result if result is NotImplemented else Money(result)
+    
+    def __rsub__(self, other):
+        result = int.__rsub__(self, other)
+        return result if result is NotImplemented else Money(result)
+    
+    def __mul__(self, other):
+        result = int.__mul__(self, other)
+        return result if result is NotImplemented else Money(result)
+    
+    __rmul__ = __mul__
+    
+    def __neg__(self):
+        return Money(-int(self))
+    
+    def __abs__(self):
+        return Money(abs(int(self)))
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any):
+        """Let SQLModel/pydantic fields be typed as Money."""
+        from pydantic_core import core_schema
+        return core_schema.no_info_plain_validator_function(
+            cls.coerce,
+            serialization=core_schema.plain_serializer_function_ser_schema(int),
+        )
+
+
+ZERO_MONEY = Money(0)
@@ -3,14 +3,78 @@
 
 """
 Password utilities for secure password handling.
+
+bcrypt is deliberately slow, so the async variants run it on a small
+dedicated thread pool instead of the Reflex event loop. The work factor
+is calibrated on that pool at app startup (calibrate_rounds_async).
 """
 
+import asyncio
+import os
+import time
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# bcrypt releases the GIL, so a few threads give real parallelism
+PASSWORD_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="bcrypt")
+_pending_jobs = 0
+
+# Work factor calibration: pick the highest cost whose verify time stays
+# under the target on this machine (tunable per node via environment).
+TARGET_VERIFY_MS = float(os.environ.get("POKERCDS_BCRYPT_TARGET_MS", "250"))
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+_CALIBRATION_ROUNDS = 6
+
+_rounds: Optional[int] = None
+
+
+def calibrate_rounds(target_ms: float = TARGET_VERIFY_MS) -> int:
+    """Measure bcrypt on this machine and return the cost matching the target latency."""
+    password = b"calibration"
+    salt = bcrypt.gensalt(rounds=_CALIBRATION_ROUNDS)
+    samples = []
+    for _ in range(3):
+        start = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        samples.append(time.perf_counter() - start)
+    base_ms = sorted(samples)[1] * 1000
+    
+    # Each extra round doubles the work
+    rounds = MIN_ROUNDS
+    while rounds < MAX_ROUNDS and base_ms * 2 ** (rounds + 1 - _CALIBRATION_ROUNDS) <= target_ms:
+        rounds += 1
+    return rounds
+
+
+def get_rounds() -> int:
+    """Return the bcrypt cost for new hashes, calibrating on first use (blocking, call it off the event loop)."""
+    global _rounds
+    if _rounds is None:
+        _rounds = calibrate_rounds()
+    return _rounds
+
+
+def hash_rounds(hashed: str) -> int:
+    """Return the cost stored in a bcrypt hash ($2b$12$... -> 12)."""
+    return int(hashed.split("$")[2])
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Return True if a stored hash was made with a lower cost than the current one.
+    Never rehashes before calibration, and never downgrades a hash made by a faster node.
+    """
+    return _rounds is not None and hash_rounds(hashed) < _rounds
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=get_rounds())
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -18,3 +82,37 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash."""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+def password_queue_depth() -> int:
+    """Number of hash/verify jobs queued or running on the password pool."""
+    return _pending_jobs
+
+
+async def _run_in_pool(func, *args):
+    """Run a blocking bcrypt call on the password pool without blocking the event loop."""
+    global _pending_jobs
+    _pending_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, func, *args)
+    finally:
+        _pending_jobs -= 1
+
+
+async def calibrate_rounds_async() -> int:
+    """Calibrate the bcrypt cost on the password pool; registered as an app lifespan task."""
+    global _rounds
+    if _rounds is None:
+        _rounds = await _run_in_pool(calibrate_rounds)
+    return _rounds
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password using bcrypt on the password pool."""
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password against its hash on the password pool."""
+    return await _run_in_pool(verify_password, password, hashed)
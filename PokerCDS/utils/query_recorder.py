@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-event SQL statement counts and N+1 detection.
+
+The engine hooks record every statement a Reflex event runs in its
+EventRecord: how many, how many rows they returned and how often each
+statement shape ran. The shape is the SQL text with bound parameters
+and IN-lists collapsed, so fetching each GameMember's Member one at a
+time shows up as one shape repeated once per player.
+
+After the event, statement counts above QUERY_WARN_COUNT and shapes
+repeated N_PLUS_ONE_REPEATS times or more are logged as warnings.
+assert_max_queries checks the same thresholds in tests.
+"""
+
+import logging
+import os
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from .metrics import EventRecord, current_event
+
+QUERY_WARN_COUNT = int(os.environ.get("POKERCDS_QUERY_WARN_COUNT", "25"))
+N_PLUS_ONE_REPEATS = int(os.environ.get("POKERCDS_N_PLUS_ONE_REPEATS", "5"))
+
+_PARAMETER = re.compile(r"%\(\w+\)s|\$\d+|\?|'(?:[^']|'')*'|\b\d+\b")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+logger = logging.getLogger(__name__)
+
+
+def statement_shape(statement: str) -> str:
+    """Return the statement with parameters, literals and IN-lists reduced to placeholders."""
+    shape = _PARAMETER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAMETER_LIST.sub("(?)", shape)
+
+
+def record_statement(record: EventRecord, statement: str, rows: int):
+    """Count one executed statement and the rows it returned or changed."""
+    record.statements += 1
+    record.rows += max(rows, 0)
+    record.shapes[statement_shape(statement)] += 1
+
+
+def query_problems(
+    record: EventRecord,
+    max_queries: Optional[int] = QUERY_WARN_COUNT,
+    max_repeats: Optional[int] = N_PLUS_ONE_REPEATS,
+) -> List[str]:
+    """Describe the thresholds the event went over (None disables a check)."""
+    problems = []
+    if max_queries is not None and record.statements > max_queries:
+        problems.append(
+            f"{record.handler}: {record.statements} statements ({record.rows} rows), limit {max_queries}"
+        )
+    if max_repeats is not None:
+        for shape, count in record.shapes.most_common():
+            if count < max_repeats:
+                break
+            problems.append(f"{record.handler}: possible N+1, {count}x {shape}")
+    return problems
+
+
+def log_query_problems(record: EventRecord):
+    """Warn about events over the configured thresholds."""
+    for problem in query_problems(record):
+        logger.warning("SQL: %s", problem)
+
+
+@contextmanager
+def record_queries(handler: str = "test") -> Iterator[EventRecord]:
+    """Record the statements run inside the block in a fresh EventRecord."""
+    record = EventRecord(handler)
+    token = current_event.set(record)
+    try:
+        yield record
+    finally:
+        current_event.reset(token)
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int, handler: str = "test", max_repeats: Optional[int] = N_PLUS_ONE_REPEATS
+) -> Iterator[EventRecord]:
+    """
+    Fail if the block runs more than max_queries statements or repeats a shape max_repeats times.
+    
+        with assert_max_queries(3, "game_state.load_game_data"):
+            await state.load_game_data()
+    """
+    with record_queries(handler) as record:
+        yield record
+    problems = query_problems(record, max_queries, max_repeats)
+    if problems:
+        shapes = "\n".join(f"  {count}x {shape}" for shape, count in record.shapes.most_common())
+        raise AssertionError("\n".join(problems) + f"\nStatements:\n{shapes}")
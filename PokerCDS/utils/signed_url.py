@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Short-lived signed links for backend downloads.
+
+Download endpoints are plain HTTP and cannot see the Reflex session, so
+the page signs the path for a logged-in user and the endpoint checks
+the signature and expiry. Set POKERCDS_DOWNLOAD_SECRET when running
+more than one backend process.
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from urllib.parse import urlencode
+
+DOWNLOAD_SECRET = (os.environ.get("POKERCDS_DOWNLOAD_SECRET") or secrets.token_hex(32)).encode()
+DOWNLOAD_TTL_SECONDS = 300
+
+
+def _signature(path: str, expires: int) -> str:
+    """Return the HMAC of a path and its expiry time."""
+    return hmac.new(DOWNLOAD_SECRET, f"{path}:{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def sign_path(path: str, ttl: int = DOWNLOAD_TTL_SECONDS) -> str:
+    """Return the path with expires and signature query parameters."""
+    expires = int(time.time()) + ttl
+    return f"{path}?{urlencode({'expires': expires, 'signature': _signature(path, expires)})}"
+
+
+def verify_path(path: str, expires: str, signature: str) -> bool:
+    """Return True if the signature matches the path and has not expired."""
+    try:
+        expires_at = int(expires)
+    except (TypeError, ValueError):
+        return False
+    if expires_at < time.time():
+        return False
+    return hmac.compare_digest(_signature(path, expires_at), signature or "")
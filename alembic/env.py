@@ -1,5 +1,10 @@
 from PokerCDS.entities.base import Base
 from PokerCDS.entities.member import Member
+from PokerCDS.entities.game import Game
+from PokerCDS.entities.game_member import GameMember
+from PokerCDS.entities.buyin_event import BuyinEvent
+from PokerCDS.entities.member_stats import MemberStats
+from PokerCDS.entities.member_month_result import MemberMonthResult
 
 # add your model's MetaData object here
 # for 'autogenerate' support
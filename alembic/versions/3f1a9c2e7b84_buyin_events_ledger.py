@@ -0,0 +1,73 @@
+"""Buy-in events ledger
+
+Revision ID: 3f1a9c2e7b84
+Revises: d6b727c95d09
+Create Date: 2026-10-17 18:42:10.512093-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2e7b84'
+down_revision: Union[str, Sequence[str], None] = 'd6b727c95d09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('buyin_events',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('member_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=16), nullable=False),
+    sa.Column('credit_buyin', sa.Integer(), nullable=False),
+    sa.Column('cash_buyin', sa.Integer(), nullable=False),
+    sa.Column('final_chips', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('rango', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('pingo', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('received_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('buyin_events', schema=None) as batch_op:
+        batch_op.create_index('ix_buyin_events_game_id_member_id_id', ['game_id', 'member_id', 'id'], unique=False)
+
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_event_id', sa.BigInteger(), server_default='0', nullable=False))
+
+    # Seed the ledger with one correction per existing snapshot row so that
+    # history and snapshot agree from the start.
+    op.execute("""
+        INSERT INTO buyin_events
+            (game_id, member_id, kind, credit_buyin, cash_buyin, final_chips, rango, pingo, received_amount, created_at)
+        SELECT game_id, member_id, 'correction', credit_buyin, cash_buyin,
+               COALESCE(final_chips, 0), COALESCE(rango, 0), COALESCE(pingo, 0), COALESCE(received_amount, 0), now()
+        FROM game_members
+    """)
+    op.execute("""
+        UPDATE game_members gm
+        SET last_event_id = be.id
+        FROM buyin_events be
+        WHERE be.game_id = gm.game_id AND be.member_id = gm.member_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.drop_column('last_event_id')
+
+    with op.batch_alter_table('buyin_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_buyin_events_game_id_member_id_id')
+
+    op.drop_table('buyin_events')
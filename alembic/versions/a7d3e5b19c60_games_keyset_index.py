@@ -0,0 +1,31 @@
+"""Games keyset pagination index
+
+Revision ID: a7d3e5b19c60
+Revises: 3f1a9c2e7b84
+Create Date: 2026-10-17 19:05:44.180327-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5b19c60'
+down_revision: Union[str, Sequence[str], None] = '3f1a9c2e7b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.create_index('ix_games_created_at_id', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_index('ix_games_created_at_id')
@@ -0,0 +1,51 @@
+"""Game closing and member lifetime statistics rollup
+
+Revision ID: b4e6f19a2c57
+Revises: f5a0c7d2e913
+Create Date: 2026-10-17 21:07:52.330871-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e6f19a2c57'
+down_revision: Union[str, Sequence[str], None] = 'f5a0c7d2e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True))
+
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.create_index('ix_game_members_member_id', ['member_id'], unique=False)
+
+    op.create_table('member_stats',
+    sa.Column('member_id', sa.Integer(), nullable=False),
+    sa.Column('games_played', sa.Integer(), nullable=False),
+    sa.Column('total_buyins', sa.Integer(), nullable=False),
+    sa.Column('net_result', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('best_night', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('worst_night', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('member_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('member_stats')
+
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_members_member_id')
+
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_column('closed_at')
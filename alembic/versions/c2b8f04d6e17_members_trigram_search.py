@@ -0,0 +1,42 @@
+"""Members trigram search index
+
+Revision ID: c2b8f04d6e17
+Revises: a7d3e5b19c60
+Create Date: 2026-10-17 19:31:02.447815-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2b8f04d6e17'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e5b19c60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match MEMBER_SEARCH_TEXT in PokerCDS/entities/member.py
+MEMBER_SEARCH_TEXT = "(name || ' ' || coalesce(nickname, '') || ' ' || cpf || ' ' || coalesce(phone, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.batch_alter_table('members', schema=None) as batch_op:
+        batch_op.create_index('ix_members_name_id', ['name', 'id'], unique=False)
+        batch_op.create_index(
+            'ix_members_search_trgm',
+            [sa.text(f"{MEMBER_SEARCH_TEXT} gin_trgm_ops")],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('members', schema=None) as batch_op:
+        batch_op.drop_index('ix_members_search_trgm')
+        batch_op.drop_index('ix_members_name_id')
@@ -0,0 +1,67 @@
+"""Leaderboard month buckets and covering index
+
+Revision ID: d8a2c5e71f46
+Revises: b4e6f19a2c57
+Create Date: 2026-10-17 21:34:09.871254-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a2c5e71f46'
+down_revision: Union[str, Sequence[str], None] = 'b4e6f19a2c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Night result must match night_result() in PokerCDS/repositories/member_stats_repository.py
+BACKFILL = """
+INSERT INTO member_month_results (month, member_id, games_played, total_buyins, net_result)
+SELECT
+    date_trunc('month', g.created_at)::date,
+    gm.member_id,
+    count(*),
+    sum(coalesce(gm.credit_buyin, 0) + coalesce(gm.cash_buyin, 0)),
+    sum(
+        coalesce(gm.final_chips, 0) + coalesce(gm.rango, 0) + coalesce(gm.pingo, 0)
+        - (coalesce(gm.credit_buyin, 0) + coalesce(gm.cash_buyin, 0)) * 50.00
+    )
+FROM game_members gm
+JOIN games g ON g.id = gm.game_id
+WHERE g.closed_at IS NOT NULL
+GROUP BY 1, 2
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_game_members_game_id_results',
+            ['game_id'],
+            unique=False,
+            postgresql_include=['member_id', 'credit_buyin', 'cash_buyin', 'final_chips', 'rango', 'pingo'],
+        )
+
+    op.create_table('member_month_results',
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('member_id', sa.Integer(), nullable=False),
+    sa.Column('games_played', sa.Integer(), nullable=False),
+    sa.Column('total_buyins', sa.Integer(), nullable=False),
+    sa.Column('net_result', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('month', 'member_id')
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('member_month_results')
+
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_members_game_id_results')
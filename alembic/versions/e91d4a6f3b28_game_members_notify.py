@@ -0,0 +1,52 @@
+"""Notify game_members changes per game
+
+Revision ID: e91d4a6f3b28
+Revises: c2b8f04d6e17
+Create Date: 2026-10-17 20:12:40.118204-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91d4a6f3b28'
+down_revision: Union[str, Sequence[str], None] = 'c2b8f04d6e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Channel prefix must match CHANNEL_PREFIX in PokerCDS/services/game_changes.py
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_game_members_change() RETURNS trigger AS $$
+DECLARE
+    changed game_members%ROWTYPE;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+    PERFORM pg_notify('game_members_' || changed.game_id, changed.member_id::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(NOTIFY_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER game_members_notify "
+        "AFTER INSERT OR UPDATE OR DELETE ON game_members "
+        "FOR EACH ROW EXECUTE FUNCTION notify_game_members_change()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS game_members_notify ON game_members")
+    op.execute("DROP FUNCTION IF EXISTS notify_game_members_change()")
@@ -0,0 +1,31 @@
+"""Version column for optimistic concurrency on game_members
+
+Revision ID: f5a0c7d2e913
+Revises: e91d4a6f3b28
+Create Date: 2026-10-17 20:41:15.602397-03:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a0c7d2e913'
+down_revision: Union[str, Sequence[str], None] = 'e91d4a6f3b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('game_members', schema=None) as batch_op:
+        batch_op.drop_column('version')